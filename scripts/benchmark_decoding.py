@@ -0,0 +1,86 @@
+"""
+Compare generic and schema-directed decoding of MTGIO card pages.
+
+Process:
+1. Build a ``/v1/cards`` page body of ``--cards`` cards from the recorded page in ``tests/assets``.
+2. Decode and convert it to ``MTGIOCard`` models ``--rounds`` times, once with ``json.loads`` into generic dicts
+   and once with the schema-directed decoder of ``mtgapi.domain.payloads``.
+3. Log the median time per page of decoding alone and of decoding plus conversion.
+
+Usage: ``python scripts/benchmark_decoding.py --cards 100 --rounds 200``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mtgapi.domain.card import MTGIOCard
+from mtgapi.domain.payloads import decode_cards_response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+logger = logging.getLogger("benchmark_decoding")
+
+RECORDED_PAGE_PATH = Path(__file__).parent.parent / "tests" / "assets" / "mtgio_cards_page.json"
+
+
+def _build_page(cards: int) -> bytes:
+    recorded_cards = json.loads(RECORDED_PAGE_PATH.read_bytes())["cards"]
+    page_cards = [
+        {**recorded_cards[index % len(recorded_cards)], "id": f"benchmark-card-{index}"} for index in range(cards)
+    ]
+    return json.dumps({"cards": page_cards}).encode()
+
+
+def _median_time(work: Callable[[], Any], rounds: int) -> float:
+    work()
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        work()
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings)
+
+
+def benchmark(cards: int, rounds: int) -> None:
+    page = _build_page(cards)
+    decoders: dict[str, Callable[[bytes], list[Any]]] = {
+        "generic": lambda content: json.loads(content).get("cards", []),
+        "schema-directed": decode_cards_response,
+    }
+    for decoder_name, decode in decoders.items():
+        decoding_time = _median_time(lambda decode=decode: decode(page), rounds)  # type: ignore[misc]
+        conversion_time = _median_time(
+            lambda decode=decode: [MTGIOCard.from_api_payload(card) for card in decode(page)],  # type: ignore[misc]
+            rounds,
+        )
+        logger.info(
+            "%-16s decode %.2f ms, decode + convert %.2f ms per page of %d cards (%d bytes)",
+            decoder_name,
+            decoding_time * 1000,
+            conversion_time * 1000,
+            cards,
+            len(page),
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=100, help="Number of cards per decoded page.")
+    parser.add_argument("--rounds", type=int, default=200, help="Number of timed decodings per decoder.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    benchmark(arguments.cards, arguments.rounds)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""
+Compare HTTP/1.1 and HTTP/2 upstream traffic of the MTGIO service.
+
+Process:
+1. Start a local TLS stub of the MTGIO cards endpoint (Hypercorn, HTTP/1.1 + HTTP/2 via ALPN)
+   with an artificial upstream latency. The stub certificate is signed by a throwaway trustme CA.
+2. For each protocol, build an MTGIOAPIService pointed at the stub and fetch ``--cards`` cards in parallel,
+   ``--rounds`` times.
+3. Log the median / worst wall time of a round and the number of connections the stub accepted.
+
+Usage: ``python scripts/benchmark_http2.py --cards 100 --rounds 5``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import trustme
+from hypercorn.asyncio import serve
+from hypercorn.config import Config as HypercornConfig
+
+from mtgapi.config.settings.base import ServiceConfigurationPrefixes
+from mtgapi.config.wiring import wire_services
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+
+logger = logging.getLogger("benchmark_http2")
+
+STUB_HOST = "localhost"
+STUB_LATENCY = 0.02
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+
+class StubMTGIOCardsApp:
+    """Minimal ASGI app answering ``/v1/cards/{id}`` with a valid MTGIO card payload."""
+
+    def __init__(self) -> None:
+        self.connections: set[tuple[str, int]] = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        if scope["type"] != "http":
+            return
+        host, port = scope["client"]
+        self.connections.add((host, port))
+        card_id = scope["path"].rsplit("/", 1)[-1]
+        card_payload = {
+            "name": f"Stub Card {card_id}",
+            "manaCost": "{1}{R}",
+            "types": ["Instant"],
+            "printings": ["LEA"],
+            "id": card_id,
+            "multiverseid": card_id,
+            "imageUrl": "",
+        }
+        body = json.dumps({"card": card_payload}).encode()
+        await asyncio.sleep(STUB_LATENCY)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return int(probe.getsockname()[1])
+
+
+async def _run_protocol(base_url: str, use_http2: bool, cards: int, rounds: int) -> list[float]:
+    os.environ[f"{ServiceConfigurationPrefixes.MTGIO}_BASE_URL"] = base_url
+    os.environ[f"{ServiceConfigurationPrefixes.MTGIO}_HTTP2"] = str(use_http2).lower()
+    wire_services()
+    service = MTGIOAPIService()
+    round_times: list[float] = []
+    try:
+        for _ in range(rounds):
+            started_at = time.perf_counter()
+            await asyncio.gather(*(service.get_card(card_id) for card_id in range(1, cards + 1)))
+            round_times.append(time.perf_counter() - started_at)
+    finally:
+        await service.disconnect()
+    return round_times
+
+
+async def benchmark(cards: int, rounds: int) -> None:
+    certificate_authority = trustme.CA()
+    server_certificate = certificate_authority.issue_cert(STUB_HOST)
+    with tempfile.TemporaryDirectory() as certificates_directory:
+        ca_path = Path(certificates_directory) / "ca.pem"
+        cert_path = Path(certificates_directory) / "server.pem"
+        key_path = Path(certificates_directory) / "server.key"
+        certificate_authority.cert_pem.write_to_path(str(ca_path))
+        server_certificate.cert_chain_pems[0].write_to_path(str(cert_path))
+        server_certificate.private_key_pem.write_to_path(str(key_path))
+        os.environ["SSL_CERT_FILE"] = str(ca_path)
+
+        port = _free_port()
+        server_config = HypercornConfig()
+        server_config.bind = [f"127.0.0.1:{port}"]
+        server_config.certfile = str(cert_path)
+        server_config.keyfile = str(key_path)
+        server_config.alpn_protocols = ["h2", "http/1.1"]
+        server_config.accesslog = None
+
+        for use_http2 in (False, True):
+            stub_app = StubMTGIOCardsApp()
+            shutdown = asyncio.Event()
+            server = asyncio.create_task(serve(stub_app, server_config, shutdown_trigger=shutdown.wait))  # type: ignore[arg-type]
+            await asyncio.sleep(0.5)
+            try:
+                round_times = await _run_protocol(f"https://{STUB_HOST}:{port}", use_http2, cards, rounds)
+            finally:
+                shutdown.set()
+                await server
+            logger.info(
+                "%s: %d cards x %d rounds, median %.3fs, worst %.3fs, %d connections",
+                "HTTP/2" if use_http2 else "HTTP/1.1",
+                cards,
+                rounds,
+                statistics.median(round_times),
+                max(round_times),
+                len(stub_app.connections),
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=100, help="Number of cards fetched in parallel per round.")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of measured rounds per protocol.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(benchmark(arguments.cards, arguments.rounds))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""
+Compare per-query model conversion with the startup-time model registry of the database service.
+
+Process:
+1. Register the cached models once, the way ``register_cached_models`` does at startup (without creating tables).
+2. Build the ``SELECT`` of a cached card lookup ``--rounds`` times, once converting ``MTGCard`` to a SQLAlchemy
+   model for every query (the previous behaviour of ``get_objects``) and once resolving it from the registry.
+3. Log the median time per query of both variants.
+
+No database is needed: only the model resolution and statement construction done on the request path are timed.
+
+Usage: ``python scripts/benchmark_model_registry.py --rounds 2000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy
+
+from mtgapi.domain.card import MTGCard
+from mtgapi.domain.conversions import convert_pydantic_model_to_sqlalchemy_base
+from mtgapi.services.cache import CACHED_MODELS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+logger = logging.getLogger("benchmark_model_registry")
+
+LOOKUP_FILTERS = {"name": "Lightning Bolt", "set_name": "2ED"}
+
+
+def _median_time(work: Callable[[], Any], rounds: int) -> float:
+    work()
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        work()
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings)
+
+
+def benchmark(rounds: int) -> None:
+    registry = {model.__name__: convert_pydantic_model_to_sqlalchemy_base(model) for model in CACHED_MODELS}
+    resolvers: dict[str, Callable[[], Any]] = {
+        "per-query": lambda: convert_pydantic_model_to_sqlalchemy_base(MTGCard),
+        "registry": lambda: registry[MTGCard.__name__],
+    }
+    for resolver_name, resolve in resolvers.items():
+        lookup_time = _median_time(
+            lambda resolve=resolve: sqlalchemy.select(resolve()).filter_by(**LOOKUP_FILTERS),  # type: ignore[misc]
+            rounds,
+        )
+        logger.info("%-10s %.1f us per cached card lookup", resolver_name, lookup_time * 1_000_000)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=2000, help="Number of timed lookups per variant.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    benchmark(arguments.rounds)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+"""
+Import a local dump of MTGIO card payloads into the Postgres card cache.
+
+Process:
+1. Wire the services; database settings are read from the usual ``MTGAPI_*`` variables.
+2. Stream-parse the dump (a JSON array, a ``{"cards": [...]}`` page or JSON Lines, optionally gzipped).
+3. Convert and write the cards in ``--batch-size`` batches, keeping cards that are already cached.
+
+Usage: ``python scripts/import_card_dump.py cards.json.gz --batch-size 1000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from mtgapi.config.wiring import wire_services
+from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.bulk_import import BulkImportStatistics, import_card_dump
+from mtgapi.services.database import PostgresDatabaseService
+
+logger = logging.getLogger("import_card_dump")
+
+
+def log_batch(statistics: BulkImportStatistics) -> None:
+    logger.info(
+        "Read %d cards, inserted %d (%d skipped), %.1f cards/s",
+        statistics.records,
+        statistics.inserted_cards,
+        statistics.skipped_records,
+        statistics.records_per_second,
+    )
+
+
+async def run_import(dump_path: Path, batch_size: int) -> None:
+    services_container = wire_services()
+    database: PostgresDatabaseService = getattr(services_container, AuxiliaryServiceNames.DATABASE)()
+    try:
+        await import_card_dump(dump_path, database, batch_size=batch_size, on_batch=log_batch)
+    finally:
+        await database.disconnect()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dump", type=Path, help="Path of the card dump.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Number of cards written per batch.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(message)s")
+    for reporting_logger in (logger, logging.getLogger("mtgapi.services.bulk_import")):
+        reporting_logger.setLevel(logging.INFO)
+    asyncio.run(run_import(arguments.dump, arguments.batch_size))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+"""
+Mirror the MTGIO card catalog into the Postgres card cache.
+
+Process:
+1. Wire the services; MTGIO and database settings are read from the usual ``MTGAPI_*`` variables.
+2. Walk ``/v1/cards`` page by page with ``--concurrency`` pages in flight, writing every page together with
+   the run checkpoint.
+3. Log progress and throughput every ``--report-interval`` seconds.
+
+An interrupted run resumes after the last written page; ``--restart`` mirrors the catalog from the first page.
+
+Usage: ``python scripts/mirror_catalog.py --concurrency 4``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from mtgapi.config.wiring import wire_services
+from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.catalog import CatalogMirror
+from mtgapi.services.database import PostgresDatabaseService
+
+logger = logging.getLogger("mirror_catalog")
+
+
+async def mirror(concurrency: int, queue_size: int, report_interval: float, restart: bool) -> None:
+    services_container = wire_services()
+    mtgio_service: MTGIOAPIService = getattr(services_container, AuxiliaryServiceNames.MTGIO)()
+    database: PostgresDatabaseService = getattr(services_container, AuxiliaryServiceNames.DATABASE)()
+    catalog_mirror = CatalogMirror(
+        mtgio_service=mtgio_service,
+        database=database,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        report_interval=report_interval,
+    )
+    try:
+        await catalog_mirror.run(restart=restart)
+    finally:
+        await mtgio_service.disconnect()
+        await database.disconnect()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of catalog pages fetched at the same time.")
+    parser.add_argument("--queue-size", type=int, default=8, help="Number of pages buffered between pipeline stages.")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="Seconds between progress reports.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an interrupted run.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(message)s")
+    for reporting_logger in (logger, logging.getLogger("mtgapi.services.catalog")):
+        reporting_logger.setLevel(logging.INFO)
+    asyncio.run(mirror(arguments.concurrency, arguments.queue_size, arguments.report_interval, arguments.restart))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -20,3 +20,30 @@ class EmptyPydanticModelError(InvalidPydanticModelError):
 
     def __init__(self, msg=__message__, *args: Any, **kwargs: Any) -> "EmptyPydanticModelError":  # type: ignore
         super().__init__(msg, *args, **kwargs)
+
+
+class UpstreamUnavailableError(Exception):
+    """Exception raised when a request is not sent upstream to protect the upstream service."""
+
+    def __init__(self, msg: str, retry_after: float, *args: Any) -> None:
+        super().__init__(msg, *args)
+        self.retry_after = retry_after
+
+
+class RateLimitExceededError(UpstreamUnavailableError):
+    """Exception raised when an upstream request cannot be scheduled within the rate limit."""
+
+    def __init__(self, retry_after: float, *args: Any) -> None:
+        super().__init__(f"Upstream rate limit exceeded, retry after {retry_after:.1f}s", retry_after, *args)
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Exception raised when the circuit breaker of an upstream is open."""
+
+    def __init__(self, upstream: str, retry_after: float, *args: Any) -> None:
+        super().__init__(f"Upstream {upstream} is unavailable, retry after {retry_after:.1f}s", retry_after, *args)
+        self.upstream = upstream
+
+
+class CatalogMirrorError(Exception):
+    """Exception raised when a page of the mirrored catalog cannot be written."""
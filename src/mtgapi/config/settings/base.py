@@ -28,6 +28,32 @@ class NullConfiguration(ServiceAbstractConfigurationBase):
         return cls()
 
 
+@environ.config()
+class HealthScoringConfigurationBase(ServiceAbstractConfigurationBase):
+    """Configuration of services ranking interchangeable upstreams by their health."""
+
+    consecutive_failures_to_eject: int = environ.var(
+        default=3,
+        help="Consecutive failures after which an upstream is ejected, i.e. only used after the healthy ones.",
+        converter=int,
+    )
+    error_rate_to_eject: float = environ.var(
+        default=0.5,
+        help="Smoothed error rate above which an upstream is ejected.",
+        converter=float,
+    )
+    ejection_duration: float = environ.var(
+        default=30.0,
+        help="Time in seconds an ejected upstream stays ejected.",
+        converter=float,
+    )
+    smoothing_factor: float = environ.var(
+        default=0.2,
+        help="Weight of the latest outcome in the smoothed latency and error rate of an upstream.",
+        converter=float,
+    )
+
+
 @environ.config()
 class AsyncHTTPServiceConfigurationBase(ServiceAbstractConfigurationBase):
     """Configuration for asynchronous API services."""
@@ -54,6 +80,16 @@ class AsyncHTTPServiceConfigurationBase(ServiceAbstractConfigurationBase):
         help="Maximum wait time between retries in seconds.",
         converter=int,
     )
+    retry_budget_ratio: float = environ.var(
+        default=0.2,
+        help="Process-wide cap of retries as a ratio of first attempts.",
+        converter=float,
+    )
+    retry_budget_reserve: float = environ.var(
+        default=10.0,
+        help="Retries the process-wide retry budget allows regardless of traffic.",
+        converter=float,
+    )
     reraise_exceptions: bool = environ.var(
         default=True,
         help="Whether to reraise exceptions after retries.",
@@ -64,11 +100,74 @@ class AsyncHTTPServiceConfigurationBase(ServiceAbstractConfigurationBase):
         help="Rate limit for API requests per second. 0 means no rate limit.",
         converter=int,
     )
+    rate_limit_burst: int = environ.var(
+        default=0,
+        help="Number of requests that can be sent in a burst above the rate limit. 0 means equal to the rate limit.",
+        converter=int,
+    )
+    rate_limit_max_wait: float = environ.var(
+        default=10.0,
+        help="Maximum time in seconds a request may be queued by the rate limiter before it is rejected.",
+        converter=float,
+    )
+    rate_limit_slowdown_threshold: int = environ.var(
+        default=50,
+        help="Remaining upstream quota below which the rate limiter proportionally slows down. 0 disables it.",
+        converter=int,
+    )
+    circuit_breaker_failure_threshold: int = environ.var(
+        default=5,
+        help="Consecutive upstream failures after which the circuit breaker opens. 0 disables the breaker.",
+        converter=int,
+    )
+    circuit_breaker_recovery_timeout: float = environ.var(
+        default=30.0,
+        help="Time in seconds the circuit breaker stays open before letting a probe request through.",
+        converter=float,
+    )
+    hedging: bool = environ.bool_var(
+        default=False,
+        help="Send a second, identical GET request when the first one is slower than the hedging percentile.",
+    )
+    hedge_percentile: float = environ.var(
+        default=95.0,
+        help="Percentile of recent GET latencies after which a hedged request is sent.",
+        converter=float,
+    )
+    hedge_budget: float = environ.var(
+        default=0.05,
+        help="Maximum share of GET requests that may be hedged.",
+        converter=float,
+    )
+    hedge_initial_delay: float = environ.var(
+        default=1.0,
+        help="Hedging delay in seconds used until enough latencies are observed.",
+        converter=float,
+    )
     follow_redirects: bool = environ.var(
         default=True,
         help="Whether to follow redirects in API requests.",
         converter=bool,
     )
+    http2: bool = environ.bool_var(
+        default=False,
+        help="Negotiate multiplexed HTTP/2 connections with upstreams (and proxies) that support it.",
+    )
+    max_connections: int = environ.var(
+        default=100,
+        help="Maximum number of concurrent connections kept by the pooled HTTP client.",
+        converter=int,
+    )
+    max_keepalive_connections: int = environ.var(
+        default=20,
+        help="Maximum number of idle keep-alive connections kept by the pooled HTTP client.",
+        converter=int,
+    )
+    keepalive_expiry: float = environ.var(
+        default=5.0,
+        help="Time in seconds after which an idle keep-alive connection is closed.",
+        converter=float,
+    )
 
 
 APP_CONFIGURATION_PREFIX = "MTGAPI"
@@ -78,3 +177,8 @@ class ServiceConfigurationPrefixes(StrEnum):
     API = f"{APP_CONFIGURATION_PREFIX}_API_"
     DATABASE = f"{APP_CONFIGURATION_PREFIX}_DATABASE_"
     MTGIO = f"{APP_CONFIGURATION_PREFIX}_MTGIO_"
+    PROXY = f"{APP_CONFIGURATION_PREFIX}_PROXY_"
+    CATALOG_SYNC = f"{APP_CONFIGURATION_PREFIX}_CATALOG_SYNC_"
+    IMAGE_CACHE = f"{APP_CONFIGURATION_PREFIX}_IMAGE_CACHE_"
+    CARD_PROVIDERS = f"{APP_CONFIGURATION_PREFIX}_CARD_PROVIDERS_"
+    CACHE_WRITES = f"{APP_CONFIGURATION_PREFIX}_CACHE_WRITES_"
@@ -5,17 +5,30 @@ from dependency_injector.containers import DynamicContainer
 from dependency_injector.providers import Singleton
 
 from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.cache import CacheWriteBehindService
+from mtgapi.services.catalog import CatalogSyncService
 from mtgapi.services.database import PostgresDatabaseService
-from mtgapi.services.proxy import NullProxyService
+from mtgapi.services.images import ImageCacheService
+from mtgapi.services.providers import CardProviderChainService
+from mtgapi.services.proxy import RotatingProxyPoolService
 
 MODULES_TO_WIRE = [
     "mtgapi.services.http",
     "mtgapi.services.cache",
+    "mtgapi.services.catalog",
+    "mtgapi.services.providers",
+    "mtgapi.entrypoint",
 ]
 
 SERVICES_MAP = {
-    AuxiliaryServiceNames.PROXY: NullProxyService,
+    AuxiliaryServiceNames.PROXY: RotatingProxyPoolService,
     AuxiliaryServiceNames.DATABASE: PostgresDatabaseService,
+    AuxiliaryServiceNames.MTGIO: MTGIOAPIService,
+    AuxiliaryServiceNames.CATALOG_SYNC: CatalogSyncService,
+    AuxiliaryServiceNames.IMAGE_CACHE: ImageCacheService,
+    AuxiliaryServiceNames.CARD_PROVIDERS: CardProviderChainService,
+    AuxiliaryServiceNames.CACHE_WRITES: CacheWriteBehindService,
 }
 
 logger = logging.getLogger(__name__)
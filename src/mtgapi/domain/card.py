@@ -1,11 +1,15 @@
 import logging
 import re
+import time
+from collections.abc import Mapping
 from enum import StrEnum
-from typing import ClassVar, TypedDict
+from typing import Annotated, Any, ClassVar, TypedDict
 
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import declarative_base
 
+from mtgapi.domain.conversions import Indexed
+
 PostgresEntriesBase = declarative_base()
 
 
@@ -398,13 +402,18 @@ class MTGIOCard(BaseModel):
         description="Multiverse ID of the card, if available",
         examples=["123456"],
     )
+    set_code: str = Field(
+        default="",
+        description="Code of the set this printing of the card belongs to, if available",
+        examples=["LEA"],
+    )
     image_url: str = Field(
         description="URL to the card's image in the MTGIO database",
         examples=["http://example.com/image.jpg"],
     )
 
     @classmethod
-    def from_api_payload(cls, payload: dict) -> "MTGIOCard":
+    def from_api_payload(cls, payload: Mapping[str, Any]) -> "MTGIOCard":
         """
         Create an MTGIOCard instance from a payload dictionary.
         The payload is expected to have keys matching the MTGIOCard fields.
@@ -440,6 +449,7 @@ class MTGIOCard(BaseModel):
             printings=payload.get("printings", []),
             id=payload["id"],
             multiverse_id=str(payload.get("multiverseid", "")),
+            set_code=payload.get("set", "").upper(),
             image_url=payload.get("imageUrl", ""),
         )
 
@@ -507,8 +517,8 @@ class MTGCard(BaseModel):
     """Represents a Magic: The Gathering card."""
 
     id: str = Field(..., description="Unique identifier for the card")
-    multiverse_id: str = Field(..., description="Multiverse ID of the card, if available")
-    name: str = Field(..., description="Name of the card")
+    multiverse_id: Annotated[str, Indexed()] = Field(..., description="Multiverse ID of the card, if available")
+    name: Annotated[str, Indexed("name_set_name")] = Field(..., description="Name of the card")
     aliases: list[MTGCardAlias] = Field(default_factory=list, description="List of foreign names for the card")
     rulings: list[MTGCardRuling] = Field(default_factory=list, description="List of rulings for the card")
     mana_value: ManaValue = Field(..., description="Mana value of the card")
@@ -520,7 +530,9 @@ class MTGCard(BaseModel):
     power: str | None = Field(None, description="Power of the creature card")
     toughness: str | None = Field(None, description="Toughness of the creature card")
     rarity: str | None = Field(None, description="Rarity of the card")
-    set_name: str | None = Field(None, description="Set name where the card belongs")
+    set_name: Annotated[str | None, Indexed("name_set_name")] = Field(
+        None, description="Set name where the card belongs"
+    )
     image_url: str | None = Field(default="", description="URL to the card's image")
 
     def __str__(self) -> str:
@@ -547,7 +559,7 @@ class MTGCard(BaseModel):
             power=card.power,
             toughness=card.toughness,
             rarity=card.rarity,
-            set_name=card.printings[0] if card.printings else None,
+            set_name=card.set_code or (card.printings[0] if card.printings else None),
             image_url=card.image_url,
         )
 
@@ -580,3 +592,38 @@ class MTGCard(BaseModel):
         if not isinstance(other, MTGCard):
             return NotImplemented
         return self.id == other.id
+
+
+class CardValidators(BaseModel):
+    """Upstream HTTP validators and refresh time of a cached card, used for conditional revalidation."""
+
+    id: str = Field(..., description="Identifier of the cached card")
+    etag: str = Field(default="", description="Value of the ETag header of the last upstream response")
+    last_modified: str = Field(
+        default="", description="Value of the Last-Modified header of the last upstream response"
+    )
+    refreshed_at: float = Field(default=0.0, description="UNIX timestamp of the last upstream fetch or revalidation")
+
+    @classmethod
+    def from_headers(cls, card_id: str, headers: Mapping[str, str]) -> "CardValidators":
+        return cls(
+            id=card_id,
+            etag=headers.get("etag", ""),
+            last_modified=headers.get("last-modified", ""),
+            refreshed_at=time.time(),
+        )
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether the card was refreshed less than max_age seconds ago. A max_age of 0 never expires."""
+        return max_age <= 0 or time.time() - self.refreshed_at < max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def extend_freshness(self) -> "CardValidators":
+        return self.model_copy(update={"refreshed_at": time.time()})
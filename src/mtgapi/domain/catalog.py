@@ -0,0 +1,67 @@
+import time
+
+from pydantic import BaseModel, Field
+
+
+class CatalogCheckpoint(BaseModel):
+    """Progress of a catalog mirror run, stored with every mirrored page so an interrupted run can resume."""
+
+    id: str = Field(..., description="Name of the mirrored catalog")
+    last_page: int = Field(default=0, description="Number of the last page written to the database")
+    total_pages: int = Field(default=0, description="Number of catalog pages reported by the upstream, 0 if unknown")
+    cards: int = Field(default=0, description="Number of cards written by the current run")
+    completed: bool = Field(default=False, description="Whether the run reached the end of the catalog")
+    updated_at: float = Field(default=0.0, description="UNIX timestamp of the last written page")
+
+
+class MTGSet(BaseModel):
+    """A Magic: The Gathering set, i.e. a printing cards can be requested for."""
+
+    id: str = Field(..., description="Set code used as the printing of a card", examples=["10E"])
+    name: str = Field(..., description="Name of the set", examples=["Tenth Edition"])
+    type: str = Field(default="", description="Type of the set (e.g. core, expansion, promo)", examples=["core"])
+    release_date: str = Field(default="", description="Release date of the set in ISO format", examples=["2007-07-13"])
+    block: str = Field(default="", description="Block the set belongs to, if any", examples=["Core Set"])
+    online_only: bool = Field(default=False, description="Whether the set was only released online")
+    refreshed_at: float = Field(default=0.0, description="UNIX timestamp of the last upstream fetch of the set list")
+
+    @classmethod
+    def from_api_payload(cls, payload: dict, refreshed_at: float = 0.0) -> "MTGSet":
+        """
+        Create an MTGSet instance from an entry of the MTGIO set list.
+        """
+        return cls(
+            id=payload["code"].upper(),
+            name=payload.get("name", ""),
+            type=payload.get("type", ""),
+            release_date=payload.get("releaseDate", ""),
+            block=payload.get("block", ""),
+            online_only=bool(payload.get("onlineOnly", False)),
+            refreshed_at=refreshed_at,
+        )
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether the set was refreshed less than max_age seconds ago. A max_age of 0 never expires."""
+        return max_age <= 0 or time.time() - self.refreshed_at < max_age
+
+
+class CatalogSyncWatermark(BaseModel):
+    """Sets whose cards were written by the incremental catalog sync, used to find new sets on the next run."""
+
+    id: str = Field(..., description="Name of the synced catalog")
+    synced_sets: list[str] = Field(default_factory=list, description="Codes of the sets synced so far")
+    synced_at: float = Field(default=0.0, description="UNIX timestamp of the last finished sync run")
+
+
+class CatalogSyncRun(BaseModel):
+    """Outcome of a single incremental catalog sync run."""
+
+    id: str = Field(..., description="Name of the synced catalog and start time of the run")
+    started_at: float = Field(..., description="UNIX timestamp of the start of the run")
+    duration: float = Field(default=0.0, description="Duration of the run in seconds")
+    sets_checked: int = Field(default=0, description="Number of sets listed by the upstream")
+    sets_synced: int = Field(default=0, description="Number of new or recently released sets whose cards were written")
+    sets_failed: int = Field(default=0, description="Number of sets whose cards could not be fetched or written")
+    cards_written: int = Field(default=0, description="Number of cards upserted into the cache")
+    cards_skipped: int = Field(default=0, description="Number of malformed cards that were skipped")
+    upstream_calls: int = Field(default=0, description="Number of requests sent to the upstream")
@@ -1,3 +1,4 @@
+import dataclasses
 import enum
 import logging
 from types import NoneType
@@ -27,6 +28,43 @@ class TypeAnnotationToSQLFieldType(enum.Enum):
     dict = sqlalchemy.JSON
 
 
+@dataclasses.dataclass(frozen=True)
+class Indexed:
+    """
+    Index hint of a model field, read by ``convert_pydantic_model_to_sqlalchemy_base``.
+
+    Used as ``Annotated`` metadata, e.g. ``name: Annotated[str, Indexed("name_set_name")]``.
+    Fields sharing an index name form a composite index over the fields in declaration order;
+    an unnamed hint indexes the field alone.
+    """
+
+    name: str | None = None
+    unique: bool = False
+
+
+def _index_hints(model: type[BaseModel]) -> list[sqlalchemy.Index]:
+    """
+    Builds the indexes hinted by the ``Indexed`` metadata of the model fields.
+
+    :raises ValueError: If fields of the same index disagree on its uniqueness.
+    """
+    table_name = model.__name__.lower()
+    indexed_columns: dict[str, list[str]] = {}
+    unique_indexes: dict[str, bool] = {}
+    for field_name, field in model.model_fields.items():
+        for hint in field.metadata:
+            if not isinstance(hint, Indexed):
+                continue
+            index_name = f"ix_{table_name}_{hint.name or field_name}"
+            if unique_indexes.setdefault(index_name, hint.unique) != hint.unique:
+                raise ValueError(f"Fields of index {index_name} disagree on whether it is unique.")
+            indexed_columns.setdefault(index_name, []).append(field_name)
+    return [
+        sqlalchemy.Index(index_name, *columns, unique=unique_indexes[index_name])
+        for index_name, columns in indexed_columns.items()
+    ]
+
+
 # Internal mapping drives conversion logic (mirrors enum values)
 PRIMITIVE_TYPE_MAP: dict[str, Any] = {
     name: member.value for name, member in TypeAnnotationToSQLFieldType.__members__.items()
@@ -36,10 +74,12 @@ PRIMITIVE_TYPE_MAP: dict[str, Any] = {
 def convert_pydantic_model_to_sqlalchemy_base(model: type[BaseModel]) -> type[DeclarativeBase]:  # noqa: PLR0912
     """
     Converts a Pydantic model to a SQLAlchemy base model.
+    Indexes hinted with ``Indexed`` field metadata are declared on the table.
 
     :param model: Pydantic model to convert.
     :return: SQLAlchemy base model class.
     :raises EmptyPydanticModel: If Pydantic model is empty.
+    :raises ValueError: If the index hints of the model are inconsistent.
     """
     base = declarative_base(class_registry={})
 
@@ -109,9 +149,11 @@ def convert_pydantic_model_to_sqlalchemy_base(model: type[BaseModel]) -> type[De
     for column_name, column_type in column_definitions.items():
         setattr(_NewModelColumnsMeta, column_name, column_type)
 
+    indexes = _index_hints(model)
+
     class _NewModel(_NewModelColumnsMeta, base):  # type: ignore
         __tablename__ = model.__name__.lower()
-        __table_args__ = {"extend_existing": True}  # noqa: RUF012
+        __table_args__ = (*indexes, {"extend_existing": True})
 
     _NewModel.__name__ = f"{model.__name__}{CONVERTED_PYDANTIC_MODEL_SUFFIX}"
 
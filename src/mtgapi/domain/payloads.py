@@ -0,0 +1,140 @@
+import logging
+import types
+from typing import Annotated, Any, TypedDict
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class MTGIORulingPayload(TypedDict, total=False):
+    """Ruling of a card as sent by MTGIO."""
+
+    date: str
+    text: str
+
+
+class MTGIOForeignNamePayload(TypedDict, total=False):
+    """Foreign name of a card as sent by MTGIO."""
+
+    name: str
+    language: str
+
+
+class MTGIOCardPayload(TypedDict, total=False):
+    """
+    Fields of an MTGIO card payload read by the service.
+    Fields not listed here (legalities, original text, ...) are dropped while decoding. The decoders do not
+    validate the values of the listed fields: the field types describe a well-formed card, and whether a card
+    is one is only checked when it is converted to an MTGIOCard.
+    """
+
+    id: str
+    name: str
+    names: list[str]
+    manaCost: str
+    colors: list[str]
+    colorIdentity: list[str]
+    types: list[str]
+    subtypes: list[str]
+    supertypes: list[str]
+    rarity: str
+    set: str
+    setName: str
+    text: str | None
+    flavor: str | None
+    power: str | None
+    toughness: str | None
+    layout: str
+    rulings: list[MTGIORulingPayload]
+    foreignNames: list[MTGIOForeignNamePayload]
+    printings: list[str]
+    multiverseid: int | str
+    imageUrl: str
+
+
+class MTGIOCardResponse(TypedDict, total=False):
+    """Body of ``/v1/cards/{id}``."""
+
+    card: MTGIOCardPayload
+
+
+class MTGIOCardsResponse(TypedDict, total=False):
+    """Body of a ``/v1/cards`` query or catalog page."""
+
+    cards: list[MTGIOCardPayload]
+
+
+def _lenient(projected_type: Any) -> Any:
+    """Accept values that do not match the projected type as they are."""
+    return Annotated[projected_type | Any, Field(union_mode="left_to_right")]
+
+
+def _lenient_list(projected_type: Any) -> Any:
+    return _lenient(types.GenericAlias(list, (_lenient(projected_type),)))
+
+
+def _projection(payload_type: type, **projected_fields: Any) -> Any:
+    """
+    Schema keeping only the fields of a payload TypedDict, leaving their values unvalidated unless projected too.
+    """
+    fields = {field: projected_fields.get(field, Any) for field in payload_type.__annotations__}
+    return TypedDict(f"_{payload_type.__name__}Fields", fields, total=False)  # type: ignore[operator]
+
+
+# Decoding only projects card payloads onto the fields read by the service: each card is validated once, when it
+# is converted to an MTGIOCard, which also reports malformed cards one by one.
+_MTGIO_CARD_FIELDS = _projection(
+    MTGIOCardPayload,
+    rulings=_lenient_list(_projection(MTGIORulingPayload)),
+    foreignNames=_lenient_list(_projection(MTGIOForeignNamePayload)),
+)
+
+CARD_RESPONSE_DECODER: TypeAdapter[dict[str, Any]] = TypeAdapter(
+    _projection(MTGIOCardResponse, card=_lenient(_MTGIO_CARD_FIELDS))
+)
+CARDS_RESPONSE_DECODER: TypeAdapter[dict[str, Any]] = TypeAdapter(
+    _projection(MTGIOCardsResponse, cards=_lenient_list(_MTGIO_CARD_FIELDS))
+)
+
+
+def _decode(decoder: TypeAdapter[Any], content: bytes) -> dict[str, Any]:
+    """
+    Decode a response body with the given schema in a single pass over its bytes.
+    The schema accepts any JSON object, so only invalid JSON or a body that is not an object is rejected.
+
+    :raises ValueError: If the body is not valid JSON.
+    """
+    try:
+        return decoder.validate_json(content)  # type: ignore[no-any-return]
+    except ValidationError as decoding_error:
+        if any(error["type"] == "json_invalid" for error in decoding_error.errors()):
+            raise
+        logger.debug("MTGIO response is not a JSON object: %s", decoding_error)
+    return {}
+
+
+def decode_card_response(content: bytes) -> MTGIOCardPayload:
+    """
+    Decode the body of a single card response straight from its raw bytes.
+
+    :param content: Raw body of the MTGIO response.
+    :return: The card payload, empty if the response holds no card. Its values are validated on conversion.
+    :raises ValueError: If the body is not valid JSON.
+    """
+    card_payload = _decode(CARD_RESPONSE_DECODER, content).get("card") or {}
+    return card_payload if isinstance(card_payload, dict) else {}  # type: ignore[return-value]
+
+
+def decode_cards_response(content: bytes) -> list[MTGIOCardPayload]:
+    """
+    Decode the body of a card list response straight from its raw bytes.
+
+    :param content: Raw body of the MTGIO response.
+    :return: The card payloads, empty if the response holds no cards. Their values are validated on conversion.
+    :raises ValueError: If the body is not valid JSON.
+    """
+    cards_payload = _decode(CARDS_RESPONSE_DECODER, content).get("cards") or []
+    if not isinstance(cards_payload, list):
+        return []
+    return [card for card in cards_payload if isinstance(card, dict)]  # type: ignore[misc]
@@ -1,21 +1,56 @@
+import asyncio
 import logging
+import math
+import os
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Annotated
 
+from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, FastAPI, HTTPException, Query, Response
-from fastapi.responses import JSONResponse
-from httpx import HTTPStatusError
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from httpx import HTTPError, HTTPStatusError
+from httpx import Response as UpstreamResponse
+from starlette.background import BackgroundTask
 
+from mtgapi.common.exceptions import UpstreamUnavailableError
 from mtgapi.config.settings.api import VERSION, APIConfiguration
 from mtgapi.config.settings.defaults import KNOWN_ID_EXCEPTIONS
 from mtgapi.config.wiring import wire_services
-from mtgapi.domain.card import MTGCard
+from mtgapi.domain.card import CardValidators, MTGCard
+from mtgapi.domain.catalog import MTGSet
+from mtgapi.services import AuxiliaryServiceNames
 from mtgapi.services.apis.mtgio import MTGIOAPIService
-from mtgapi.services.cache import cache_card_data, retrieve_card_data_from_cache
+from mtgapi.services.cache import (
+    CacheWriteBehindService,
+    cache_card_data,
+    cache_card_printings,
+    cache_card_validators,
+    cache_sets,
+    register_cached_models,
+    retrieve_cached_sets,
+    retrieve_card_data_from_cache,
+    retrieve_card_with_validators_from_cache,
+    update_cached_card_data,
+)
+from mtgapi.services.catalog import CatalogSyncService
+from mtgapi.services.images import (
+    CachedImage,
+    ImageCacheService,
+    ImageFormat,
+    ImageSize,
+    ImageVariant,
+    sniff_media_type,
+)
+from mtgapi.services.providers import CardProviderChainService
 
 logger = logging.getLogger(__name__)
 
+IMAGE_CHUNK_SIZE = 64 * 1024
+DEFAULT_IMAGE_MEDIA_TYPE = "image/webp"
+CACHED_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 @asynccontextmanager
 async def mtgio_api_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -26,10 +61,23 @@ async def mtgio_api_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         services_container = wire_services()
         services_container.init_resources()
+        mtgio_service: MTGIOAPIService = getattr(services_container, AuxiliaryServiceNames.MTGIO)()
+        catalog_sync_service: CatalogSyncService = getattr(services_container, AuxiliaryServiceNames.CATALOG_SYNC)()
+        image_cache: ImageCacheService = getattr(services_container, AuxiliaryServiceNames.IMAGE_CACHE)()
+        card_providers: CardProviderChainService = getattr(services_container, AuxiliaryServiceNames.CARD_PROVIDERS)()
+        cache_writes: CacheWriteBehindService = getattr(services_container, AuxiliaryServiceNames.CACHE_WRITES)()
+        card_providers.start()
+        await register_cached_models()
+        cache_writes.start()
+        catalog_sync_service.start()
         app.root_path = config.root_path
         try:
             yield
         finally:
+            await catalog_sync_service.stop()
+            await cache_writes.stop()
+            image_cache.close()
+            await mtgio_service.disconnect()
             services_container.shutdown_resources()
 
 
@@ -41,9 +89,10 @@ API = FastAPI(
 
 
 @API.get("/card/{card_identifier}")
+@inject
 async def get_card(
     card_identifier: str,
-    mtgio_service: Annotated[MTGIOAPIService, Depends(MTGIOAPIService)],
+    mtgio_service: Annotated[MTGIOAPIService, Depends(Provide[AuxiliaryServiceNames.MTGIO])],
     printing: Annotated[
         str | None,
         Query(
@@ -64,16 +113,151 @@ async def get_card(
         logger.warning("Card identifier '%s' is in known exceptions: %s", card_identifier, exception_reason)
         raise HTTPException(status_code=400, detail=exception_reason)
 
-    cached_entry: MTGCard = await retrieve_card_data_from_cache(normalized_identifier, normalized_printing)
+    cached_entry, cached_validators = await retrieve_card_with_validators_from_cache(
+        normalized_identifier, normalized_printing
+    )
     if cached_entry and (not normalized_printing or cached_entry.set_name == normalized_printing):
+        validators = cached_validators or CardValidators(id=cached_entry.id)
+        if validators.is_fresh(mtgio_service.refresh_after):
+            return cached_entry
+        return await mtgio_service.card_lookups.run(
+            ("revalidate", cached_entry.id, None),
+            lambda: revalidate_cached_card(mtgio_service, cached_entry, validators),
+        )
+
+    if normalized_printing and not await is_known_printing(mtgio_service, normalized_printing):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown printing '{normalized_printing}', see /sets for the available set codes.",
+        )
+
+    lookup_key = (normalized_identifier.casefold(), normalized_printing)
+    try:
+        return await mtgio_service.card_lookups.run(
+            lookup_key,
+            lambda: fetch_and_cache_card(normalized_identifier, normalized_printing),
+        )
+    except UpstreamUnavailableError as upstream_unavailable_error:
+        return await get_degraded_card(normalized_identifier, normalized_printing, upstream_unavailable_error)
+
+
+async def revalidate_cached_card(
+    mtgio_service: MTGIOAPIService, cached_entry: MTGCard, validators: CardValidators
+) -> MTGCard:
+    """
+    Conditionally revalidate a cached card that is older than the refresh age with MTGIO, using the validators
+    read together with it from the cache.
+
+    A 304 answer only extends the freshness of the cached entry; the stale entry is served if the
+    revalidation fails.
+    """
+    try:
+        refreshed_card, refreshed_validators = await mtgio_service.revalidate_card(validators)
+    except (UpstreamUnavailableError, HTTPError, ValueError) as revalidation_error:
+        logger.warning("Serving stale cached card '%s': %s", cached_entry.id, revalidation_error)
+        return cached_entry
+
+    if refreshed_card is None:
+        await cache_card_validators(refreshed_validators)
         return cached_entry
 
+    mtg_card = MTGCard.from_mtgio_card(refreshed_card)
+    await update_cached_card_data(mtg_card)
+    await cache_card_validators(refreshed_validators)
+    return mtg_card
+
+
+async def load_set_index(mtgio_service: MTGIOAPIService) -> dict[str, MTGSet]:
+    """
+    Return the set index of the MTGIO service, loading it from the cache or MTGIO once it is missing or stale.
+
+    The stale index is kept if MTGIO cannot be reached. Concurrent loads share a single call.
+    """
+    if mtgio_service.has_fresh_sets():
+        return mtgio_service.set_index
+
+    async def _load_sets() -> dict[str, MTGSet]:
+        if not mtgio_service.set_index:
+            mtgio_service.remember_sets(await retrieve_cached_sets())
+            if mtgio_service.has_fresh_sets():
+                return mtgio_service.set_index
+        try:
+            fetched_sets = await mtgio_service.get_sets()
+        except (UpstreamUnavailableError, HTTPError, ValueError) as set_retrieval_error:
+            if not mtgio_service.set_index:
+                raise
+            logger.warning("Serving stale set index: %s", set_retrieval_error)
+            return mtgio_service.set_index
+        await cache_sets(fetched_sets)
+        return mtgio_service.set_index
+
+    return await mtgio_service.set_lookups.run("sets", _load_sets)
+
+
+async def is_known_printing(mtgio_service: MTGIOAPIService, normalized_printing: str) -> bool:
+    """
+    Check a printing against the set index. Printings are not rejected while the set index is unavailable.
+    """
+    try:
+        set_index = await load_set_index(mtgio_service)
+    except (UpstreamUnavailableError, HTTPError, ValueError) as set_retrieval_error:
+        logger.warning("Cannot validate printing '%s': %s", normalized_printing, set_retrieval_error)
+        return True
+    return normalized_printing in set_index
+
+
+def upstream_unavailable_exception(upstream_unavailable_error: UpstreamUnavailableError) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=str(upstream_unavailable_error),
+        headers={"Retry-After": str(math.ceil(upstream_unavailable_error.retry_after))},
+    )
+
+
+async def get_degraded_card(
+    normalized_identifier: str,
+    normalized_printing: str | None,
+    upstream_unavailable_error: UpstreamUnavailableError,
+) -> MTGCard:
+    """
+    Serve the closest cached match for a card while the upstream cannot be reached.
+
+    A cached entry of another printing is returned when the requested printing is not cached.
+    """
+    if normalized_printing:
+        partial_match = await retrieve_card_data_from_cache(normalized_identifier)
+        if partial_match:
+            logger.warning(
+                "Upstream unavailable, serving cached printing '%s' of '%s' instead of '%s'",
+                partial_match.set_name,
+                normalized_identifier,
+                normalized_printing,
+            )
+            return partial_match
+    raise upstream_unavailable_exception(upstream_unavailable_error) from upstream_unavailable_error
+
+
+@inject
+async def fetch_and_cache_card(
+    normalized_identifier: str,
+    normalized_printing: str | None,
+    card_providers: CardProviderChainService = Provide[AuxiliaryServiceNames.CARD_PROVIDERS],
+) -> MTGCard:
+    """
+    Fetch a card missing from the cache from the card providers and store it in the cache.
+
+    Name lookups cache every printing returned by the provider in one write, so later lookups of other printings
+    are served from the cache. Concurrent misses for the same identifier and printing share a single call of this
+    function.
+    """
     identifier_for_lookup: int | str = (
         int(normalized_identifier) if normalized_identifier.isdigit() else normalized_identifier
     )
 
     try:
-        card_data_from_mtgio = await mtgio_service.get_card(identifier_for_lookup, printing=normalized_printing)
+        card_data_from_mtgio, *other_printings = await card_providers.get_card_printings(
+            identifier_for_lookup, printing=normalized_printing
+        )
     except HTTPStatusError as http_error:
         try:
             error_payload = http_error.response.json()
@@ -90,14 +274,62 @@ async def get_card(
             status_code=404,
             detail=f"Card found but printing '{mtg_card.set_name}' does not match requested '{normalized_printing}'.",
         )
+    if other_printings:
+        fetched_printings = [mtg_card]
+        for other_printing in other_printings:
+            try:
+                fetched_printings.append(MTGCard.from_mtgio_card(other_printing))
+            except ValueError as conversion_error:
+                logger.warning(
+                    "Not caching printing %s of '%s': %s", other_printing.id, mtg_card.name, conversion_error
+                )
+        await cache_card_printings(fetched_printings)
+        # The requested printing missed the cache, so its cached entry, if any, is outdated (e.g. stored under
+        # another set name) and is overwritten; the other printings are kept as they are
+        await cache_card_data(mtg_card)
+        return mtg_card
     await cache_card_data(mtg_card)
+    await cache_card_validators(CardValidators(id=mtg_card.id, refreshed_at=time.time()))
     return mtg_card
 
 
+@API.get("/sets")
+@inject
+async def get_sets(
+    mtgio_service: Annotated[MTGIOAPIService, Depends(Provide[AuxiliaryServiceNames.MTGIO])],
+) -> list[MTGSet]:
+    try:
+        set_index = await load_set_index(mtgio_service)
+    except UpstreamUnavailableError as upstream_unavailable_error:
+        raise upstream_unavailable_exception(upstream_unavailable_error) from upstream_unavailable_error
+    except HTTPStatusError as http_error:
+        raise HTTPException(
+            status_code=http_error.response.status_code, detail="Failed to retrieve sets from upstream service."
+        ) from http_error
+    except (HTTPError, ValueError) as set_retrieval_error:
+        raise HTTPException(status_code=502, detail=str(set_retrieval_error)) from set_retrieval_error
+    return sorted(set_index.values(), key=lambda mtg_set: (mtg_set.release_date, mtg_set.id))
+
+
+def requested_image_variant(
+    size: Annotated[
+        ImageSize | None,
+        Query(description="Optional size the image is scaled down to, keeping its aspect ratio."),
+    ] = None,
+    image_format: Annotated[
+        ImageFormat | None,
+        Query(alias="format", description="Optional format the image is converted to."),
+    ] = None,
+) -> ImageVariant | None:
+    return ImageVariant(size=size, image_format=image_format) if size or image_format else None
+
+
 @API.get("/card/{card_identifier}/image")
+@inject
 async def get_card_image(
     card_identifier: str,
-    mtgio_service: Annotated[MTGIOAPIService, Depends(MTGIOAPIService)],
+    mtgio_service: Annotated[MTGIOAPIService, Depends(Provide[AuxiliaryServiceNames.MTGIO])],
+    image_cache: Annotated[ImageCacheService, Depends(Provide[AuxiliaryServiceNames.IMAGE_CACHE])],
     printing: Annotated[
         str | None,
         Query(
@@ -106,9 +338,179 @@ async def get_card_image(
             max_length=10,
         ),
     ] = None,
+    variant: Annotated[ImageVariant | None, Depends(requested_image_variant)] = None,
 ) -> Response:
     card_data_from_mtgio = await get_card(card_identifier, mtgio_service, printing)
-    return Response(content=await mtgio_service.get_card_image(card_data_from_mtgio), media_type="image/webp")
+    try:
+        if image_cache.enabled:
+            cached_image = await retrieve_cached_card_image(image_cache, mtgio_service, card_data_from_mtgio, variant)
+            cached_image_response = await serve_cached_image(image_cache, cached_image) if cached_image else None
+            if cached_image_response is not None:
+                return cached_image_response
+        if variant is None and mtgio_service.stream_images:
+            upstream_image = await mtgio_service.open_card_image_stream(card_data_from_mtgio)
+            if upstream_image is not None:
+                return relay_upstream_image(upstream_image)
+            card_image = None
+        else:
+            card_image = await mtgio_service.get_card_image(card_data_from_mtgio)
+    except UpstreamUnavailableError as upstream_unavailable_error:
+        raise upstream_unavailable_exception(upstream_unavailable_error) from upstream_unavailable_error
+    if not card_image:
+        return Response(media_type=DEFAULT_IMAGE_MEDIA_TYPE)
+    if variant is not None:
+        try:
+            card_image, media_type = await image_cache.render_variant(card_image, variant)
+        except (OSError, ValueError) as image_rendering_error:
+            raise image_rendering_exception(image_rendering_error) from image_rendering_error
+        return Response(content=card_image, media_type=media_type)
+    return Response(content=card_image, media_type=sniff_media_type(card_image) or DEFAULT_IMAGE_MEDIA_TYPE)
+
+
+def image_rendering_exception(image_rendering_error: Exception) -> HTTPException:
+    logger.exception("Failed to render card image variant", exc_info=image_rendering_error)
+    return HTTPException(status_code=502, detail="Card image could not be resized or converted.")
+
+
+async def retrieve_cached_card_image(
+    image_cache: ImageCacheService, mtgio_service: MTGIOAPIService, card: MTGCard, variant: ImageVariant | None
+) -> CachedImage | None:
+    """
+    Look up the image of a card, or a variant of it, in the image cache, downloading and rendering it on a miss.
+    Concurrent misses for the same image share one download or rendering.
+
+    :return: The stored image, or None if the card has no image, it could not be stored or the stored original
+        of the variant has gone missing.
+    :raises HTTPException: If the variant could not be rendered from the upstream image.
+    """
+    if variant is not None:
+        cached_variant = await image_cache.get(variant.key_for(card.id))
+        if cached_variant is not None:
+            return cached_variant
+    original_image = await image_cache.get(card.id) or await image_cache.stores.run(
+        card.id, lambda: store_upstream_image(image_cache, mtgio_service, card)
+    )
+    if original_image is None or variant is None:
+        return original_image
+    try:
+        return await image_cache.stores.run(
+            variant.key_for(card.id), lambda: image_cache.store_variant(original_image, variant)
+        )
+    except FileNotFoundError:
+        await image_cache.discard(original_image)
+        return None
+    except (OSError, ValueError) as image_rendering_error:
+        raise image_rendering_exception(image_rendering_error) from image_rendering_error
+
+
+async def store_upstream_image(
+    image_cache: ImageCacheService, mtgio_service: MTGIOAPIService, card: MTGCard
+) -> CachedImage | None:
+    """
+    Stream the image of a card from upstream straight into the image cache.
+
+    :return: The stored image, or None if the card has no image or it could not be stored,
+        in which case the image is served without the cache.
+    """
+    upstream_image = await mtgio_service.open_card_image_stream(card)
+    if upstream_image is None:
+        return None
+    try:
+        return await image_cache.store(
+            card.id,
+            upstream_image.aiter_bytes(chunk_size=IMAGE_CHUNK_SIZE),
+            media_type=upstream_image.headers.get("Content-Type"),
+        )
+    except (HTTPError, OSError) as image_storing_error:
+        logger.exception("Failed to cache image for card [[%s]]", card.name, exc_info=image_storing_error)
+        return None
+    finally:
+        await upstream_image.aclose()
+
+
+async def serve_cached_image(image_cache: ImageCacheService, cached_image: CachedImage) -> FileResponse | None:
+    """
+    Serve a stored image from disk, letting the server send the file without copying it through Python
+    when it supports it. Images never change for a given printing, so clients may cache them indefinitely.
+
+    :return: The response, or None if the stored body has gone missing (e.g. evicted by a concurrent store),
+        in which case its index entry is dropped and the image has to be served from upstream.
+    """
+    image_path = image_cache.path_of(cached_image)
+    try:
+        stat_result = await asyncio.to_thread(os.stat, image_path)
+    except FileNotFoundError:
+        await image_cache.discard(cached_image)
+        return None
+    return FileResponse(
+        image_path,
+        media_type=cached_image.media_type,
+        headers={"Cache-Control": CACHED_IMAGE_CACHE_CONTROL},
+        stat_result=stat_result,
+    )
+
+
+def relay_upstream_image(upstream_image: UpstreamResponse) -> StreamingResponse:
+    """
+    Relay a streamed upstream image chunk by chunk, keeping its content type and length.
+    The upstream response is closed once the image is sent or the client disconnects.
+    """
+
+    async def _relay_chunks() -> AsyncGenerator[bytes, None]:
+        try:
+            async for chunk in upstream_image.aiter_bytes(chunk_size=IMAGE_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await upstream_image.aclose()
+
+    relayed_headers = {}
+    content_length = upstream_image.headers.get("Content-Length")
+    if content_length is not None and "Content-Encoding" not in upstream_image.headers:
+        relayed_headers["Content-Length"] = content_length
+    return StreamingResponse(
+        _relay_chunks(),
+        media_type=upstream_image.headers.get("Content-Type", DEFAULT_IMAGE_MEDIA_TYPE),
+        headers=relayed_headers,
+        background=BackgroundTask(upstream_image.aclose),
+    )
+
+
+@API.get("/_stats/upstream", tags=["_internal"], summary="Upstream request statistics")
+@inject
+async def upstream_statistics(
+    mtgio_service: Annotated[MTGIOAPIService, Depends(Provide[AuxiliaryServiceNames.MTGIO])],
+    catalog_sync_service: Annotated[CatalogSyncService, Depends(Provide[AuxiliaryServiceNames.CATALOG_SYNC])],
+    image_cache: Annotated[ImageCacheService, Depends(Provide[AuxiliaryServiceNames.IMAGE_CACHE])],
+    card_providers: Annotated[CardProviderChainService, Depends(Provide[AuxiliaryServiceNames.CARD_PROVIDERS])],
+    cache_writes: Annotated[CacheWriteBehindService, Depends(Provide[AuxiliaryServiceNames.CACHE_WRITES])],
+) -> JSONResponse:
+    """
+    In-process counters describing how upstream lookups were served.
+    """
+    return JSONResponse(
+        content={
+            "card_lookups": mtgio_service.card_lookups.statistics.as_dict(),
+            "card_batches": mtgio_service.card_batches.statistics.as_dict(),
+            "set_lookups": mtgio_service.set_lookups.statistics.as_dict(),
+            "rate_limiter": mtgio_service.rate_limiter.statistics.as_dict(),
+            "retry_budget": mtgio_service.retry_budget.statistics.as_dict(),
+            "hedging": mtgio_service.hedger.statistics.as_dict() if mtgio_service.hedger else None,
+            "proxies": mtgio_service._proxy_provider.as_dict() if mtgio_service._proxy_provider else {},
+            "circuit_breakers": {
+                upstream: circuit_breaker.as_dict()
+                for upstream, circuit_breaker in mtgio_service.circuit_breakers.items()
+            },
+            "card_providers": card_providers.as_dict(),
+            "cache_writes": {**cache_writes.statistics.as_dict(), "pending": cache_writes.pending},
+            "catalog_sync": catalog_sync_service.last_run.model_dump() if catalog_sync_service.last_run else None,
+            "image_cache": {
+                **image_cache.statistics.as_dict(),
+                "stored_images": len(image_cache),
+                "stored_bytes": image_cache.stored_bytes,
+                "max_bytes": image_cache.max_bytes,
+            },
+        }
+    )
 
 
 @API.get("/metrics", tags=["_internal"], summary="Metrics (placeholder)")
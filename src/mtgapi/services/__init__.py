@@ -4,3 +4,8 @@ from enum import StrEnum
 class AuxiliaryServiceNames(StrEnum):
     PROXY = "proxy_service"
     DATABASE = "database_service"
+    MTGIO = "mtgio_service"
+    CATALOG_SYNC = "catalog_sync_service"
+    IMAGE_CACHE = "image_cache_service"
+    CARD_PROVIDERS = "card_providers_service"
+    CACHE_WRITES = "cache_writes_service"
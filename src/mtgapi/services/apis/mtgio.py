@@ -1,25 +1,66 @@
+import asyncio
+import collections
 import dataclasses
 import logging
+import math
 import re
+import time
 import urllib.parse
+from collections.abc import AsyncGenerator, Iterable
+from typing import Any
 
 import httpx
+import pydantic
 
 from mtgapi.config.settings.services import MTGIOAPIConfiguration
-from mtgapi.domain.card import MTGCard, MTGIOCard
+from mtgapi.domain.card import CardValidators, MTGCard, MTGIOCard
+from mtgapi.domain.catalog import MTGSet
+from mtgapi.domain.payloads import MTGIOCardPayload, decode_card_response, decode_cards_response
+from mtgapi.services.batching import MicroBatcher
+from mtgapi.services.coalescing import SingleFlight
 from mtgapi.services.http import AbstractAsyncHTTPClientService
 
 logger = logging.getLogger(__name__)
 
+MTGIO_MAX_PAGE_SIZE = 100
+MTGIO_MAX_IDS_PER_QUERY = 50
+MTGIO_TOTAL_COUNT_HEADER = "Total-Count"
+
+
+@dataclasses.dataclass
+class CatalogPage:
+    """
+    A single page of the MTGIO card catalog.
+    """
+
+    number: int
+    cards: list[MTGIOCardPayload]
+    total_pages: int | None = None
+
 
 @dataclasses.dataclass
 class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfiguration):
     limit_header: str = dataclasses.field(init=False)
     version: str = dataclasses.field(init=False)
+    refresh_after: int = dataclasses.field(init=False)
+    sets_refresh_after: int = dataclasses.field(init=False)
+    stream_images: bool = dataclasses.field(init=False)
+    card_lookups: SingleFlight[MTGCard] = dataclasses.field(init=False, default_factory=SingleFlight)
+    card_batches: MicroBatcher[str, MTGIOCard] = dataclasses.field(init=False, repr=False)
+    set_lookups: SingleFlight[dict[str, MTGSet]] = dataclasses.field(init=False, default_factory=SingleFlight)
+    set_index: dict[str, MTGSet] = dataclasses.field(init=False, default_factory=dict, repr=False)
 
     def _post_init(self, config: MTGIOAPIConfiguration) -> None:  # type: ignore
         self.limit_header = config.rate_limit_header
         self.version = config.version
+        self.refresh_after = config.refresh_after
+        self.sets_refresh_after = config.sets_refresh_after
+        self.stream_images = config.stream_images
+        self.card_batches = MicroBatcher(
+            resolve_batch=self._resolve_card_batch,
+            window=config.batch_window,
+            max_batch_size=min(config.batch_max_size, MTGIO_MAX_IDS_PER_QUERY),
+        )
 
     def construct_auth(self, config: MTGIOAPIConfiguration) -> httpx.Auth | None:  # type: ignore  # noqa: ARG002
         return None
@@ -28,7 +69,11 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
         return {}
 
     def check_rate_limit(self, response: httpx.Response) -> bool:
-        return int(response.headers.get(self.limit_header, 0)) > 0
+        return (self.remaining_rate_limit(response) or 0) > 0
+
+    def remaining_rate_limit(self, response: httpx.Response) -> int | None:
+        remaining = response.headers.get(self.limit_header)
+        return int(remaining) if remaining is not None and remaining.isdigit() else None
 
     @staticmethod
     def convert_payload_key(key: str) -> str:
@@ -52,11 +97,7 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
         normalized_printing = printing.strip().upper() if isinstance(printing, str) and printing.strip() else None
 
         if fetch_by_name:
-            name_value = str(identifier)
-            quoted_name = f'"{name_value}"' if all(c.isalnum() or c.isspace() for c in name_value) else name_value
-            query_params = {"name": quoted_name}
-            if normalized_printing:
-                query_params["set"] = normalized_printing
+            query_params = self._name_query(str(identifier), normalized_printing)
             raw_url = (
                 f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.CARDS}?"
                 f"{urllib.parse.urlencode(query_params, quote_via=urllib.parse.quote_plus)}"
@@ -66,10 +107,10 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
 
         response = await self.get(raw_url)
         response.raise_for_status()
-        payload = response.json()
 
+        found_card_data: dict[str, Any] | MTGIOCardPayload
         if fetch_by_name:
-            cards_payload = payload.get("cards", [])
+            cards_payload = response.json().get("cards", []) if raw else decode_cards_response(response.content)
             if not isinstance(cards_payload, list) or not cards_payload:
                 raise ValueError(
                     f"Card with name '{identifier}' and printing '{normalized_printing or 'ANY'}' not found."
@@ -82,7 +123,7 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
 
             found_card_data = cards_payload[0]
         else:
-            found_card_data = payload.get("card", {})
+            found_card_data = response.json().get("card", {}) if raw else decode_card_response(response.content)
             if not found_card_data:
                 raise ValueError(f"Card with identifier '{identifier}' not found.")
         card_name = found_card_data.get("name", "")
@@ -93,7 +134,257 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
         logger.info("Found card [[%s]] on MTGIO API.", card_name)
         logger.debug(found_card_data)
 
-        return MTGIOCard.from_api_payload(found_card_data) if not raw else found_card_data
+        return MTGIOCard.from_api_payload(found_card_data) if not raw else found_card_data  # type: ignore[return-value]
+
+    @staticmethod
+    def _name_query(name: str, normalized_printing: str | None) -> dict[str, str]:
+        quoted_name = f'"{name}"' if all(c.isalnum() or c.isspace() for c in name) else name
+        query_params = {"name": quoted_name}
+        if normalized_printing:
+            query_params["set"] = normalized_printing
+        return query_params
+
+    async def get_card_printings(self, name: str, printing: str | None = None) -> list[MTGIOCard]:
+        """
+        Fetches every printing of a card by its name from the MTGIO API with a single request.
+
+        :param name:
+            The card name used for lookup.
+        :param printing:
+            Optional set code (e.g. "10E") to restrict the lookup to a specific printing.
+        :return:
+            The printings of the card, the one ``get_card`` would return first. Malformed printings are left out.
+        """
+        normalized_printing = printing.strip().upper() if isinstance(printing, str) and printing.strip() else None
+        query_params = {**self._name_query(name, normalized_printing), "pageSize": str(MTGIO_MAX_PAGE_SIZE)}
+        response = await self.get(
+            f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.CARDS}?"
+            f"{urllib.parse.urlencode(query_params, quote_via=urllib.parse.quote_plus)}"
+        )
+        response.raise_for_status()
+        cards_payload = [card for card in decode_cards_response(response.content) if card.get("name")]
+        if normalized_printing:
+            cards_payload = [card for card in cards_payload if card.get("set", "").upper() == normalized_printing]
+        if not cards_payload:
+            raise ValueError(f"Card with name '{name}' and printing '{normalized_printing or 'ANY'}' not found.")
+
+        # Unquoted names are matched partially, so keep only the printings of the card get_card would return
+        card_name = cards_payload[0].get("name", "")
+        printings: dict[str, MTGIOCard] = {}
+        for card_payload in cards_payload:
+            if card_payload.get("name") != card_name or card_payload.get("id") in printings:
+                continue
+            try:
+                printings[card_payload["id"]] = MTGIOCard.from_api_payload(card_payload)
+            except (pydantic.ValidationError, KeyError) as parsing_error:
+                logger.warning(
+                    "Skipping malformed printing %s of [[%s]]: %s", card_payload.get("id"), name, parsing_error
+                )
+        if not printings:
+            raise ValueError(f"Card with name '{name}' has no valid printings.")
+        logger.info("Found %d printings of card [[%s]] on MTGIO API.", len(printings), card_name)
+        return list(printings.values())
+
+    async def get_cards(self, identifiers: Iterable[int | str]) -> dict[str, MTGIOCard]:
+        """
+        Fetches several cards by their multiverse IDs using MTGIO's multi-value filter (``multiverseid=a|b|c``).
+
+        :param identifiers:
+            Multiverse IDs of the cards, queried in chunks of at most MTGIO_MAX_IDS_PER_QUERY.
+        :return:
+            Cards keyed by multiverse ID. IDs unknown to MTGIO are left out.
+        """
+        unique_identifiers = list(dict.fromkeys(str(identifier) for identifier in identifiers))
+        chunks = [
+            unique_identifiers[offset : offset + MTGIO_MAX_IDS_PER_QUERY]
+            for offset in range(0, len(unique_identifiers), MTGIO_MAX_IDS_PER_QUERY)
+        ]
+        found_cards: dict[str, MTGIOCard] = {}
+        for chunk_cards in await asyncio.gather(*(self._get_cards_chunk(chunk) for chunk in chunks)):
+            found_cards.update(chunk_cards)
+        return found_cards
+
+    async def _get_cards_chunk(self, identifiers: list[str]) -> dict[str, MTGIOCard]:
+        query_params = {"multiverseid": "|".join(identifiers), "pageSize": str(MTGIO_MAX_PAGE_SIZE)}
+        response = await self.get(
+            f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.CARDS}?"
+            f"{urllib.parse.urlencode(query_params, safe='|')}"
+        )
+        response.raise_for_status()
+        cards_payload = decode_cards_response(response.content)
+
+        requested_identifiers = set(identifiers)
+        found_cards: dict[str, MTGIOCard] = {}
+        for card_payload in cards_payload:
+            multiverse_id = str(card_payload.get("multiverseid", ""))
+            # Both faces of split / flip cards share a multiverse ID, the first one matches /cards/{id}
+            if (
+                multiverse_id not in requested_identifiers
+                or multiverse_id in found_cards
+                or not card_payload.get("name")
+            ):
+                continue
+            try:
+                found_cards[multiverse_id] = MTGIOCard.from_api_payload(card_payload)
+            except (pydantic.ValidationError, KeyError, IndexError, TypeError) as parsing_error:
+                # Only the lookup of this card fails, the others batched with it are still served
+                logger.warning("Skipping malformed card %s: %s", multiverse_id, parsing_error)
+        logger.info("Found %d of %d cards on MTGIO API in one query.", len(found_cards), len(identifiers))
+        return found_cards
+
+    async def _resolve_card_batch(self, identifiers: list[str]) -> dict[str, MTGIOCard]:
+        if len(identifiers) > 1:
+            return await self.get_cards(identifiers)
+        (identifier,) = identifiers
+        try:
+            return {identifier: await self.get_card(identifier)}
+        except httpx.HTTPStatusError as card_retrieval_error:
+            if card_retrieval_error.response.status_code == httpx.codes.NOT_FOUND:
+                return {}
+            raise
+
+    async def get_card_batched(self, multiverse_id: int) -> MTGIOCard:
+        """
+        Fetches a card by its multiverse ID, sharing one multi-ID query with concurrent lookups.
+        Falls back to a single-card request when batching is disabled.
+
+        :param multiverse_id:
+            The multiverse ID of the card.
+        """
+        if not self.card_batches.window:
+            return await self.get_card(multiverse_id)
+        try:
+            return await self.card_batches.submit(str(multiverse_id))
+        except LookupError as card_not_found_error:
+            raise ValueError(f"Card with identifier '{multiverse_id}' not found.") from card_not_found_error
+
+    async def get_cards_page(
+        self, page: int, page_size: int = MTGIO_MAX_PAGE_SIZE, set_code: str | None = None
+    ) -> CatalogPage:
+        """
+        Fetches a single page of the MTGIO card catalog.
+
+        :param page:
+            Number of the page, starting at 1.
+        :param page_size:
+            Number of cards per page, at most MTGIO_MAX_PAGE_SIZE.
+        :param set_code:
+            Optional set code restricting the catalog to the cards of a single set.
+        :return:
+            The raw card payloads of the page and the number of catalog pages, if reported by MTGIO.
+        """
+        query_params = {"page": str(page), "pageSize": str(page_size)}
+        if set_code:
+            query_params["set"] = set_code
+        response = await self.get(
+            f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.CARDS}?{urllib.parse.urlencode(query_params)}"
+        )
+        response.raise_for_status()
+        total_count = response.headers.get(MTGIO_TOTAL_COUNT_HEADER, "")
+        return CatalogPage(
+            number=page,
+            cards=decode_cards_response(response.content),
+            total_pages=math.ceil(int(total_count) / page_size) if total_count.isdigit() else None,
+        )
+
+    async def iterate_card_pages(
+        self, start_page: int = 1, concurrency: int = 4, page_size: int = MTGIO_MAX_PAGE_SIZE
+    ) -> AsyncGenerator[CatalogPage, None]:
+        """
+        Walks the MTGIO card catalog page by page, yielding pages in order.
+
+        Up to ``concurrency`` pages are requested ahead of the consumer once the first page reports the
+        catalog size; without it, pages are requested one at a time. Requests pass through the rate limiter
+        of the service, so the walk slows down as the upstream quota runs out. Iteration ends on the last
+        page or the first empty one.
+
+        :param start_page:
+            Number of the first page to fetch, e.g. the page after the last one already mirrored.
+        :param concurrency:
+            Maximum number of pages requested at the same time.
+        :param page_size:
+            Number of cards per page, at most MTGIO_MAX_PAGE_SIZE.
+        """
+        total_pages: int | None = None
+        next_page = start_page
+        in_flight: collections.deque[asyncio.Task[CatalogPage]] = collections.deque()
+        try:
+            while True:
+                while len(in_flight) < max(concurrency, 1) and (total_pages is None or next_page <= total_pages):
+                    in_flight.append(asyncio.ensure_future(self.get_cards_page(next_page, page_size)))
+                    next_page += 1
+                    if total_pages is None:
+                        break
+                if not in_flight:
+                    return
+                catalog_page = await in_flight.popleft()
+                total_pages = catalog_page.total_pages or total_pages
+                if not catalog_page.cards:
+                    return
+                yield catalog_page
+        finally:
+            for pending_page in in_flight:
+                pending_page.cancel()
+
+    async def get_sets(self, refresh: bool = False) -> list[MTGSet]:
+        """
+        Fetches the list of sets from the MTGIO API, served from the in-memory set index while it is fresh.
+
+        :param refresh:
+            Fetch the set list from MTGIO even if the set index is fresh.
+        """
+        if self.has_fresh_sets() and not refresh:
+            return list(self.set_index.values())
+
+        response = await self.get(f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.SETS}")
+        response.raise_for_status()
+        sets_payload = response.json().get("sets", [])
+        if not isinstance(sets_payload, list) or not sets_payload:
+            raise ValueError("MTGIO API returned an empty set list.")
+
+        refreshed_at = time.time()
+        found_sets = [
+            MTGSet.from_api_payload(set_payload, refreshed_at)
+            for set_payload in sets_payload
+            if isinstance(set_payload, dict) and set_payload.get("code")
+        ]
+        logger.info("Found %d sets on MTGIO API.", len(found_sets))
+        self.remember_sets(found_sets)
+        return found_sets
+
+    def remember_sets(self, sets: Iterable[MTGSet]) -> None:
+        """
+        Replaces the in-memory set index, e.g. with sets loaded from the cache.
+        """
+        self.set_index = {mtg_set.id.upper(): mtg_set for mtg_set in sets}
+
+    def has_fresh_sets(self) -> bool:
+        return bool(self.set_index) and all(
+            mtg_set.is_fresh(self.sets_refresh_after) for mtg_set in self.set_index.values()
+        )
+
+    async def revalidate_card(self, validators: CardValidators) -> tuple[MTGIOCard | None, CardValidators]:
+        """
+        Conditionally re-fetches a cached card using the validators stored with it.
+
+        :param validators:
+            Validators of the cached card, sent as If-None-Match / If-Modified-Since headers.
+        :return:
+            None and the validators with extended freshness if the card did not change upstream (304),
+            otherwise the re-fetched card and its new validators.
+        """
+        response = await self.get(
+            f"/{self.version}/{MTGIOAPIConfiguration.APIEndpoints.CARDS}/{validators.id}",
+            headers=validators.conditional_headers(),
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info("Card [[%s]] not modified on MTGIO API.", validators.id)
+            return None, validators.extend_freshness()
+
+        found_card_data = decode_card_response(response.content)
+        if not found_card_data:
+            raise ValueError(f"Card with identifier '{validators.id}' not found.")
+        return MTGIOCard.from_api_payload(found_card_data), CardValidators.from_headers(validators.id, response.headers)
 
     async def get_card_image(self, card: MTGCard) -> bytes | None:
         """
@@ -111,3 +402,18 @@ class MTGIOAPIService(AbstractAsyncHTTPClientService, config=MTGIOAPIConfigurati
             return None
         else:
             return bytes(response.content)
+
+    async def open_card_image_stream(self, card: MTGCard) -> httpx.Response | None:
+        """
+        Opens a streamed response with the image of a card from the MTGIO API.
+        The body is left unread and the caller must close the response.
+        """
+        if not card.image_url:
+            logger.warning("Card [[%s]] has no image URL.", card.name)
+            return None
+
+        try:
+            return await self.get_stream(url=card.image_url, override_base=True)
+        except httpx.HTTPStatusError as card_image_retrieval_error:
+            logger.exception("Failed to fetch image for card [[%s]]", card.name, exc_info=card_image_retrieval_error)
+            return None
@@ -0,0 +1,107 @@
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+BatchKey = TypeVar("BatchKey", bound=Hashable)
+BatchResult = TypeVar("BatchResult")
+
+
+@dataclasses.dataclass
+class MicroBatchStatistics:
+    """
+    Counters describing how many lookups were resolved together.
+    """
+
+    batches: int = 0
+    batched_keys: int = 0
+    max_batch_size: int = 0
+
+    def record(self, batch_size: int) -> None:
+        self.batches += 1
+        self.batched_keys += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class MicroBatcher(Generic[BatchKey, BatchResult]):
+    """
+    Collects lookups submitted within a short window and resolves them with a single batch call.
+
+    The first lookup of a batch opens a ``window`` seconds long collection period; the batch is resolved
+    when the window closes or ``max_batch_size`` distinct keys are collected, whichever comes first.
+    Duplicate keys within a batch share one result. Keys missing from the batch result fail with LookupError
+    and an exception raised by the batch call is propagated to every lookup of the batch.
+    """
+
+    resolve_batch: Callable[[list[BatchKey]], Awaitable[dict[BatchKey, BatchResult]]]
+    window: float = 0.005
+    max_batch_size: int = 50
+    statistics: MicroBatchStatistics = dataclasses.field(default_factory=MicroBatchStatistics)
+    _pending: dict[BatchKey, asyncio.Future[BatchResult]] = dataclasses.field(default_factory=dict, repr=False)
+    _flush_handle: asyncio.TimerHandle | None = dataclasses.field(default=None, repr=False)
+    _resolving: set[asyncio.Task[None]] = dataclasses.field(default_factory=set, repr=False)
+
+    async def submit(self, key: BatchKey) -> BatchResult:
+        """
+        Add a lookup to the current batch and wait for its result.
+
+        :param key: Key of the lookup.
+        :return: The result resolved for the key.
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_mark_exception_retrieved)
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        resolution = asyncio.ensure_future(self._resolve(batch))
+        self._resolving.add(resolution)
+        resolution.add_done_callback(self._resolving.discard)
+
+    async def _resolve(self, batch: dict[BatchKey, asyncio.Future[BatchResult]]) -> None:
+        self.statistics.record(len(batch))
+        logger.debug("Resolving batch of %d lookups", len(batch))
+        try:
+            results = await self.resolve_batch(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as batch_error:  # noqa: BLE001 - propagated to every lookup of the batch
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(batch_error)
+            return
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(LookupError(key))
+
+
+def _mark_exception_retrieved(future: asyncio.Future[Any]) -> None:
+    # Every lookup of the batch may have been cancelled before the result arrived
+    if not future.cancelled():
+        future.exception()
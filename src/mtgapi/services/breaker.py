@@ -0,0 +1,102 @@
+import dataclasses
+import logging
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+from mtgapi.common.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+CircuitStateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+@dataclasses.dataclass
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to a single upstream.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls fail fast with
+    CircuitOpenError. Once ``recovery_timeout`` elapses a single probe call is let through (half-open):
+    its success closes the circuit, its failure opens it again.
+
+    A failure threshold of 0 disables the breaker.
+    """
+
+    name: str
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    listeners: list[CircuitStateListener] = dataclasses.field(default_factory=list, repr=False)
+    state: CircuitState = dataclasses.field(init=False, default=CircuitState.CLOSED)
+    consecutive_failures: int = dataclasses.field(init=False, default=0)
+    rejected: int = dataclasses.field(init=False, default=0)
+    transitions: int = dataclasses.field(init=False, default=0)
+    _opened_at: float = dataclasses.field(init=False, default=0.0, repr=False)
+    _probe_in_flight: bool = dataclasses.field(init=False, default=False, repr=False)
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @property
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def _transition(self, new_state: CircuitState) -> None:
+        previous_state, self.state = self.state, new_state
+        self.transitions += 1
+        if new_state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        logger.warning("Circuit for %s changed from %s to %s", self.name, previous_state, new_state)
+        for listener in self.listeners:
+            listener(self.name, previous_state, new_state)
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be sent upstream.
+
+        :raises CircuitOpenError: If the circuit is open or a half-open probe is already running.
+        """
+        if not self.enabled or self.state == CircuitState.CLOSED:
+            return
+        if self.state == CircuitState.OPEN and self.retry_after == 0:
+            self._transition(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(upstream=self.name, retry_after=self.retry_after)
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == CircuitState.HALF_OPEN or (
+            self.state == CircuitState.CLOSED and self.enabled and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def record_abandoned_call(self) -> None:
+        """Release the half-open probe slot of a call that ended without an upstream verdict."""
+        self._probe_in_flight = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "rejected": self.rejected,
+            "transitions": self.transitions,
+        }
@@ -0,0 +1,165 @@
+import asyncio
+import dataclasses
+import gzip
+import json
+import logging
+import re
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+import pydantic
+
+from mtgapi.domain.card import CardValidators, MTGCard, MTGIOCard
+from mtgapi.services.database import PostgresDatabaseService
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+CARDS_WRAPPER_PATTERN = re.compile(r'\{\s*"cards"\s*:\s*\[')
+WHITESPACE_PATTERN = re.compile(r"[\s,]*")
+
+
+def _open_dump(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode="rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def iter_json_records(path: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Stream the records of a JSON dump without loading the whole file into memory.
+
+    Supported layouts are a top-level array of records, an MTGIO-shaped ``{"cards": [...]}`` object and
+    JSON Lines. Files ending with ``.gz`` are decompressed on the fly.
+
+    :param path: Path of the dump.
+    :param chunk_size: Number of characters read from the file at a time.
+    :return: Iterator over the decoded records.
+    :raises ValueError: If the dump is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    with _open_dump(path) as dump:
+        buffer = dump.read(chunk_size)
+        end_of_file = not buffer
+        position = WHITESPACE_PATTERN.match(buffer).end()  # type: ignore[union-attr]
+
+        if buffer.startswith("[", position):
+            position += 1
+            closing_character: str | None = "]"
+        elif wrapper := CARDS_WRAPPER_PATTERN.match(buffer, position):
+            position = wrapper.end()
+            closing_character = "]"
+        else:
+            closing_character = None
+
+        while True:
+            position = WHITESPACE_PATTERN.match(buffer, position).end()  # type: ignore[union-attr]
+            if position >= len(buffer) and not end_of_file:
+                buffer, position = buffer[position:] + dump.read(chunk_size), 0
+                end_of_file = position >= len(buffer)
+                continue
+            if position >= len(buffer) or buffer.startswith(closing_character or "\0", position):
+                return
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if end_of_file:
+                    raise
+                # The record continues in the next chunk
+                next_chunk = dump.read(chunk_size)
+                end_of_file = not next_chunk
+                buffer, position = buffer[position:] + next_chunk, 0
+                continue
+            if isinstance(record, dict):
+                yield record
+            if position > chunk_size:
+                buffer, position = buffer[position:], 0
+
+
+@dataclasses.dataclass
+class BulkImportStatistics:
+    """
+    Counters describing the outcome of a bulk import.
+    """
+
+    records: int = 0
+    inserted_cards: int = 0
+    skipped_records: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**dataclasses.asdict(self), "elapsed": self.elapsed, "records_per_second": self.records_per_second}
+
+
+def _convert_batch(
+    records: Iterator[dict[str, Any]], batch_size: int, statistics: BulkImportStatistics
+) -> list[MTGCard]:
+    cards = []
+    for card_payload in records:
+        statistics.records += 1
+        try:
+            cards.append(MTGCard.from_mtgio_card(MTGIOCard.from_api_payload(card_payload)))
+        except (pydantic.ValidationError, KeyError, IndexError, TypeError) as conversion_error:
+            statistics.skipped_records += 1
+            logger.warning("Skipping malformed card %s: %s", card_payload.get("id"), conversion_error)
+        if len(cards) >= batch_size:
+            break
+    return cards
+
+
+async def import_card_dump(
+    path: Path,
+    database: PostgresDatabaseService,
+    batch_size: int = 1000,
+    on_batch: Callable[[BulkImportStatistics], None] | None = None,
+) -> BulkImportStatistics:
+    """
+    Import a local dump of MTGIO card payloads into the card cache.
+
+    Records are stream-parsed and converted in a worker thread while the previous batch is written with
+    multi-row INSERT statements. Cards already cached are left untouched. The cards are marked as refreshed
+    at the modification time of the dump, so they are revalidated once they are older than the refresh age.
+
+    :param path: Path of the dump, see ``iter_json_records`` for the supported layouts.
+    :param database: Database service holding the card cache.
+    :param batch_size: Number of cards converted and written at a time.
+    :param on_batch: Optional callback receiving the statistics after each written batch.
+    :return: Statistics of the import.
+    """
+    for model in (MTGCard, CardValidators):
+        await database.register(model=model)
+    dumped_at = path.stat().st_mtime
+    statistics = BulkImportStatistics()
+    records = iter_json_records(path)
+
+    next_batch = asyncio.ensure_future(asyncio.to_thread(_convert_batch, records, batch_size, statistics))
+    while cards := await next_batch:
+        next_batch = asyncio.ensure_future(asyncio.to_thread(_convert_batch, records, batch_size, statistics))
+        validators = [CardValidators(id=card.id, refreshed_at=dumped_at) for card in cards]
+        try:
+            statistics.inserted_cards += await database.insert_many(cards, batch_size=batch_size)
+            await database.insert_many(validators, batch_size=batch_size)
+        except BaseException:
+            next_batch.cancel()
+            raise
+        if on_batch is not None:
+            on_batch(statistics)
+
+    logger.info(
+        "Imported %d of %d cards from %s in %.1fs",
+        statistics.inserted_cards,
+        statistics.records,
+        path,
+        statistics.elapsed,
+    )
+    return statistics
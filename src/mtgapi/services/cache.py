@@ -1,13 +1,224 @@
+import asyncio
+import contextlib
+import dataclasses
 import logging
+import time
+from collections.abc import Sequence
+from typing import Any
 
 from dependency_injector.wiring import Provide, inject
+from pydantic import BaseModel
 
-from mtgapi.domain.card import MTGCard
+from mtgapi.config.settings.services import CacheWriteBehindConfiguration
+from mtgapi.domain.card import CardValidators, MTGCard
+from mtgapi.domain.catalog import CatalogCheckpoint, CatalogSyncRun, CatalogSyncWatermark, MTGSet
 from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.base import AbstractAsyncService
 from mtgapi.services.database import PostgresDatabaseService
 
 logger = logging.getLogger(__name__)
 
+CACHED_MODELS: tuple[type[BaseModel], ...] = (
+    MTGCard,
+    CardValidators,
+    MTGSet,
+    CatalogCheckpoint,
+    CatalogSyncWatermark,
+    CatalogSyncRun,
+)
+
+
+@inject
+async def register_cached_models(
+    database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE],
+) -> None:
+    """
+    Create the SQLAlchemy models and tables of every cached model once, before the first request is served.
+
+    :param database:
+        The database service holding the cache.
+    """
+    await database.register_models(models=CACHED_MODELS)
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheWrite:
+    """
+    Queued write of a cached entry. Entries written with ``overwrite=False`` keep the entry already stored
+    under the same primary key.
+    """
+
+    instance: BaseModel
+    overwrite: bool = True
+
+
+@dataclasses.dataclass
+class CacheWriteStatistics:
+    """
+    Counters describing how cache writes were queued and written.
+    """
+
+    queued: int = 0
+    written: int = 0
+    failed: int = 0
+    flushes: int = 0
+    max_batch_size: int = 0
+    backpressure_waits: int = 0
+
+    def record(self, batch_size: int, failed: bool) -> None:
+        self.flushes += 1
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        if failed:
+            self.failed += batch_size
+        else:
+            self.written += batch_size
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class CacheWriteBehindService(AbstractAsyncService, config=CacheWriteBehindConfiguration):
+    """
+    Write-behind queue of the card cache.
+
+    Writes are acknowledged once queued and written by a background task in batches, as soon as ``max_batch_size``
+    writes are queued or ``flush_interval`` seconds after the first write of a batch. At most ``max_pending`` writes
+    are queued; further writers wait until the queue drains. ``stop`` writes out everything still queued.
+    Without a running flush task (before ``start``, after ``stop`` or with ``max_pending`` set to 0), writes go
+    straight to the database.
+    """
+
+    database: PostgresDatabaseService | None = dataclasses.field(init=False, default=None, repr=False)
+    max_pending: int = dataclasses.field(init=False, default=10000)
+    max_batch_size: int = dataclasses.field(init=False, default=200)
+    flush_interval: float = dataclasses.field(init=False, default=0.05)
+    statistics: CacheWriteStatistics = dataclasses.field(init=False, default_factory=CacheWriteStatistics)
+    _queue: asyncio.Queue[CacheWrite] | None = dataclasses.field(init=False, default=None, repr=False)
+    _batch_ready: asyncio.Event | None = dataclasses.field(init=False, default=None, repr=False)
+    _draining: bool = dataclasses.field(init=False, default=False, repr=False)
+    _task: asyncio.Task[None] | None = dataclasses.field(init=False, default=None, repr=False)
+
+    async def initialize(self, config: CacheWriteBehindConfiguration) -> None:  # type: ignore
+        self.max_pending = config.max_pending
+        self.max_batch_size = max(config.max_batch_size, 1)
+        self.flush_interval = config.flush_interval
+
+    @inject
+    def start(self, database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE]) -> None:
+        """
+        Schedule the flush task on the running event loop. Does nothing but bind the database if the queue is disabled.
+        """
+        self.database = database
+        if self.max_pending <= 0 or self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._batch_ready = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._flush_periodically(self._queue, self._batch_ready))
+        logger.info("Queueing up to %d cache writes, flushed every %.3fs", self.max_pending, self.flush_interval)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def enqueue(self, *instances: BaseModel, overwrite: bool = True) -> None:
+        """
+        Queue writes of the instances, waiting while the queue is full.
+
+        :param instances: Instances to write, may mix several cached models.
+        :param overwrite: Whether to overwrite entries already stored under the same primary key.
+        """
+        writes = [CacheWrite(instance=instance, overwrite=overwrite) for instance in instances]
+        if self._queue is None or self._batch_ready is None:
+            await self._write(writes)
+            return
+        for write in writes:
+            if self._queue.full():
+                self.statistics.backpressure_waits += 1
+            await self._queue.put(write)
+            self.statistics.queued += 1
+        if self._queue.qsize() >= self.max_batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> None:
+        """
+        Write out every queued write without waiting for the flush interval.
+        """
+        if self._queue is None or self._batch_ready is None:
+            return
+        self._draining = True
+        self._batch_ready.set()
+        try:
+            await self._queue.join()
+        finally:
+            self._draining = False
+
+    async def stop(self) -> None:
+        """
+        Flush the queue and cancel the flush task. Later writes go straight to the database.
+        """
+        if self._task is None:
+            return
+        await self.flush()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._queue = None
+        self._batch_ready = None
+        logger.info("Flushed cache write queue: %s", self.statistics)
+
+    async def _flush_periodically(self, queue: asyncio.Queue[CacheWrite], batch_ready: asyncio.Event) -> None:
+        while True:
+            writes = [await queue.get()]
+            if not self._draining:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(batch_ready.wait(), self.flush_interval)
+            batch_ready.clear()
+            while len(writes) < self.max_batch_size and not queue.empty():
+                writes.append(queue.get_nowait())
+            try:
+                await self._write(writes)
+            finally:
+                for _ in writes:
+                    queue.task_done()
+            if queue.qsize() >= self.max_batch_size or self._draining:
+                batch_ready.set()
+
+    async def _write(self, writes: Sequence[CacheWrite]) -> None:
+        """
+        Write a batch, inserting missing entries before overwriting, so that an overwrite wins over an insert
+        of the same entry regardless of their order in the batch. Failed batches are logged and dropped.
+        """
+        if self.database is None:
+            raise RuntimeError("Cache write queue is not started.")
+        try:
+            missing_instances = [write.instance for write in writes if not write.overwrite]
+            if missing_instances:
+                await self.database.insert_many(instances=missing_instances)
+            overwritten_instances = [write.instance for write in writes if write.overwrite]
+            if overwritten_instances:
+                await self.database.upsert_many(instances=overwritten_instances)
+        except Exception as cache_write_error:
+            logger.exception("Failed to write %d cache entries", len(writes), exc_info=cache_write_error)
+            self.statistics.record(len(writes), failed=True)
+        else:
+            logger.debug("Wrote %d cache entries", len(writes))
+            self.statistics.record(len(writes), failed=False)
+
+
+def _card_lookup_filters(identifier: str, printing: str | None) -> dict[str, str]:
+    normalized_identifier = identifier.strip()
+    normalized_printing = printing.strip().upper() if isinstance(printing, str) and printing.strip() else None
+    if normalized_identifier.isdigit():
+        lookup_filters = {"multiverse_id": normalized_identifier}
+    else:
+        lookup_filters = {"name": normalized_identifier}
+
+    if normalized_printing:
+        lookup_filters["set_name"] = normalized_printing
+    return lookup_filters
+
 
 @inject
 async def retrieve_card_data_from_cache(
@@ -27,18 +238,8 @@ async def retrieve_card_data_from_cache(
     :return:
         The card data if found in the cache, otherwise None.
     """
-    await database.register(model=MTGCard)
     try:
-        normalized_identifier = identifier.strip()
-        normalized_printing = printing.strip().upper() if isinstance(printing, str) and printing.strip() else None
-        if normalized_identifier.isdigit():
-            lookup_filters = {"multiverse_id": normalized_identifier}
-        else:
-            lookup_filters = {"name": normalized_identifier}
-
-        if normalized_printing:
-            lookup_filters["set_name"] = normalized_printing
-        results = await database.get_objects(object_type=MTGCard, filters=lookup_filters)
+        results = await database.get_objects(object_type=MTGCard, filters=_card_lookup_filters(identifier, printing))
         if not results:
             logger.info("No data for id=%s present in cache", identifier)
             return MTGCard.null()
@@ -51,26 +252,139 @@ async def retrieve_card_data_from_cache(
     return MTGCard(**data.__dict__)
 
 
+@inject
+async def retrieve_card_with_validators_from_cache(
+    identifier: str,
+    printing: str | None = None,
+    database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE],
+) -> tuple[MTGCard, CardValidators | None]:
+    """
+    Retrieve card data from the cache together with the upstream validators stored next to it, in one query,
+    so that checking the freshness of a cache hit costs no further database read.
+
+    :param identifier:
+        The identifier of the card to retrieve. Accepts a multiverse ID or a card name.
+    :param printing:
+        Optional set code for the desired printing. Only applied for name-based lookups.
+    :param database:
+        The database service to use for retrieving the card data.
+    :return:
+        The card data if found in the cache, otherwise a null card, and its validators, None if there are none.
+    """
+    try:
+        results = await database.get_objects_with(
+            object_type=MTGCard, joined_type=CardValidators, filters=_card_lookup_filters(identifier, printing)
+        )
+        if not results:
+            logger.info("No data for id=%s present in cache", identifier)
+            return MTGCard.null(), None
+    except Exception as encountered_exception:
+        logger.exception("Failed to retrieve cached card data", exc_info=encountered_exception)
+        return MTGCard.null(), None
+
+    data, stored_validators = results[0]
+    logger.info("Retrieved cached data for id=%s: %s", identifier, data.name)
+    validators = CardValidators(**stored_validators.__dict__) if stored_validators is not None else None
+    return MTGCard(**data.__dict__), validators
+
+
 @inject
 async def cache_card_data(
-    card: MTGCard, database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE]
+    card: MTGCard, cache_writes: CacheWriteBehindService = Provide[AuxiliaryServiceNames.CACHE_WRITES]
 ) -> None:
     """
-    Cache card data.
+    Queue a write of card data, overwriting the entry cached by a concurrent fetch of the same card.
 
     :param card:
         The card data to cache.
+    :param cache_writes:
+        The write-behind queue of the cache.
+    """
+    await cache_writes.enqueue(card)
+    logger.info("Queued card data for id=%s", card.id)
+
+
+@inject
+async def cache_card_printings(
+    cards: list[MTGCard], cache_writes: CacheWriteBehindService = Provide[AuxiliaryServiceNames.CACHE_WRITES]
+) -> None:
+    """
+    Queue writes of several printings of a card together with their refresh time.
+    Printings that are already cached are kept as they are.
+
+    :param cards:
+        The printings to cache.
+    :param cache_writes:
+        The write-behind queue of the cache.
+    """
+    refreshed_at = time.time()
+    validators = [CardValidators(id=card.id, refreshed_at=refreshed_at) for card in cards]
+    await cache_writes.enqueue(*cards, *validators, overwrite=False)
+    logger.info("Queued %d card printings", len(cards))
+
+
+@inject
+async def update_cached_card_data(
+    card: MTGCard, cache_writes: CacheWriteBehindService = Provide[AuxiliaryServiceNames.CACHE_WRITES]
+) -> None:
+    """
+    Queue an overwrite of the cached data of a card that was re-fetched from the upstream.
+
+    :param card:
+        The re-fetched card data.
+    :param cache_writes:
+        The write-behind queue of the cache.
+    """
+    await cache_writes.enqueue(card)
+    logger.info("Queued update of cached card data for id=%s", card.id)
+
+
+@inject
+async def cache_card_validators(
+    validators: CardValidators, cache_writes: CacheWriteBehindService = Provide[AuxiliaryServiceNames.CACHE_WRITES]
+) -> None:
+    """
+    Queue a write of the upstream validators of a cached card, replacing the previous ones.
+
+    :param validators:
+        The validators to store.
+    :param cache_writes:
+        The write-behind queue of the cache.
+    """
+    await cache_writes.enqueue(validators)
+
+
+@inject
+async def retrieve_cached_sets(
+    database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE],
+) -> list[MTGSet]:
+    """
+    Retrieve the cached MTGIO set list.
+
     :param database:
-        The database service to use for caching the card data.
+        The database service to use for retrieving the sets.
     :return:
-        True if the card data was successfully cached, otherwise False.
+        The cached sets, empty if the set list was never cached.
     """
-    await database.register(model=MTGCard)
     try:
-        insertion_result = await database.insert(instance=card)
-        if not insertion_result:
-            logger.error("Failed to cache card data for id=%s", card.id)
+        results = await database.get_objects(object_type=MTGSet)
     except Exception as encountered_exception:
-        logger.exception("Failed to cache card data", exc_info=encountered_exception)
-    else:
-        logger.info("Cached card data for id=%s", card.id)
+        logger.exception("Failed to retrieve cached sets", exc_info=encountered_exception)
+        return []
+    return [MTGSet(**result.__dict__) for result in results]
+
+
+@inject
+async def cache_sets(
+    sets: list[MTGSet], cache_writes: CacheWriteBehindService = Provide[AuxiliaryServiceNames.CACHE_WRITES]
+) -> None:
+    """
+    Queue writes of the MTGIO set list, replacing previously cached entries of the same sets.
+
+    :param sets:
+        The sets to store.
+    :param cache_writes:
+        The write-behind queue of the cache.
+    """
+    await cache_writes.enqueue(*sets)
+    logger.info("Queued %d sets", len(sets))
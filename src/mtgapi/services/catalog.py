@@ -0,0 +1,457 @@
+import asyncio
+import contextlib
+import dataclasses
+import datetime
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pydantic
+from dependency_injector.wiring import Provide, inject
+
+from mtgapi.common.exceptions import CatalogMirrorError, UpstreamUnavailableError
+from mtgapi.config.settings.services import CatalogSyncConfiguration
+from mtgapi.domain.card import CardValidators, MTGCard, MTGIOCard
+from mtgapi.domain.catalog import CatalogCheckpoint, CatalogSyncRun, CatalogSyncWatermark, MTGSet
+from mtgapi.domain.payloads import MTGIOCardPayload
+from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.apis.mtgio import CatalogPage, MTGIOAPIService
+from mtgapi.services.base import AbstractAsyncService
+from mtgapi.services.database import PostgresDatabaseService
+
+logger = logging.getLogger(__name__)
+
+MTGIO_CARDS_CATALOG = "mtgio-cards"
+MTGIO_SETS_CATALOG = "mtgio-sets"
+
+
+@dataclasses.dataclass
+class CatalogMirrorProgress:
+    """
+    Progress and throughput of a catalog mirror run.
+    """
+
+    first_page: int = 1
+    last_page: int = 0
+    total_pages: int = 0
+    cards: int = 0
+    skipped_cards: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def cards_per_second(self) -> float:
+        return self.cards / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        pages = self.last_page - self.first_page + 1
+        return pages / self.elapsed if pages > 0 and self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        if not self.total_pages or not self.pages_per_second:
+            return None
+        return max(self.total_pages - self.last_page, 0) / self.pages_per_second
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **dataclasses.asdict(self),
+            "elapsed": self.elapsed,
+            "cards_per_second": self.cards_per_second,
+            "eta": self.eta,
+        }
+
+
+def log_progress(progress: CatalogMirrorProgress) -> None:
+    eta = f"{progress.eta:.0f}s" if progress.eta is not None else "unknown"
+    logger.info(
+        "Mirrored page %d/%s, %d cards (%d skipped), %.1f cards/s, ETA %s",
+        progress.last_page,
+        progress.total_pages or "?",
+        progress.cards,
+        progress.skipped_cards,
+        progress.cards_per_second,
+        eta,
+    )
+
+
+@dataclasses.dataclass
+class _ParsedPage:
+    catalog_page: CatalogPage
+    cards: list[MTGIOCard]
+    skipped_cards: int
+
+
+@dataclasses.dataclass
+class _ConvertedPage:
+    catalog_page: CatalogPage
+    cards: list[MTGCard]
+    skipped_cards: int
+
+
+@dataclasses.dataclass
+class CatalogMirror:
+    """
+    Mirrors the MTGIO card catalog into the card cache.
+
+    Pages flow through a fetch -> parse -> convert -> write pipeline whose stages are connected by bounded
+    queues, so a slow database throttles fetching instead of buffering the catalog in memory. Every page is
+    upserted with multi-row INSERT ... ON CONFLICT statements in one transaction together with the checkpoint
+    of the run, which lets an interrupted run resume after the last written page.
+    """
+
+    mtgio_service: MTGIOAPIService
+    database: PostgresDatabaseService
+    concurrency: int = 4
+    queue_size: int = 8
+    report_interval: float = 5.0
+    on_progress: Callable[[CatalogMirrorProgress], None] = log_progress
+    progress: CatalogMirrorProgress = dataclasses.field(init=False, default_factory=CatalogMirrorProgress)
+    checkpoint: CatalogCheckpoint = dataclasses.field(
+        init=False, default_factory=lambda: CatalogCheckpoint(id=MTGIO_CARDS_CATALOG)
+    )
+    _last_report: float = dataclasses.field(init=False, default=0.0, repr=False)
+
+    async def run(self, restart: bool = False) -> CatalogMirrorProgress:
+        """
+        Mirror the catalog, resuming the previous run unless it completed or a restart is requested.
+
+        :param restart: Start from the first page even if a previous run was interrupted.
+        :return: Progress of the finished run.
+        :raises CatalogMirrorError: If a page cannot be written to the database.
+        :raises httpx.HTTPError: If a page cannot be fetched from MTGIO.
+        """
+        for model in (MTGCard, CardValidators, CatalogCheckpoint):
+            await self.database.register(model=model)
+        self.checkpoint = await self._load_checkpoint(restart)
+        self.progress = CatalogMirrorProgress(
+            first_page=self.checkpoint.last_page + 1,
+            last_page=self.checkpoint.last_page,
+            total_pages=self.checkpoint.total_pages,
+        )
+        logger.info("Mirroring MTGIO card catalog from page %d", self.progress.first_page)
+
+        parse_queue: asyncio.Queue[CatalogPage | None] = asyncio.Queue(maxsize=self.queue_size)
+        convert_queue: asyncio.Queue[_ParsedPage | None] = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue[_ConvertedPage | None] = asyncio.Queue(maxsize=self.queue_size)
+        try:
+            async with asyncio.TaskGroup() as pipeline:
+                pipeline.create_task(self._fetch(self.progress.first_page, parse_queue))
+                pipeline.create_task(self._parse(parse_queue, convert_queue))
+                pipeline.create_task(self._convert(convert_queue, write_queue))
+                pipeline.create_task(self._write(write_queue))
+        except ExceptionGroup as pipeline_errors:
+            # Surface the error of the failed stage, the other stages were only cancelled
+            raise pipeline_errors.exceptions[0] from None
+
+        self.checkpoint = self.checkpoint.model_copy(update={"completed": True, "updated_at": time.time()})
+        await self._save(self.checkpoint)
+        self.on_progress(self.progress)
+        logger.info("Mirrored %d cards in %.1fs", self.progress.cards, self.progress.elapsed)
+        return self.progress
+
+    async def _load_checkpoint(self, restart: bool) -> CatalogCheckpoint:
+        stored_checkpoints = await self.database.get_objects(
+            object_type=CatalogCheckpoint, filters={"id": MTGIO_CARDS_CATALOG}
+        )
+        if stored_checkpoints and not restart:
+            checkpoint = CatalogCheckpoint(**stored_checkpoints[0].__dict__)
+            if not checkpoint.completed:
+                logger.info("Resuming interrupted catalog mirror after page %d", checkpoint.last_page)
+                return checkpoint
+        return CatalogCheckpoint(id=MTGIO_CARDS_CATALOG)
+
+    async def _save(self, *instances: pydantic.BaseModel) -> None:
+        try:
+            await self.database.upsert_many(instances)
+        except Exception as page_write_error:
+            raise CatalogMirrorError(
+                f"Could not write page {self.progress.last_page + 1} of the catalog: {page_write_error}"
+            ) from page_write_error
+
+    async def _fetch(self, start_page: int, parse_queue: asyncio.Queue[CatalogPage | None]) -> None:
+        async for catalog_page in self.mtgio_service.iterate_card_pages(start_page, self.concurrency):
+            await parse_queue.put(catalog_page)
+        await parse_queue.put(None)
+
+    async def _parse(
+        self, parse_queue: asyncio.Queue[CatalogPage | None], convert_queue: asyncio.Queue[_ParsedPage | None]
+    ) -> None:
+        while (catalog_page := await parse_queue.get()) is not None:
+            parsed_cards = []
+            for card_payload in catalog_page.cards:
+                try:
+                    parsed_cards.append(MTGIOCard.from_api_payload(card_payload))
+                except (pydantic.ValidationError, KeyError, IndexError, TypeError) as parsing_error:
+                    logger.warning("Skipping malformed card %s: %s", card_payload.get("id"), parsing_error)
+            await convert_queue.put(
+                _ParsedPage(catalog_page, parsed_cards, len(catalog_page.cards) - len(parsed_cards))
+            )
+        await convert_queue.put(None)
+
+    async def _convert(
+        self, convert_queue: asyncio.Queue[_ParsedPage | None], write_queue: asyncio.Queue[_ConvertedPage | None]
+    ) -> None:
+        while (parsed_page := await convert_queue.get()) is not None:
+            converted_cards = []
+            for parsed_card in parsed_page.cards:
+                try:
+                    converted_cards.append(MTGCard.from_mtgio_card(parsed_card))
+                except (pydantic.ValidationError, IndexError) as conversion_error:
+                    logger.warning("Skipping unconvertible card %s: %s", parsed_card.id, conversion_error)
+            skipped_cards = parsed_page.skipped_cards + len(parsed_page.cards) - len(converted_cards)
+            await write_queue.put(_ConvertedPage(parsed_page.catalog_page, converted_cards, skipped_cards))
+            # Yield to the event loop between pages, conversion is CPU-bound
+            await asyncio.sleep(0)
+        await write_queue.put(None)
+
+    async def _write(self, write_queue: asyncio.Queue[_ConvertedPage | None]) -> None:
+        while (converted_page := await write_queue.get()) is not None:
+            catalog_page = converted_page.catalog_page
+            written_at = time.time()
+            page_checkpoint = self.checkpoint.model_copy(
+                update={
+                    "last_page": catalog_page.number,
+                    "total_pages": catalog_page.total_pages or self.checkpoint.total_pages,
+                    "cards": self.checkpoint.cards + len(converted_page.cards),
+                    "updated_at": written_at,
+                }
+            )
+            validators = [CardValidators(id=card.id, refreshed_at=written_at) for card in converted_page.cards]
+            await self._save(*converted_page.cards, *validators, page_checkpoint)
+            self.checkpoint = page_checkpoint
+
+            self.progress.last_page = catalog_page.number
+            self.progress.total_pages = page_checkpoint.total_pages
+            self.progress.cards += len(converted_page.cards)
+            self.progress.skipped_cards += converted_page.skipped_cards
+            if time.monotonic() - self._last_report >= self.report_interval:
+                self._last_report = time.monotonic()
+                self.on_progress(self.progress)
+
+
+@dataclasses.dataclass
+class CatalogSync:
+    """
+    Adds the cards of new or recently released sets to an already mirrored catalog.
+
+    The upstream set list is compared against the sets recorded by the previous run: sets never synced
+    before and sets released within ``recent_days`` have their cards fetched page by page and upserted, so
+    repeating a run only overwrites the same entries. A first run after a completed catalog mirror treats
+    the sets released before the mirror finished as already synced.
+    """
+
+    mtgio_service: MTGIOAPIService
+    database: PostgresDatabaseService
+    recent_days: int = 30
+    concurrency: int = 4
+
+    async def run(self) -> CatalogSyncRun:
+        """
+        Sync the cards of new or recently released sets.
+
+        :return: Duration, row counts and upstream calls of the run, also stored in the database.
+        :raises httpx.HTTPError: If the set list cannot be fetched from MTGIO.
+        """
+        for model in (MTGCard, CardValidators, MTGSet, CatalogCheckpoint, CatalogSyncWatermark, CatalogSyncRun):
+            await self.database.register(model=model)
+        started_at = time.time()
+        sync_run = CatalogSyncRun(id=f"{MTGIO_SETS_CATALOG}-{started_at:.0f}", started_at=started_at)
+
+        upstream_sets = await self.mtgio_service.get_sets(refresh=True)
+        sync_run.upstream_calls += 1
+        sync_run.sets_checked = len(upstream_sets)
+        watermark = await self._load_watermark(upstream_sets)
+        sets_to_sync = self._select_sets(upstream_sets, watermark)
+        logger.info("Syncing %d of %d sets", len(sets_to_sync), len(upstream_sets))
+
+        concurrency_limit = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def _sync_set_limited(mtg_set: MTGSet) -> bool:
+            async with concurrency_limit:
+                return await self._sync_set(mtg_set, sync_run)
+
+        synced_sets = await asyncio.gather(*(_sync_set_limited(mtg_set) for mtg_set in sets_to_sync))
+        synced_set_codes = {mtg_set.id for mtg_set, synced in zip(sets_to_sync, synced_sets, strict=True) if synced}
+        sync_run.sets_synced = len(synced_set_codes)
+        sync_run.sets_failed = len(sets_to_sync) - len(synced_set_codes)
+
+        finished_at = time.time()
+        sync_run.duration = finished_at - started_at
+        watermark = watermark.model_copy(
+            update={"synced_sets": sorted({*watermark.synced_sets, *synced_set_codes}), "synced_at": finished_at}
+        )
+        try:
+            await self.database.upsert_many([*upstream_sets, watermark, sync_run])
+        except Exception as outcome_write_error:
+            logger.exception(
+                "Could not store the outcome of catalog sync run %s", sync_run.id, exc_info=outcome_write_error
+            )
+        logger.info(
+            "Synced %d sets (%d failed), %d cards (%d skipped) with %d upstream calls in %.1fs",
+            sync_run.sets_synced,
+            sync_run.sets_failed,
+            sync_run.cards_written,
+            sync_run.cards_skipped,
+            sync_run.upstream_calls,
+            sync_run.duration,
+        )
+        return sync_run
+
+    async def seconds_until_due(self, interval: float) -> float:
+        """
+        Time left until the next run is due, based on the end of the last stored run.
+        """
+        await self.database.register(model=CatalogSyncWatermark)
+        stored_watermarks = await self.database.get_objects(
+            object_type=CatalogSyncWatermark, filters={"id": MTGIO_SETS_CATALOG}
+        )
+        if not stored_watermarks:
+            return 0.0
+        watermark = CatalogSyncWatermark(**stored_watermarks[0].__dict__)
+        return max(watermark.synced_at + interval - time.time(), 0.0)
+
+    async def _load_watermark(self, upstream_sets: list[MTGSet]) -> CatalogSyncWatermark:
+        stored_watermarks = await self.database.get_objects(
+            object_type=CatalogSyncWatermark, filters={"id": MTGIO_SETS_CATALOG}
+        )
+        if stored_watermarks:
+            return CatalogSyncWatermark(**stored_watermarks[0].__dict__)
+
+        stored_checkpoints = await self.database.get_objects(
+            object_type=CatalogCheckpoint, filters={"id": MTGIO_CARDS_CATALOG}
+        )
+        mirror_checkpoint = CatalogCheckpoint(**stored_checkpoints[0].__dict__) if stored_checkpoints else None
+        if mirror_checkpoint is None or not mirror_checkpoint.completed:
+            logger.info("No mirrored catalog found, syncing every set")
+            return CatalogSyncWatermark(id=MTGIO_SETS_CATALOG)
+
+        mirrored_until = datetime.datetime.fromtimestamp(mirror_checkpoint.updated_at, tz=datetime.UTC).date()
+        return CatalogSyncWatermark(
+            id=MTGIO_SETS_CATALOG,
+            synced_sets=sorted(
+                mtg_set.id
+                for mtg_set in upstream_sets
+                if mtg_set.release_date and mtg_set.release_date <= mirrored_until.isoformat()
+            ),
+            synced_at=mirror_checkpoint.updated_at,
+        )
+
+    def _select_sets(self, upstream_sets: list[MTGSet], watermark: CatalogSyncWatermark) -> list[MTGSet]:
+        synced_set_codes = set(watermark.synced_sets)
+        recent_since = (datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=self.recent_days)).date()
+        return [
+            mtg_set
+            for mtg_set in upstream_sets
+            if mtg_set.id not in synced_set_codes or mtg_set.release_date >= recent_since.isoformat()
+        ]
+
+    async def _sync_set(self, mtg_set: MTGSet, sync_run: CatalogSyncRun) -> bool:
+        page = 1
+        total_pages: int | None = None
+        try:
+            while total_pages is None or page <= total_pages:
+                catalog_page = await self.mtgio_service.get_cards_page(page, set_code=mtg_set.id)
+                sync_run.upstream_calls += 1
+                if not catalog_page.cards:
+                    break
+                total_pages = catalog_page.total_pages or total_pages
+                cards, skipped_cards = convert_card_payloads(catalog_page.cards)
+                refreshed_at = time.time()
+                validators = [CardValidators(id=card.id, refreshed_at=refreshed_at) for card in cards]
+                try:
+                    await self.database.upsert_many([*cards, *validators])
+                except Exception as page_write_error:
+                    logger.exception("Could not write page %d of set %s", page, mtg_set.id, exc_info=page_write_error)
+                    return False
+                sync_run.cards_written += len(cards)
+                sync_run.cards_skipped += skipped_cards
+                page += 1
+        except (UpstreamUnavailableError, httpx.HTTPError) as set_retrieval_error:
+            logger.warning("Could not fetch cards of set %s: %s", mtg_set.id, set_retrieval_error)
+            return False
+        return True
+
+
+def convert_card_payloads(card_payloads: list[MTGIOCardPayload]) -> tuple[list[MTGCard], int]:
+    """
+    Convert raw MTGIO card payloads, skipping malformed ones.
+
+    :return: The converted cards and the number of skipped payloads.
+    """
+    converted_cards = []
+    for card_payload in card_payloads:
+        try:
+            converted_cards.append(MTGCard.from_mtgio_card(MTGIOCard.from_api_payload(card_payload)))
+        except (pydantic.ValidationError, KeyError, IndexError, TypeError) as conversion_error:
+            logger.warning("Skipping malformed card %s: %s", card_payload.get("id"), conversion_error)
+    return converted_cards, len(card_payloads) - len(converted_cards)
+
+
+@dataclasses.dataclass
+class CatalogSyncService(AbstractAsyncService, config=CatalogSyncConfiguration):
+    """
+    Runs the incremental catalog sync in the background every configured interval.
+    """
+
+    interval: int = dataclasses.field(init=False, default=0)
+    recent_days: int = dataclasses.field(init=False, default=30)
+    concurrency: int = dataclasses.field(init=False, default=4)
+    last_run: CatalogSyncRun | None = dataclasses.field(init=False, default=None)
+    _task: asyncio.Task[None] | None = dataclasses.field(init=False, default=None, repr=False)
+
+    async def initialize(self, config: CatalogSyncConfiguration) -> None:  # type: ignore
+        self.interval = config.interval
+        self.recent_days = config.recent_days
+        self.concurrency = config.concurrency
+
+    @inject
+    def start(
+        self,
+        mtgio_service: MTGIOAPIService = Provide[AuxiliaryServiceNames.MTGIO],
+        database: PostgresDatabaseService = Provide[AuxiliaryServiceNames.DATABASE],
+    ) -> None:
+        """
+        Schedule the sync runs on the running event loop. Does nothing if the sync is disabled.
+        """
+        if self.interval <= 0 or self._task is not None:
+            return
+        catalog_sync = CatalogSync(
+            mtgio_service=mtgio_service,
+            database=database,
+            recent_days=self.recent_days,
+            concurrency=self.concurrency,
+        )
+        self._task = asyncio.get_running_loop().create_task(self._run_periodically(catalog_sync))
+        logger.info("Scheduled incremental catalog sync every %ds", self.interval)
+
+    async def stop(self) -> None:
+        """
+        Cancel the scheduled sync runs, including a run in progress.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run_periodically(self, catalog_sync: CatalogSync) -> None:
+        try:
+            delay = await catalog_sync.seconds_until_due(self.interval)
+        except Exception as schedule_error:
+            logger.exception("Could not read the last catalog sync run", exc_info=schedule_error)
+            delay = self.interval
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                self.last_run = await catalog_sync.run()
+            except Exception as sync_error:
+                logger.exception("Incremental catalog sync failed", exc_info=sync_error)
+            delay = self.interval
@@ -0,0 +1,92 @@
+import asyncio
+import collections
+import dataclasses
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+FlightResult = TypeVar("FlightResult")
+
+
+@dataclasses.dataclass
+class SingleFlightStatistics:
+    """
+    Counters describing how many callers were absorbed by in-flight requests.
+    """
+
+    flights: int = 0
+    coalesced_callers: int = 0
+    max_coalesced_callers: int = 0
+    coalesced_callers_per_flight: collections.Counter[int] = dataclasses.field(default_factory=collections.Counter)
+
+    def record(self, coalesced_callers: int) -> None:
+        self.flights += 1
+        self.coalesced_callers += coalesced_callers
+        self.max_coalesced_callers = max(self.max_coalesced_callers, coalesced_callers)
+        self.coalesced_callers_per_flight[coalesced_callers] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "flights": self.flights,
+            "coalesced_callers": self.coalesced_callers,
+            "max_coalesced_callers": self.max_coalesced_callers,
+            "coalesced_callers_per_flight": {
+                str(callers): flights for callers, flights in sorted(self.coalesced_callers_per_flight.items())
+            },
+        }
+
+
+@dataclasses.dataclass
+class _Flight(Generic[FlightResult]):
+    task: asyncio.Task[FlightResult]
+    coalesced_callers: int = 0
+
+
+@dataclasses.dataclass
+class SingleFlight(Generic[FlightResult]):
+    """
+    In-flight request table that lets concurrent callers with the same key share a single execution.
+
+    The first caller for a key starts the work as a separate task; every caller arriving before it finishes
+    awaits the same task instead of starting its own. Cancelling one of the callers does not cancel the
+    shared work for the others.
+    """
+
+    statistics: SingleFlightStatistics = dataclasses.field(default_factory=SingleFlightStatistics)
+    _in_flight: dict[Hashable, _Flight[FlightResult]] = dataclasses.field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, work: Callable[[], Awaitable[FlightResult]]) -> FlightResult:
+        """
+        Run the work for the given key, or join the flight already running for it.
+
+        :param key: Hashable key identifying equivalent requests.
+        :param work: Coroutine factory executed only by the first caller for the key.
+        :return: The result shared by all callers of the flight.
+        """
+        flight = self._in_flight.get(key)
+        if flight is None:
+
+            async def _execute() -> FlightResult:
+                return await work()
+
+            flight = _Flight(task=asyncio.ensure_future(_execute()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key))
+        else:
+            flight.coalesced_callers += 1
+            logger.debug("Joined in-flight request for %s", key)
+        return await asyncio.shield(flight.task)
+
+    def _land(self, key: Hashable) -> None:
+        flight = self._in_flight.pop(key)
+        if not flight.task.cancelled():
+            # Mark the exception as retrieved even if every caller has been cancelled in the meantime
+            flight.task.exception()
+        self.statistics.record(flight.coalesced_callers)
+        if flight.coalesced_callers:
+            logger.info("Flight for %s absorbed %d concurrent callers", key, flight.coalesced_callers)
@@ -3,12 +3,13 @@ import asyncio
 import atexit
 import dataclasses
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any, TypeVar
 
 import sqlalchemy
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm.decl_api import DeclarativeBase
 
 from mtgapi.common.exceptions import DatabaseConnectionError
@@ -72,35 +73,51 @@ class AbstractDatabaseService(AbstractAsyncService, abc.ABC):
 class PostgresDatabaseService(AbstractDatabaseService, config=PostgresConfiguration):
     """
     PostgresSQL database service using SQLAlchemy as the ORM.
+    Every session checks out its own connection from the pool of the engine, so concurrent queries run in parallel.
+    Pydantic models are converted to SQLAlchemy models once, when registered, and looked up by name afterwards.
     """
 
-    client: AsyncConnection | None = dataclasses.field(default=None, init=False)
+    client: AsyncEngine | None = dataclasses.field(default=None, init=False)
     session: async_sessionmaker[AsyncSession] | None = dataclasses.field(default=None, init=False)
+    upsert_batch_size: int = dataclasses.field(default=500, init=False)
     _models_cache: dict[str, type[DeclarativeBase]] = dataclasses.field(default_factory=dict)
+    _registration_lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock, init=False, repr=False)
 
     async def connect(self, config: PostgresConfiguration) -> None:  # type: ignore
         """
-        Connects to the PostgreSQL database using the provided configuration.
+        Creates the pooled engine for the PostgreSQL database using the provided configuration
+        and checks that a connection can be established.
         """
-        logger.info("Initializing PostgreSQL connection.")
-        engine = create_async_engine(
+        logger.info("Initializing PostgreSQL connection pool.")
+        self.client = create_async_engine(
             url=config.connection_string,
+            isolation_level="AUTOCOMMIT",
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+            pool_timeout=config.pool_timeout,
         )
-        self.client = await engine.connect()
-        await self.client.execution_options(isolation_level="AUTOCOMMIT")
+        async with self.client.connect():
+            pass
         self.session = async_sessionmaker(bind=self.client)
-        logger.info("PostgreSQL connection established.")
+        self.upsert_batch_size = config.upsert_batch_size
+        logger.info(
+            "PostgreSQL connection pool established (%d connections, %d overflow).",
+            config.pool_size,
+            config.max_overflow,
+        )
 
         synchronous_disconnect_handler = lambda: asyncio.run(self.disconnect())  # noqa: E731
         atexit.register(synchronous_disconnect_handler)
 
     async def disconnect(self) -> None:
         """
-        Disconnects from the PostgreSQL database.
+        Disconnects from the PostgreSQL database, closing every pooled connection.
         """
-        logger.info("Disconnecting PostgreSQL connection.")
+        logger.info("Disconnecting PostgreSQL connection pool.")
         if self.client:
-            await self.client.close()
+            await self.client.dispose()
             self.client = None
             self.session = None
 
@@ -118,33 +135,39 @@ class PostgresDatabaseService(AbstractDatabaseService, config=PostgresConfigurat
             return result.fetchall()
 
     async def ensure_table(self, sql_table_model: type[DeclarativeBase]) -> None:
+        """
+        Creates the table of the model if it does not exist yet, and its declared indexes if they are missing,
+        so that indexes added to a model are also built for tables created before.
+        """
         if not self.session:
             raise RuntimeError("[DB] Database session is not initialized.")
+        table: sqlalchemy.Table = sql_table_model.__table__  # type: ignore[assignment]
         async with self.session.begin() as session:
             connection = await session.connection()
             await connection.run_sync(sql_table_model.metadata.create_all)
-            logger.info("Created new model for %s", sql_table_model.__name__)
+            for index in table.indexes:
+                await connection.execute(sqlalchemy.schema.CreateIndex(index, if_not_exists=True))
+            logger.info("Created new model for %s with %d indexes", sql_table_model.__name__, len(table.indexes))
 
     async def get_objects(
         self, object_type: type[BaseModel] | type[DeclarativeBase], filters: dict[str, Any] | None = None
     ) -> Sequence[Any]:
         """
         Retrieves objects from the database based on the provided object type and filters.
-        This method supports both SQLAlchemy models and Pydantic models by converting the latter to SQLAlchemy base models.
+        This method supports both SQLAlchemy models and Pydantic models, the latter resolved to their registered
+        SQLAlchemy models.
 
         :param object_type: Data model type to retrieve from the database.
         :param filters: Optional dictionary of filters to apply to the query in form of kwargs passed to .filter_by method
         :return: Sequence of retrieved Postgres members
         """
-        compatible_object_type = (
-            object_type
-            if not issubclass(object_type, BaseModel)
-            else convert_pydantic_model_to_sqlalchemy_base(object_type)
-        )
-
         if not self.session:
             raise RuntimeError("[DB] Database session is not initialized.")
 
+        compatible_object_type = (
+            object_type if not issubclass(object_type, BaseModel) else await self.sql_model_of(object_type)
+        )
+
         query = sqlalchemy.select(compatible_object_type)
         if filters:
             query = query.filter_by(**filters)
@@ -154,32 +177,145 @@ class PostgresDatabaseService(AbstractDatabaseService, config=PostgresConfigurat
             session.expunge_all()
             return list(result.scalars().all())
 
-    async def insert(self, instance: BaseModel) -> bool:
+    async def get_objects_with(
+        self, object_type: type[BaseModel], joined_type: type[BaseModel], filters: dict[str, Any] | None = None
+    ) -> Sequence[tuple[Any, Any | None]]:
+        """
+        Retrieves objects together with the entries of another model stored under the same primary key, in a single
+        query (LEFT OUTER JOIN on ``id``), e.g. cached cards with the validators stored next to them.
+
+        :param object_type: Data model type to retrieve from the database.
+        :param joined_type: Data model type of the entries stored next to the retrieved objects.
+        :param filters: Optional dictionary of equality filters on the fields of ``object_type``
+        :return: Sequence of retrieved Postgres members paired with their joined entries, None if they have none
+        """
         if not self.session:
             raise RuntimeError("[DB] Database session is not initialized.")
 
+        sql_model = await self.sql_model_of(object_type)
+        joined_sql_model = await self.sql_model_of(joined_type)
+        table: sqlalchemy.Table = sql_model.__table__  # type: ignore[assignment]
+        joined_table: sqlalchemy.Table = joined_sql_model.__table__  # type: ignore[assignment]
+
+        query = sqlalchemy.select(sql_model, joined_sql_model).outerjoin(
+            joined_sql_model, joined_table.c.id == table.c.id
+        )
+        if filters:
+            query = query.where(*(table.c[field] == value for field, value in filters.items()))
+
         async with self.session.begin() as session:
-            connection = await session.connection()
+            result = await session.execute(query)
+            session.expunge_all()
+            return [(stored_object, joined_entry) for stored_object, joined_entry in result.all()]
+
+    async def insert_many(self, instances: Sequence[BaseModel], batch_size: int = 1000) -> int:
+        """
+        Bulk-inserts instances of registered models with multi-row INSERT statements.
+        Instances whose primary key is already stored are skipped.
 
-            instance_data = instance.model_dump()
-            new_entry = self._models_cache[instance.__class__.__name__](**instance_data)
+        :param instances: Instances to insert, may mix several registered models.
+        :param batch_size: Number of rows sent per INSERT statement.
+        :return: Number of inserted rows.
+        """
+        if not self.session:
+            raise RuntimeError("[DB] Database session is not initialized.")
+
+        rows_per_model: dict[type[BaseModel], list[dict[str, Any]]] = {}
+        for instance in instances:
+            rows_per_model.setdefault(type(instance), []).append(instance.model_dump(mode="json"))
+        sql_models = {model: await self.sql_model_of(model) for model in rows_per_model}
+
+        inserted_rows = 0
+        async with self.session.begin() as session:
+            for model, rows in rows_per_model.items():
+                table: sqlalchemy.Table = sql_models[model].__table__  # type: ignore[assignment]
+                statement = postgresql.insert(table).on_conflict_do_nothing(index_elements=["id"]).returning(table.c.id)
+                for offset in range(0, len(rows), batch_size):
+                    result = await session.execute(statement, rows[offset : offset + batch_size])
+                    inserted_rows += len(result.all())
+        return inserted_rows
+
+    async def upsert(self, instance: BaseModel) -> bool:
+        """
+        Inserts the instance or overwrites the stored entry with the same primary key in a single statement,
+        so concurrent writes of the same entry do not conflict.
+        """
+        try:
+            await self.upsert_many(instances=[instance])
+        except Exception as entry_upsert_error:
+            logger.exception("Failed to upsert instance", exc_info=entry_upsert_error)
+            return False
+        else:
+            return True
+
+    async def upsert_many(self, instances: Sequence[BaseModel], batch_size: int | None = None) -> int:
+        """
+        Bulk-inserts instances of registered models with multi-row INSERT ... ON CONFLICT (id) DO UPDATE statements,
+        overwriting the stored entries with the same primary keys.
+        Of several instances with the same primary key, the last one is written. Rows are written in primary key order,
+        so concurrent upserts of overlapping entries lock them in the same order instead of deadlocking.
+
+        :param instances: Instances to upsert, may mix several registered models.
+        :param batch_size: Number of rows sent per statement, defaults to the configured upsert batch size.
+        :return: Number of upserted rows.
+        """
+        if not self.session:
+            raise RuntimeError("[DB] Database session is not initialized.")
 
-            if not connection:
-                raise RuntimeError("[DB] Database session is not initialized.")
+        rows_per_model: dict[type[BaseModel], dict[Any, dict[str, Any]]] = {}
+        for instance in instances:
+            row = instance.model_dump(mode="json")
+            rows_per_model.setdefault(type(instance), {})[row["id"]] = row
+        sql_models = {model: await self.sql_model_of(model) for model in rows_per_model}
+        batch_size = batch_size or self.upsert_batch_size
 
-            try:
-                session.add(new_entry)
-                await session.commit()
-            except Exception as entry_insertion_error:
-                logger.exception("Failed to insert instance", exc_info=entry_insertion_error)
-                await session.rollback()
-                return False
-            else:
-                return True
+        upserted_rows = 0
+        async with self.session.begin() as session:
+            for model, rows_by_id in rows_per_model.items():
+                table: sqlalchemy.Table = sql_models[model].__table__  # type: ignore[assignment]
+                insert_statement = postgresql.insert(table)
+                statement = insert_statement.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={
+                        column.name: insert_statement.excluded[column.name]
+                        for column in table.columns
+                        if column.name != "id"
+                    },
+                ).returning(table.c.id)
+                rows = [rows_by_id[row_id] for row_id in sorted(rows_by_id)]
+                for offset in range(0, len(rows), batch_size):
+                    result = await session.execute(statement, rows[offset : offset + batch_size])
+                    upserted_rows += len(result.all())
+        return upserted_rows
 
     async def register(self, model: type[BaseModel]) -> None:
-        if model.__name__ not in self._models_cache:
+        """
+        Converts the model to a SQLAlchemy model and creates its table, unless the model is already registered.
+        Registrations are serialized, so concurrent first uses of a model do not race on CREATE TABLE.
+        """
+        if model.__name__ in self._models_cache:
+            return
+        async with self._registration_lock:
+            if model.__name__ in self._models_cache:
+                return
             sql_model = convert_pydantic_model_to_sqlalchemy_base(model)
             await self.ensure_table(sql_table_model=sql_model)
             logger.info("Registered model %s as %s", model.__name__, sql_model.__name__)
             self._models_cache[model.__name__] = sql_model
+
+    async def register_models(self, models: Iterable[type[BaseModel]]) -> None:
+        """
+        Registers several models up front, e.g. at startup, so that queries never convert models on the request path.
+        """
+        for model in models:
+            await self.register(model=model)
+
+    async def sql_model_of(self, model: type[BaseModel]) -> type[DeclarativeBase]:
+        """
+        Returns the SQLAlchemy model registered for the Pydantic model, registering the model first if needed.
+        """
+        sql_model = self._models_cache.get(model.__name__)
+        if sql_model is None:
+            await self.register(model=model)
+            sql_model = self._models_cache[model.__name__]
+        return sql_model
@@ -0,0 +1,78 @@
+import dataclasses
+import time
+from typing import Any, Self
+
+from mtgapi.config.settings.base import HealthScoringConfigurationBase
+
+
+@dataclasses.dataclass(frozen=True)
+class HealthPolicy:
+    """
+    How outcomes of interchangeable upstreams (proxies, card providers) are smoothed and when an upstream is ejected.
+    """
+
+    consecutive_failures_to_eject: int = 3
+    error_rate_to_eject: float = 0.5
+    ejection_duration: float = 30.0
+    smoothing_factor: float = 0.2
+
+    @classmethod
+    def from_config(cls, config: HealthScoringConfigurationBase) -> Self:
+        return cls(
+            consecutive_failures_to_eject=config.consecutive_failures_to_eject,
+            error_rate_to_eject=config.error_rate_to_eject,
+            ejection_duration=config.ejection_duration,
+            smoothing_factor=config.smoothing_factor,
+        )
+
+
+@dataclasses.dataclass
+class UpstreamHealth:
+    """
+    Smoothed latency and error rate of a single upstream, used to rank interchangeable upstreams.
+    """
+
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency: float = 0.0
+    error_rate: float = 0.0
+    ejections: int = 0
+    ejected_until: float = 0.0
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > time.monotonic()
+
+    @property
+    def score(self) -> float:
+        """Expected cost of using the upstream; lower is healthier."""
+        return self.latency * (1 + self.error_rate) + self.error_rate
+
+    def record(self, latency: float, failed: bool, policy: HealthPolicy) -> bool:
+        """
+        Fold the outcome of a call into the smoothed latency and error rate, ejecting the upstream once it fails
+        ``consecutive_failures_to_eject`` times in a row or its error rate reaches ``error_rate_to_eject``.
+
+        :return: Whether the upstream was ejected by this outcome.
+        """
+        self.latency += policy.smoothing_factor * (latency - self.latency)
+        self.error_rate += policy.smoothing_factor * (float(failed) - self.error_rate)
+        if not failed:
+            self.consecutive_failures = 0
+            return False
+
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.ejected or (
+            self.consecutive_failures < policy.consecutive_failures_to_eject
+            and self.error_rate < policy.error_rate_to_eject
+        ):
+            return False
+        self.ejected_until = time.monotonic() + policy.ejection_duration
+        self.ejections += 1
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**dataclasses.asdict(self), "ejected": self.ejected, "score": self.score}
@@ -0,0 +1,124 @@
+import asyncio
+import collections
+import dataclasses
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+HedgedResult = TypeVar("HedgedResult")
+
+LATENCY_WINDOW_SIZE = 1000
+MINIMUM_LATENCY_SAMPLES = 20
+DELAY_REFRESH_INTERVAL = 10
+MAXIMUM_BUDGET_TOKENS = 10.0
+
+
+@dataclasses.dataclass
+class HedgingStatistics:
+    """
+    Counters describing how often hedged requests were sent and which attempt answered first.
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    hedge_losses: int = 0
+    budget_exhausted: int = 0
+    current_delay: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class RequestHedger:
+    """
+    Sends a second, identical attempt when the first one is slower than the configured latency percentile.
+
+    Whichever attempt answers first wins and the other one is cancelled. The hedging delay is the chosen
+    percentile of recently observed latencies (``initial_delay`` until enough samples are collected).
+    Every request earns ``budget`` hedge tokens and every hedge spends one, which caps the extra load
+    at roughly ``budget`` of the traffic.
+    """
+
+    percentile: float = 95.0
+    budget: float = 0.05
+    initial_delay: float = 1.0
+    statistics: HedgingStatistics = dataclasses.field(default_factory=HedgingStatistics)
+    _latencies: collections.deque[float] = dataclasses.field(
+        default_factory=lambda: collections.deque(maxlen=LATENCY_WINDOW_SIZE), repr=False
+    )
+    _samples_since_refresh: int = dataclasses.field(init=False, default=0, repr=False)
+    _budget_tokens: float = dataclasses.field(init=False, default=0.0, repr=False)
+
+    def __post_init__(self) -> None:
+        self.statistics.current_delay = self.initial_delay
+
+    @property
+    def delay(self) -> float:
+        return self.statistics.current_delay
+
+    def record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._samples_since_refresh += 1
+        if len(self._latencies) >= MINIMUM_LATENCY_SAMPLES and self._samples_since_refresh >= DELAY_REFRESH_INTERVAL:
+            ordered_latencies = sorted(self._latencies)
+            percentile_index = min(
+                len(ordered_latencies) - 1, math.ceil(self.percentile / 100 * len(ordered_latencies)) - 1
+            )
+            self.statistics.current_delay = ordered_latencies[max(percentile_index, 0)]
+            self._samples_since_refresh = 0
+
+    def _spend_budget(self) -> bool:
+        if self._budget_tokens < 1:
+            return False
+        self._budget_tokens -= 1
+        return True
+
+    async def run(self, attempt: Callable[[], Awaitable[HedgedResult]]) -> HedgedResult:
+        """
+        Run the attempt, hedging it with a second one if it does not finish within the hedging delay.
+
+        :param attempt: Factory of a single attempt, called once or twice.
+        :return: The result of the first successful attempt.
+        """
+        self.statistics.requests += 1
+        self._budget_tokens = min(MAXIMUM_BUDGET_TOKENS, self._budget_tokens + self.budget)
+        started_at = time.monotonic()
+
+        async def _attempt() -> HedgedResult:
+            return await attempt()
+
+        primary = asyncio.ensure_future(_attempt())
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.delay)
+            if not done:
+                if self._spend_budget():
+                    self.statistics.hedges += 1
+                    logger.debug("Request slower than %.3fs, sending hedged request", self.delay)
+                    attempts.append(asyncio.ensure_future(_attempt()))
+                else:
+                    self.statistics.budget_exhausted += 1
+
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished.exception() is not None:
+                        continue
+                    if len(attempts) > 1:
+                        if finished is primary:
+                            self.statistics.hedge_losses += 1
+                        else:
+                            self.statistics.hedge_wins += 1
+                    self.record_latency(time.monotonic() - started_at)
+                    return finished.result()
+            return primary.result()
+        finally:
+            for unfinished in attempts:
+                unfinished.cancel()
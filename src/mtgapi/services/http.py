@@ -1,9 +1,11 @@
 import abc
+import asyncio
 import dataclasses
 import logging
+import time
 from collections.abc import Callable, Coroutine
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 import tenacity
@@ -12,10 +14,21 @@ from dependency_injector.wiring import Provide, inject
 from mtgapi.config.settings.base import AsyncHTTPServiceConfigurationBase
 from mtgapi.services import AuxiliaryServiceNames
 from mtgapi.services.base import AbstractAsyncService
-from mtgapi.services.proxy import AbstractProxyService, NullProxyService
+from mtgapi.services.breaker import CircuitBreaker, CircuitStateListener
+from mtgapi.services.hedging import RequestHedger
+from mtgapi.services.proxy import AbstractProxyService, NullProxyService, Proxy
+from mtgapi.services.retrying import (
+    PROCESS_RETRY_BUDGET,
+    RetryBudget,
+    retry_if_retryable_and_budgeted,
+    wait_retry_after,
+)
+from mtgapi.services.throttling import AdaptiveRateLimiter
 
 logger = logging.getLogger(__name__)
 
+PROXY_FAILURE_STATUS_CODES = frozenset({httpx.codes.PROXY_AUTHENTICATION_REQUIRED, httpx.codes.TOO_MANY_REQUESTS})
+
 
 @dataclasses.dataclass
 class AbstractAsyncHTTPClientService(AbstractAsyncService, abc.ABC):
@@ -25,8 +38,20 @@ class AbstractAsyncHTTPClientService(AbstractAsyncService, abc.ABC):
 
     base_url: str = dataclasses.field(init=False)
     _proxy_provider: AbstractProxyService | None = dataclasses.field(init=False, repr=False)
-    __client: Callable[[], Coroutine[None, None, httpx.AsyncClient]] | None = dataclasses.field(init=False, repr=False)
+    __spawn_client: Callable[[Proxy | None], Coroutine[None, None, httpx.AsyncClient]] | None = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+    __clients: dict[Proxy | None, httpx.AsyncClient] = dataclasses.field(init=False, default_factory=dict, repr=False)
+    __client_lock: asyncio.Lock = dataclasses.field(init=False, default_factory=asyncio.Lock, repr=False)
     __follow_redirects: bool = dataclasses.field(init=False, default=True)
+    rate_limiter: AdaptiveRateLimiter = dataclasses.field(init=False, repr=False)
+    circuit_breakers: dict[str, CircuitBreaker] = dataclasses.field(init=False, default_factory=dict, repr=False)
+    circuit_state_listeners: list[CircuitStateListener] = dataclasses.field(
+        init=False, default_factory=list, repr=False
+    )
+    __circuit_breaker_factory: Callable[[str], CircuitBreaker] = dataclasses.field(init=False, repr=False)
+    hedger: RequestHedger | None = dataclasses.field(init=False, default=None, repr=False)
+    retry_budget: RetryBudget = dataclasses.field(init=False, default_factory=lambda: PROCESS_RETRY_BUDGET, repr=False)
 
     @abc.abstractmethod
     def construct_headers(self, config: AsyncHTTPServiceConfigurationBase) -> dict[str, str]:
@@ -57,6 +82,15 @@ class AbstractAsyncHTTPClientService(AbstractAsyncService, abc.ABC):
         """
         return False
 
+    def remaining_rate_limit(self, response: httpx.Response) -> int | None:  # noqa: ARG002
+        """
+        Read the remaining request quota reported by the upstream.
+
+        :param response: The HTTP response to inspect.
+        :return: The number of requests left in the quota window, or None if the upstream does not report it.
+        """
+        return None
+
     @inject
     def get_proxy_provider(
         self,
@@ -70,84 +104,219 @@ class AbstractAsyncHTTPClientService(AbstractAsyncService, abc.ABC):
     async def initialize(self, config: AsyncHTTPServiceConfigurationBase) -> None:  # type: ignore
         self._proxy_provider = self.get_proxy_provider()
         self.__follow_redirects = config.follow_redirects
+        self.retry_budget.configure(ratio=config.retry_budget_ratio, reserve=config.retry_budget_reserve)
         retry_strategy = tenacity.retry(
             stop=tenacity.stop_after_attempt(config.retries),
-            wait=tenacity.wait_exponential(
-                multiplier=config.exponential_backoff,
-                min=config.minimum_wait,
-                max=config.maximum_wait,
+            wait=wait_retry_after(
+                fallback=tenacity.wait_exponential(
+                    multiplier=config.exponential_backoff,
+                    min=config.minimum_wait,
+                    max=config.maximum_wait,
+                )
             ),
             reraise=config.reraise_exceptions,
-            retry=tenacity.retry_if_exception_type(httpx.HTTPError),
+            retry=retry_if_retryable_and_budgeted(
+                budget=self.retry_budget,
+                max_attempts=config.retries,
+                maximum_wait=config.maximum_wait,
+            ),
+            before=self.__count_first_attempt,
         )
         self.base_url = config.base_url
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate=config.rate_limit,
+            burst=config.rate_limit_burst,
+            max_wait=config.rate_limit_max_wait,
+            slowdown_threshold=config.rate_limit_slowdown_threshold,
+        )
 
-        async def __spawn_client() -> httpx.AsyncClient:
+        self.__circuit_breaker_factory = lambda upstream: CircuitBreaker(
+            name=upstream,
+            failure_threshold=config.circuit_breaker_failure_threshold,
+            recovery_timeout=config.circuit_breaker_recovery_timeout,
+            listeners=self.circuit_state_listeners,
+        )
+        if config.hedging:
+            self.hedger = RequestHedger(
+                percentile=config.hedge_percentile,
+                budget=config.hedge_budget,
+                initial_delay=config.hedge_initial_delay,
+            )
+        connection_limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+
+        async def __spawn_client(configured_proxy: Proxy | None) -> httpx.AsyncClient:
             """
-            Create an instance of httpx.AsyncClient with the provided configuration.
+            Create an instance of httpx.AsyncClient with the provided configuration, routed through the given proxy.
             """
-            if self._proxy_provider is None:
-                logger.warning("Proxy provider is not initialized. Using no proxy.")
-                return httpx.AsyncClient(
-                    timeout=httpx.Timeout(config.timeout),
-                    headers=self.construct_headers(config),
-                    auth=self.construct_auth(config),
-                )
-            proxy = await self._proxy_provider.get_proxy()
-
-            if proxy is None or (not proxy.http and not proxy.https):
+            proxy: httpx.Proxy | None = None
+            if configured_proxy is None:
                 logger.info("No proxy configured. Connecting directly.")
-                return httpx.AsyncClient(
-                    timeout=httpx.Timeout(config.timeout),
-                    headers=self.construct_headers(config),
-                    auth=self.construct_auth(config),
-                )
+            else:
+                proxy = configured_proxy.to_httpx_proxy()
 
             return httpx.AsyncClient(
                 timeout=httpx.Timeout(config.timeout),
                 headers=self.construct_headers(config),
                 auth=self.construct_auth(config),
-                proxy=proxy.to_httpx_proxy(),
+                limits=connection_limits,
+                http2=config.http2,
+                proxy=proxy,
             )
 
-        self.__client = __spawn_client
+        self.__spawn_client = __spawn_client
 
         self._request = retry_strategy(self._request)  # type: ignore
 
-    async def _request(self, verb: str, url: str, override_base: bool = False) -> httpx.Response:
+    def __count_first_attempt(self, retry_state: tenacity.RetryCallState) -> None:
+        if retry_state.attempt_number == 1:
+            self.retry_budget.record_first_attempt()
+
+    async def _select_proxy(self) -> Proxy | None:
+        """
+        Ask the proxy provider for the proxy of the next request.
+
+        :return: The proxy to route the request through, or None to connect directly.
+        """
+        if self._proxy_provider is None:
+            logger.warning("Proxy provider is not initialized. Using no proxy.")
+            return None
+        configured_proxy = await self._proxy_provider.get_proxy()
+        if configured_proxy is None or (not configured_proxy.http and not configured_proxy.https):
+            return None
+        return configured_proxy
+
+    async def _get_client(self, proxy: Proxy | None = None) -> httpx.AsyncClient:
+        """
+        Return the pooled client of this service for the given proxy, spawning it on first use.
+
+        Every proxy gets its own long-lived client, so rotating between proxies reuses warm connections.
+        Clients are created lazily so that they bind to the event loop that actually sends the requests.
+
+        :param proxy: The proxy the client routes requests through, or None for direct connections.
+        :return: The long-lived httpx.AsyncClient instance.
+        """
+        if not self.__spawn_client:
+            raise RuntimeError("[HTTP] Client was not initialized.")
+        client = self.__clients.get(proxy)
+        if client is not None and not client.is_closed:
+            return client
+        async with self.__client_lock:
+            client = self.__clients.get(proxy)
+            if client is None or client.is_closed:
+                client = self.__clients[proxy] = await self.__spawn_client(proxy)
+                logger.info("Spawned pooled HTTP client for %s (proxy: %s)", self.__class__.__name__, proxy)
+        return client
+
+    def get_circuit_breaker(self, url: str) -> CircuitBreaker:
+        """
+        Return the circuit breaker guarding the upstream host of the given URL.
+
+        :param url: Absolute URL of the request.
+        :return: The circuit breaker shared by all requests sent to the same host.
+        """
+        upstream = urlsplit(url).netloc
+        if upstream not in self.circuit_breakers:
+            self.circuit_breakers[upstream] = self.__circuit_breaker_factory(upstream)
+        return self.circuit_breakers[upstream]
+
+    async def _request(
+        self,
+        verb: str,
+        url: str,
+        override_base: bool = False,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
         """
         Send an HTTP request using the configured client.
+        A 304 Not Modified answer to a conditional request is returned as is.
 
         :param verb: The HTTP method to use (e.g., 'GET', 'POST').
+        :param headers: Optional headers sent on top of the client headers.
+        :param stream: Return as soon as the headers arrive, leaving the body to be streamed by the caller.
         :return: The HTTP response.
         """
         full_url = urljoin(self.base_url, url) if not override_base else url
-        if not self.__client:
-            raise RuntimeError("[HTTP] Client was not initialized.")
-        async with await self.__client() as spawned_client:
-            response = await spawned_client.request(verb, full_url, follow_redirects=self.__follow_redirects)
+        proxy = await self._select_proxy()
+        client = await self._get_client(proxy)
+        circuit_breaker = self.get_circuit_breaker(full_url)
+        circuit_breaker.before_call()
+        try:
+            await self.rate_limiter.acquire()
+            sent_at = time.monotonic()
+            response = await client.send(
+                client.build_request(verb, full_url, headers=headers),
+                stream=stream,
+                follow_redirects=self.__follow_redirects,
+            )
+        except httpx.TransportError:
+            circuit_breaker.record_failure()
+            if proxy is not None and self._proxy_provider is not None:
+                self._proxy_provider.record_outcome(proxy, time.monotonic() - sent_at, failed=True)
+            raise
+        except BaseException:
+            circuit_breaker.record_abandoned_call()
+            raise
+        if response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        if proxy is not None and self._proxy_provider is not None:
+            self._proxy_provider.record_outcome(
+                proxy,
+                time.monotonic() - sent_at,
+                failed=response.status_code in PROXY_FAILURE_STATUS_CODES,
+            )
+
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            self.rate_limiter.observe(0)
+        else:
+            self.rate_limiter.observe(self.remaining_rate_limit(response))
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            if stream and response.is_error:
+                await response.aclose()
             response.raise_for_status()
-            return response
+        return response
 
     async def disconnect(self) -> None:
         """
-        Disconnect the HTTP client.
+        Disconnect the HTTP clients and close their pooled connections.
         """
-        if self.__client:
-            self.__client = None
-        else:
+        if not self.__spawn_client:
             raise RuntimeError("Client is not initialized or already closed.")
+        for client in self.__clients.values():
+            await client.aclose()
+        self.__clients.clear()
+        self.__spawn_client = None
 
     # HTTP methods
 
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         """
         Send a GET request to the specified URL.
+        With hedging enabled, a slow request is raced against an identical one and the loser is cancelled.
 
         :param url: The URL to send the GET request to.
         :return: The HTTP response.
         """
-        return await self._request("GET", url, **kwargs)
+        if self.hedger is None:
+            return await self._request("GET", url, **kwargs)
+        return await self.hedger.run(lambda: self._request("GET", url, **kwargs))
+
+    async def get_stream(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a GET request and return once the response headers arrive.
+        The body is not read; the caller iterates it and must close the response with ``aclose``.
+        Streamed requests are never hedged, as a losing attempt could leave an open response behind.
+
+        :param url: The URL to send the GET request to.
+        :return: The HTTP response with an unread body.
+        """
+        return await self._request("GET", url, stream=True, **kwargs)
 
     async def post(self, url: str, **kwargs: Any) -> httpx.Response:
         """
@@ -0,0 +1,430 @@
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import dataclasses
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import tempfile
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterable
+from enum import StrEnum
+from typing import Any
+
+from PIL import Image
+
+from mtgapi.config.settings.services import ImageCacheConfiguration
+from mtgapi.services.base import AbstractAsyncService
+from mtgapi.services.coalescing import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIRECTORY = "blobs"
+INDEX_DIRECTORY = "index"
+TEMPORARY_DIRECTORY = "tmp"
+FALLBACK_MEDIA_TYPE = "application/octet-stream"
+
+
+class ImageSize(StrEnum):
+    """
+    Sizes card image variants can be rendered in, each scaling the image down to a fixed width.
+    """
+
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+    @property
+    def width(self) -> int:
+        return IMAGE_WIDTHS[self]
+
+
+IMAGE_WIDTHS = {
+    ImageSize.SMALL: 146,
+    ImageSize.MEDIUM: 244,
+    ImageSize.LARGE: 488,
+}
+
+
+class ImageFormat(StrEnum):
+    """
+    Formats card image variants can be converted to.
+    """
+
+    JPEG = "jpeg"
+    PNG = "png"
+    WEBP = "webp"
+
+
+@dataclasses.dataclass(frozen=True)
+class ImageVariant:
+    """
+    Resized and/or converted rendition of an image. Unset attributes keep those of the original image.
+    """
+
+    size: ImageSize | None = None
+    image_format: ImageFormat | None = None
+
+    def key_for(self, key: str) -> str:
+        """
+        Key a variant of the image stored under the given key is stored under.
+        """
+        return f"{key}@{self.size or 'original'}.{self.image_format or 'original'}"
+
+
+def sniff_media_type(content: bytes) -> str | None:
+    """
+    Detect the content type of an image from the signature at the start of its body.
+
+    :return: The content type, or None if the body does not start with a known image signature.
+    """
+    if content.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if content.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if content.startswith(b"GIF8"):
+        return "image/gif"
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def render_image_variant(content: bytes, width: int | None, image_format: str | None) -> tuple[bytes, str]:
+    """
+    Resize and/or convert an image. Runs in a worker process, so it only takes and returns picklable values.
+
+    :param content: Body of the original image.
+    :param width: Width the image is scaled down to, keeping its aspect ratio. Smaller images are not enlarged.
+    :param image_format: Pillow format to convert the image to, or None to keep the original format.
+    :return: Body and content type of the rendered image.
+    :raises OSError: If the original body is not a readable image.
+    """
+    with Image.open(io.BytesIO(content)) as original_image:
+        output_format = (image_format or original_image.format or "PNG").upper()
+        rendered_image: Image.Image = original_image
+        if width is not None and original_image.width > width:
+            rendered_image = original_image.copy()
+            rendered_image.thumbnail((width, original_image.height), Image.Resampling.LANCZOS)
+        if output_format == "JPEG" and rendered_image.mode not in {"RGB", "L"}:
+            rendered_image = rendered_image.convert("RGB")
+        output = io.BytesIO()
+        rendered_image.save(output, format=output_format)
+    return output.getvalue(), Image.MIME.get(output_format, FALLBACK_MEDIA_TYPE)
+
+
+async def _single_chunk(content: bytes) -> AsyncGenerator[bytes, None]:
+    yield content
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedImage:
+    """
+    Index entry of a stored image: the key it was stored under and the content it points to.
+    """
+
+    key: str
+    digest: str
+    media_type: str
+    size: int
+
+
+@dataclasses.dataclass
+class ImageCacheStatistics:
+    """
+    Counters describing how card images were served from the disk cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    renders: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def _write_atomically(path: pathlib.Path, content: bytes) -> None:
+    temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    try:
+        temporary_path.write_bytes(content)
+        temporary_path.replace(path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+@dataclasses.dataclass
+class ImageCacheService(AbstractAsyncService, config=ImageCacheConfiguration):
+    """
+    Content-addressed store of card images on disk, indexed by key (the card ID).
+
+    Image bodies are written once per SHA-256 digest under ``blobs/``, so printings sharing artwork share a file,
+    and every key gets a small index file under ``index/`` pointing at its digest. Both are written to a
+    temporary file first and renamed into place, so a crash never leaves a partially written image behind.
+    Once the stored images exceed the byte budget, the least recently served keys are evicted and images no
+    longer referenced by any key are deleted. Recency survives restarts through the modification time of the
+    index files.
+
+    Resized and converted variants are rendered in a pool of worker processes, so decoding and encoding
+    images never blocks the event loop, and are stored next to the originals under a key of their own.
+    """
+
+    directory: pathlib.Path = dataclasses.field(init=False)
+    max_bytes: int = dataclasses.field(init=False, default=0)
+    variant_workers: int = dataclasses.field(init=False, default=2)
+    stored_bytes: int = dataclasses.field(init=False, default=0)
+    statistics: ImageCacheStatistics = dataclasses.field(init=False, default_factory=ImageCacheStatistics)
+    stores: SingleFlight[CachedImage | None] = dataclasses.field(init=False, default_factory=SingleFlight)
+    _entries: collections.OrderedDict[str, CachedImage] = dataclasses.field(
+        init=False, default_factory=collections.OrderedDict, repr=False
+    )
+    _references: collections.Counter[str] = dataclasses.field(
+        init=False, default_factory=collections.Counter, repr=False
+    )
+    _commit_lock: asyncio.Lock = dataclasses.field(init=False, default_factory=asyncio.Lock, repr=False)
+    _variant_pool: concurrent.futures.ProcessPoolExecutor | None = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    async def initialize(self, config: ImageCacheConfiguration) -> None:  # type: ignore
+        self.max_bytes = config.max_bytes
+        self.variant_workers = config.variant_workers
+        self.directory = pathlib.Path(config.directory or pathlib.Path(tempfile.gettempdir()) / "mtgapi-images")
+        if self.enabled:
+            await asyncio.to_thread(self._load_index)
+            logger.info(
+                "Loaded %d cached images (%d bytes) from %s", len(self._entries), self.stored_bytes, self.directory
+            )
+
+    def path_of(self, image: CachedImage) -> pathlib.Path:
+        """
+        Path of the stored body of an image.
+        """
+        return self.directory / BLOBS_DIRECTORY / image.digest[:2] / image.digest
+
+    def _index_path_of(self, key: str) -> pathlib.Path:
+        return self.directory / INDEX_DIRECTORY / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    async def get(self, key: str) -> CachedImage | None:
+        """
+        Look up the image stored for a key and mark it as the most recently used one.
+
+        :param key: Key the image was stored under.
+        :return: The index entry of the image, or None if no image is stored for the key.
+        """
+        image = self._entries.get(key)
+        if image is None:
+            self.statistics.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.statistics.hits += 1
+        with contextlib.suppress(FileNotFoundError):
+            await asyncio.to_thread(os.utime, self._index_path_of(key))
+        return image
+
+    async def store(self, key: str, chunks: AsyncIterable[bytes], media_type: str | None = None) -> CachedImage:
+        """
+        Write an image to disk chunk by chunk and index it under a key, evicting the least recently used
+        images if the byte budget is exceeded. The stored image itself is never evicted by its own store.
+
+        :param key: Key to store the image under.
+        :param chunks: Body of the image.
+        :param media_type: Content type the image is served with. Detected from the body if it is not an image
+            content type, e.g. a generic 'application/octet-stream' sent by the upstream.
+        :return: The index entry of the stored image.
+        """
+        temporary_path = self.directory / TEMPORARY_DIRECTORY / uuid.uuid4().hex
+        content_hash = hashlib.sha256()
+        size = 0
+        if media_type is not None and not media_type.startswith("image/"):
+            media_type = None
+        try:
+            with await asyncio.to_thread(temporary_path.open, "wb") as temporary_file:
+                async for chunk in chunks:
+                    if media_type is None:
+                        media_type = sniff_media_type(chunk) or FALLBACK_MEDIA_TYPE
+                    content_hash.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(temporary_file.write, chunk)
+            image = CachedImage(
+                key=key,
+                digest=content_hash.hexdigest(),
+                media_type=media_type or FALLBACK_MEDIA_TYPE,
+                size=size,
+            )
+            async with self._commit_lock:
+                await asyncio.to_thread(self._commit, temporary_path, image)
+                replaced_image = self._remember(image)
+                if replaced_image is not None:
+                    await asyncio.to_thread(self._delete, [], [replaced_image])
+                self.statistics.stores += 1
+                await self._evict(keep=key)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+        return image
+
+    async def discard(self, image: CachedImage) -> None:
+        """
+        Drop the index entry of an image whose body has gone missing, e.g. evicted by a concurrent store after the
+        image was looked up, so that the next lookup of its key misses and stores it again.
+        Does nothing if the key has been stored again in the meantime.
+
+        :param image: Index entry returned by ``get`` or ``store``.
+        """
+        async with self._commit_lock:
+            if self._entries.get(image.key) != image:
+                return
+            del self._entries[image.key]
+            unreferenced_images = [image] if self._release(image) else []
+            await asyncio.to_thread(self._delete, [image], unreferenced_images)
+        logger.warning("Dropped cached image %s, its stored body is missing", image.key)
+
+    async def render_variant(self, content: bytes, variant: ImageVariant) -> tuple[bytes, str]:
+        """
+        Render a variant of an image in the worker process pool.
+
+        :param content: Body of the original image.
+        :param variant: Variant to render.
+        :return: Body and content type of the rendered variant.
+        :raises OSError: If the original body is not a readable image.
+        """
+        if self._variant_pool is None:
+            self._variant_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.variant_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self.statistics.renders += 1
+        return await asyncio.get_running_loop().run_in_executor(
+            self._variant_pool,
+            render_image_variant,
+            content,
+            variant.size.width if variant.size else None,
+            variant.image_format,
+        )
+
+    async def store_variant(self, original_image: CachedImage, variant: ImageVariant) -> CachedImage:
+        """
+        Render a variant of a stored image and store it next to the original.
+
+        :param original_image: Index entry of the stored original.
+        :param variant: Variant to render.
+        :return: The index entry of the stored variant.
+        :raises OSError: If the original is not a readable image or has been evicted in the meantime.
+        """
+        content = await asyncio.to_thread(self.path_of(original_image).read_bytes)
+        rendered_content, media_type = await self.render_variant(content, variant)
+        return await self.store(variant.key_for(original_image.key), _single_chunk(rendered_content), media_type)
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes rendering image variants.
+        """
+        if self._variant_pool is not None:
+            self._variant_pool.shutdown(wait=False, cancel_futures=True)
+            self._variant_pool = None
+
+    def _commit(self, temporary_path: pathlib.Path, image: CachedImage) -> None:
+        blob_path = self.path_of(image)
+        blob_path.parent.mkdir(exist_ok=True)
+        temporary_path.replace(blob_path)
+        _write_atomically(
+            self._index_path_of(image.key),
+            json.dumps(dataclasses.asdict(image)).encode(),
+        )
+
+    def _remember(self, image: CachedImage) -> CachedImage | None:
+        """
+        Index an image as the most recently used one.
+
+        :return: The entry previously indexed under the same key if its body is no longer referenced.
+        """
+        if not self._references[image.digest]:
+            self.stored_bytes += image.size
+        self._references[image.digest] += 1
+        replaced_image = self._entries.pop(image.key, None)
+        self._entries[image.key] = image
+        if replaced_image is not None and self._release(replaced_image):
+            return replaced_image
+        return None
+
+    def _release(self, image: CachedImage) -> bool:
+        """
+        Drop a reference to the body of an image.
+
+        :return: Whether the body is no longer referenced and can be deleted.
+        """
+        self._references[image.digest] -= 1
+        if self._references[image.digest] > 0:
+            return False
+        del self._references[image.digest]
+        self.stored_bytes -= image.size
+        return True
+
+    def _pop_least_recently_used(self, keep: str | None = None) -> tuple[list[CachedImage], list[CachedImage]]:
+        """
+        Drop the least recently used keys from the index until the stored images fit in the byte budget.
+
+        :param keep: Key that is never dropped, stopping the eviction once it is the least recently used one.
+        :return: The dropped index entries and the entries whose body is no longer referenced.
+        """
+        evicted_images = []
+        unreferenced_images = []
+        while self.stored_bytes > self.max_bytes and self._entries:
+            if next(iter(self._entries)) == keep:
+                break
+            _, image = self._entries.popitem(last=False)
+            evicted_images.append(image)
+            if self._release(image):
+                unreferenced_images.append(image)
+        return evicted_images, unreferenced_images
+
+    async def _evict(self, keep: str) -> None:
+        evicted_images, unreferenced_images = self._pop_least_recently_used(keep)
+        if not evicted_images:
+            return
+        self.statistics.evictions += len(evicted_images)
+        self.statistics.evicted_bytes += sum(image.size for image in unreferenced_images)
+        await asyncio.to_thread(self._delete, evicted_images, unreferenced_images)
+        logger.info("Evicted %d cached images, %d bytes stored", len(evicted_images), self.stored_bytes)
+
+    def _delete(self, evicted_images: list[CachedImage], unreferenced_images: list[CachedImage]) -> None:
+        for image in evicted_images:
+            self._index_path_of(image.key).unlink(missing_ok=True)
+        for image in unreferenced_images:
+            self.path_of(image).unlink(missing_ok=True)
+
+    def _load_index(self) -> None:
+        for subdirectory in (BLOBS_DIRECTORY, INDEX_DIRECTORY, TEMPORARY_DIRECTORY):
+            (self.directory / subdirectory).mkdir(parents=True, exist_ok=True)
+        for leftover_path in (self.directory / TEMPORARY_DIRECTORY).iterdir():
+            leftover_path.unlink(missing_ok=True)
+
+        index_paths = sorted(
+            (self.directory / INDEX_DIRECTORY).glob("*.json"), key=lambda index_path: index_path.stat().st_mtime
+        )
+        for index_path in index_paths:
+            try:
+                image = CachedImage(**json.loads(index_path.read_bytes()))
+            except (ValueError, TypeError) as malformed_entry_error:
+                logger.warning("Dropping malformed image index entry %s: %s", index_path, malformed_entry_error)
+                index_path.unlink(missing_ok=True)
+                continue
+            if not self.path_of(image).is_file():
+                index_path.unlink(missing_ok=True)
+                continue
+            self._remember(image)
+
+        self._delete(*self._pop_least_recently_used())
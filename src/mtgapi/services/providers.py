@@ -0,0 +1,244 @@
+import abc
+import asyncio
+import dataclasses
+import logging
+import time
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+import httpx
+import pydantic
+from dependency_injector.wiring import Provide, inject
+
+from mtgapi.common.exceptions import UpstreamUnavailableError
+from mtgapi.config.settings.services import CardProviderChainConfiguration
+from mtgapi.domain.card import MTGIOCard
+from mtgapi.services import AuxiliaryServiceNames
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.base import AbstractAsyncService
+from mtgapi.services.bulk_import import iter_json_records
+from mtgapi.services.health import HealthPolicy, UpstreamHealth
+
+logger = logging.getLogger(__name__)
+
+
+class CardProvider(abc.ABC):
+    """
+    Source of card data, e.g. an upstream API or a local catalog.
+    """
+
+    name: ClassVar[str]
+
+    @abc.abstractmethod
+    async def get_card_printings(self, identifier: int | str, printing: str | None = None) -> list[MTGIOCard]:
+        """
+        Look up a card by its multiverse ID or name.
+
+        :param identifier: Multiverse ID (int) or name (str) of the card.
+        :param printing: Optional normalized set code the card must be printed in.
+        :return: The matching card, followed by the other printings of it found along the way.
+        :raises ValueError: If the provider does not know the card.
+        """
+        raise NotImplementedError("get_card_printings method not implemented.")
+
+
+@dataclasses.dataclass
+class MTGIOCardProvider(CardProvider):
+    """
+    Looks cards up on the MTGIO API, batching concurrent multiverse ID lookups.
+    """
+
+    name: ClassVar[str] = "mtgio"
+
+    mtgio_service: MTGIOAPIService
+
+    async def get_card_printings(self, identifier: int | str, printing: str | None = None) -> list[MTGIOCard]:
+        if isinstance(identifier, int):
+            return [await self.mtgio_service.get_card_batched(identifier)]
+        return await self.mtgio_service.get_card_printings(identifier, printing=printing)
+
+
+@dataclasses.dataclass
+class LocalCatalogCardProvider(CardProvider):
+    """
+    Serves cards from a local dump of MTGIO card payloads held in memory.
+    """
+
+    name: ClassVar[str] = "local"
+
+    cards_by_multiverse_id: dict[str, MTGIOCard] = dataclasses.field(default_factory=dict)
+    cards_by_name: dict[str, list[MTGIOCard]] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def from_cards(cls, cards: list[MTGIOCard]) -> Self:
+        provider = cls()
+        for card in cards:
+            if card.multiverse_id:
+                provider.cards_by_multiverse_id.setdefault(card.multiverse_id, card)
+            provider.cards_by_name.setdefault(card.names[0].casefold(), []).append(card)
+        return provider
+
+    @classmethod
+    def from_dump(cls, path: Path) -> Self:
+        """
+        Load the cards of a dump in any of the layouts supported by the bulk import. Malformed cards are skipped.
+
+        :param path: Path of the dump.
+        :raises ValueError: If the dump is not valid JSON.
+        """
+        cards = []
+        for card_payload in iter_json_records(path):
+            try:
+                cards.append(MTGIOCard.from_api_payload(card_payload))
+            except (pydantic.ValidationError, KeyError, IndexError, TypeError) as conversion_error:
+                logger.warning("Skipping malformed card %s: %s", card_payload.get("id"), conversion_error)
+        logger.info("Loaded %d cards from local catalog %s", len(cards), path)
+        return cls.from_cards(cards)
+
+    async def get_card_printings(self, identifier: int | str, printing: str | None = None) -> list[MTGIOCard]:
+        if isinstance(identifier, int):
+            card = self.cards_by_multiverse_id.get(str(identifier))
+            if card is None or (printing and card.set_code != printing):
+                raise ValueError(f"Card with identifier '{identifier}' not found in the local catalog.")
+            return [card]
+        printings = [
+            card
+            for card in self.cards_by_name.get(identifier.casefold(), [])
+            if not printing or card.set_code == printing
+        ]
+        if not printings:
+            raise ValueError(
+                f"Card with name '{identifier}' and printing '{printing or 'ANY'}' not found in the local catalog."
+            )
+        return printings
+
+
+@dataclasses.dataclass
+class ProviderHealth(UpstreamHealth):
+    """
+    Health of a single card provider, used to rank the providers of a chain.
+    """
+
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    rejections: int = 0
+
+
+@dataclasses.dataclass
+class CardProviderChainService(AbstractAsyncService, config=CardProviderChainConfiguration):
+    """
+    Looks cards up with several providers, trying the fastest healthy one first.
+
+    Providers are ranked by their score (smoothed latency weighted by error rate); a provider that does not know
+    the card or fails passes the lookup on to the next one. Only transport errors and server errors count as
+    failures: misses and lookups rejected by the rate limiter or circuit breaker of this process leave the health
+    of a provider untouched. Providers failing too often are ejected for ``ejection_duration`` seconds, i.e. only
+    tried after every provider in rotation.
+    """
+
+    providers: list[CardProvider] = dataclasses.field(init=False, default_factory=list)
+    health: dict[str, ProviderHealth] = dataclasses.field(init=False, default_factory=dict, repr=False)
+    local_catalog_path: str = dataclasses.field(init=False, default="")
+    health_policy: HealthPolicy = dataclasses.field(init=False, default_factory=HealthPolicy)
+
+    async def initialize(self, config: CardProviderChainConfiguration) -> None:  # type: ignore
+        self.local_catalog_path = config.local_catalog_path
+        self.health_policy = HealthPolicy.from_config(config)
+        if self.local_catalog_path:
+            self.register(await asyncio.to_thread(LocalCatalogCardProvider.from_dump, Path(self.local_catalog_path)))
+
+    @inject
+    def start(self, mtgio_service: MTGIOAPIService = Provide[AuxiliaryServiceNames.MTGIO]) -> None:
+        """
+        Register the MTGIO provider, unless it is already registered.
+        """
+        if MTGIOCardProvider.name not in self.health:
+            self.register(MTGIOCardProvider(mtgio_service=mtgio_service))
+
+    def register(self, provider: CardProvider) -> None:
+        """
+        Add a provider to the chain, replacing a provider registered under the same name.
+        """
+        self.providers = [
+            registered_provider for registered_provider in self.providers if registered_provider.name != provider.name
+        ]
+        self.providers.append(provider)
+        self.health[provider.name] = ProviderHealth()
+        logger.info("Registered card provider %s", provider.name)
+
+    def providers_in_order(self) -> list[CardProvider]:
+        """
+        Providers in the order a lookup tries them: healthy ones by score, then ejected ones by return time.
+        """
+        in_rotation = [provider for provider in self.providers if not self.health[provider.name].ejected]
+        ejected = [provider for provider in self.providers if self.health[provider.name].ejected]
+        return sorted(in_rotation, key=lambda provider: self.health[provider.name].score) + sorted(
+            ejected, key=lambda provider: self.health[provider.name].ejected_until
+        )
+
+    async def get_card_printings(self, identifier: int | str, printing: str | None = None) -> list[MTGIOCard]:
+        """
+        Look up a card with the providers of the chain, falling back to the next provider on a miss or failure.
+
+        :param identifier: Multiverse ID (int) or name (str) of the card.
+        :param printing: Optional normalized set code the card must be printed in.
+        :return: The matching card, followed by the other printings of it found along the way.
+        :raises ValueError: If no provider knows the card.
+        :raises UpstreamUnavailableError | httpx.HTTPError: The error of the last provider that could not answer,
+            if no provider found the card and at least one could not answer.
+        """
+        unanswered_lookup_error: Exception | None = None
+        for provider in self.providers_in_order():
+            started_at = time.monotonic()
+            try:
+                printings = await provider.get_card_printings(identifier, printing)
+            except ValueError as card_not_found_error:
+                logger.debug("Card provider %s missed '%s': %s", provider.name, identifier, card_not_found_error)
+                self.record_outcome(provider, time.monotonic() - started_at, found=False)
+                continue
+            except httpx.HTTPStatusError as rejected_lookup_error:
+                # The provider answered, so only server errors count against its health
+                status_code = rejected_lookup_error.response.status_code
+                self.record_outcome(
+                    provider,
+                    time.monotonic() - started_at,
+                    found=False,
+                    failed=status_code >= httpx.codes.INTERNAL_SERVER_ERROR,
+                )
+                if status_code != httpx.codes.NOT_FOUND:
+                    unanswered_lookup_error = rejected_lookup_error
+                continue
+            except UpstreamUnavailableError as rejected_lookup_error:
+                # Rejected by this process' own rate limiter or circuit breaker before reaching the provider,
+                # which says nothing about the health of the provider
+                logger.info("Card provider %s rejected '%s': %s", provider.name, identifier, rejected_lookup_error)
+                self.health[provider.name].rejections += 1
+                unanswered_lookup_error = rejected_lookup_error
+                continue
+            except httpx.HTTPError as failed_lookup_error:
+                logger.warning(
+                    "Card provider %s failed to look up '%s': %s", provider.name, identifier, failed_lookup_error
+                )
+                self.record_outcome(provider, time.monotonic() - started_at, found=False, failed=True)
+                unanswered_lookup_error = failed_lookup_error
+                continue
+            self.record_outcome(provider, time.monotonic() - started_at, found=True)
+            return printings
+
+        if unanswered_lookup_error is not None:
+            raise unanswered_lookup_error
+        raise ValueError(f"Card '{identifier}' with printing '{printing or 'ANY'}' not found by any card provider.")
+
+    def record_outcome(self, provider: CardProvider, latency: float, found: bool, failed: bool = False) -> None:
+        health = self.health[provider.name]
+        health.lookups += 1
+        if found:
+            health.hits += 1
+        elif not failed:
+            health.misses += 1
+        if health.record(latency, failed, self.health_policy):
+            logger.warning("Ejected card provider %s for %.0fs", provider.name, self.health_policy.ejection_duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {provider.name: self.health[provider.name].as_dict() for provider in self.providers}
@@ -1,10 +1,17 @@
 import abc
 import dataclasses
+import logging
+import random
+from typing import Any
 
 import httpx
 
 from mtgapi.config.settings.base import NullConfiguration
+from mtgapi.config.settings.services import ProxyPoolConfiguration
 from mtgapi.services.base import AbstractAsyncService
+from mtgapi.services.health import HealthPolicy, UpstreamHealth
+
+logger = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -20,10 +27,12 @@ class Proxy:
     def to_httpx_proxy(self) -> httpx.Proxy | None:
         """
         Convert the Proxy instance to a dictionary suitable for httpx proxy configuration.
+        The HTTPS endpoint is used when no plain HTTP endpoint is configured.
+        HTTP/2 is negotiated end-to-end through the CONNECT tunnel opened by the proxy.
 
         """
         try:
-            return httpx.Proxy(url=self.http)
+            return httpx.Proxy(url=self.http or self.https)
         except ValueError:
             return None
 
@@ -76,6 +85,18 @@ class AbstractProxyService(AbstractAsyncService, abc.ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def record_outcome(self, proxy: Proxy, latency: float, failed: bool) -> None:
+        """
+        Report how a request sent through the proxy went. Ignored unless the service scores its proxies.
+
+        :param proxy: The proxy returned by ``get_proxy`` for the request.
+        :param latency: Time in seconds until the response headers arrived.
+        :param failed: Whether the request failed because of the proxy or its egress IP.
+        """
+
+    def as_dict(self) -> dict[str, Any]:
+        return {}
+
 
 class NullProxyService(AbstractProxyService, config=NullConfiguration):
     """
@@ -98,3 +119,59 @@ class NullProxyService(AbstractProxyService, config=NullConfiguration):
         :return: An empty string indicating no proxy.
         """
         return Proxy(http="", https="")
+
+
+@dataclasses.dataclass
+class ProxyHealth(UpstreamHealth):
+    """
+    Health of a single proxy, used to rank the proxies of a pool.
+    """
+
+    requests: int = 0
+
+
+@dataclasses.dataclass
+class RotatingProxyPoolService(AbstractProxyService, config=ProxyPoolConfiguration):
+    """
+    Spreads upstream requests over a pool of proxies, preferring the healthiest ones.
+
+    Each request samples two proxies still in rotation and picks the one with the lower score (smoothed
+    latency weighted by error rate), which favours healthy proxies without sending all traffic through one
+    egress IP. Proxies failing too often are ejected for ``ejection_duration`` seconds; when every proxy is
+    ejected, the one returning soonest is used.
+    """
+
+    proxies: list[Proxy] = dataclasses.field(init=False, default_factory=list)
+    health: dict[Proxy, ProxyHealth] = dataclasses.field(init=False, default_factory=dict, repr=False)
+    health_policy: HealthPolicy = dataclasses.field(init=False, default_factory=HealthPolicy)
+
+    async def initialize(self, config: ProxyPoolConfiguration) -> None:  # type: ignore
+        self.proxies = [Proxy(http=url, https=url) for url in dict.fromkeys(config.urls)]
+        self.health = {proxy: ProxyHealth() for proxy in self.proxies}
+        self.health_policy = HealthPolicy.from_config(config)
+        logger.info("Initialized proxy pool with %d proxies", len(self.proxies))
+
+    async def get_proxy(self) -> Proxy | None:
+        """
+        Pick the proxy for the next request.
+
+        :return: One of the healthiest proxies in rotation, or None if the pool is empty.
+        """
+        if not self.proxies:
+            return None
+        in_rotation = [proxy for proxy in self.proxies if not self.health[proxy].ejected]
+        if not in_rotation:
+            return min(self.proxies, key=lambda proxy: self.health[proxy].ejected_until)
+        candidates = random.sample(in_rotation, k=min(2, len(in_rotation)))
+        return min(candidates, key=lambda proxy: self.health[proxy].score)
+
+    def record_outcome(self, proxy: Proxy, latency: float, failed: bool) -> None:
+        health = self.health.get(proxy)
+        if health is None:
+            return
+        health.requests += 1
+        if health.record(latency, failed, self.health_policy):
+            logger.warning("Ejected %s from the proxy pool for %.0fs", proxy, self.health_policy.ejection_duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {str(proxy): self.health[proxy].as_dict() for proxy in self.proxies}
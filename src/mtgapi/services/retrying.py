@@ -0,0 +1,169 @@
+import dataclasses
+import datetime
+import email.utils
+import logging
+from typing import Any
+
+import httpx
+import tenacity
+from tenacity.wait import wait_base
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        httpx.codes.REQUEST_TIMEOUT,
+        httpx.codes.TOO_EARLY,
+        httpx.codes.TOO_MANY_REQUESTS,
+        httpx.codes.INTERNAL_SERVER_ERROR,
+        httpx.codes.BAD_GATEWAY,
+        httpx.codes.SERVICE_UNAVAILABLE,
+        httpx.codes.GATEWAY_TIMEOUT,
+    }
+)
+
+
+def is_retryable_error(exception: BaseException | None) -> bool:
+    """
+    Check whether a failed request may succeed when sent again.
+
+    :param exception: The exception raised by the request.
+    :return: True for transport errors and retryable HTTP statuses, False otherwise.
+    """
+    if isinstance(exception, httpx.TransportError):
+        return True
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def parse_retry_after(exception: BaseException | None) -> float | None:
+    """
+    Read the Retry-After header of a failed response.
+
+    :param exception: The exception raised by the request.
+    :return: Seconds to wait before retrying, or None if the response does not specify it.
+    """
+    if not isinstance(exception, httpx.HTTPStatusError):
+        return None
+    retry_after = exception.response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at: datetime.datetime = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        logger.warning("Ignoring malformed Retry-After header: %s", retry_after)
+        return None
+    if retry_at.tzinfo is None:
+        # HTTP dates are always in GMT, a "-0000" zone is parsed as a naive datetime
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    now = datetime.datetime.now(datetime.UTC)
+    return max(0.0, float((retry_at - now).total_seconds()))
+
+
+@dataclasses.dataclass
+class RetryBudgetStatistics:
+    """
+    Counters describing how the retry budget was spent.
+    """
+
+    first_attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class RetryBudget:
+    """
+    Caps retries at a ratio of first attempts.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one. The balance starts at and
+    never exceeds ``reserve`` tokens, which lets a quiet process retry occasional failures while an outage
+    can only add ``ratio`` extra load upstream.
+    """
+
+    ratio: float = 0.2
+    reserve: float = 10.0
+    statistics: RetryBudgetStatistics = dataclasses.field(default_factory=RetryBudgetStatistics)
+    _balance: float = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._balance = self.reserve
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def configure(self, ratio: float, reserve: float) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = min(self._balance, reserve)
+
+    def record_first_attempt(self) -> None:
+        self.statistics.first_attempts += 1
+        self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Withdraw a token for a retry.
+
+        :return: True if the retry may be sent, False if the budget is exhausted.
+        """
+        if self._balance < 1:
+            self.statistics.exhausted += 1
+            return False
+        self._balance -= 1
+        self.statistics.retries += 1
+        return True
+
+
+PROCESS_RETRY_BUDGET = RetryBudget()
+
+
+@dataclasses.dataclass
+class retry_if_retryable_and_budgeted(tenacity.retry_base):  # noqa: N801
+    """
+    Retry transport errors and retryable statuses while attempts and the retry budget last.
+
+    Failures whose Retry-After exceeds ``maximum_wait`` are not retried, as the upstream already
+    announced that it will not recover in time.
+    """
+
+    budget: RetryBudget
+    max_attempts: int
+    maximum_wait: float
+
+    def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
+        if retry_state.outcome is None or retry_state.attempt_number >= self.max_attempts:
+            return False
+        exception = retry_state.outcome.exception()
+        if not is_retryable_error(exception):
+            return False
+        retry_after = parse_retry_after(exception)
+        if retry_after is not None and retry_after > self.maximum_wait:
+            logger.info("Upstream asked to retry after %.1fs, not retrying", retry_after)
+            return False
+        return self.budget.try_spend()
+
+
+@dataclasses.dataclass
+class wait_retry_after(wait_base):  # noqa: N801
+    """
+    Wait for the Retry-After announced by the upstream, or the fallback wait if it is longer.
+    """
+
+    fallback: wait_base
+
+    def __call__(self, retry_state: tenacity.RetryCallState) -> float:
+        fallback_wait = self.fallback(retry_state)
+        if retry_state.outcome is None:
+            return fallback_wait
+        retry_after = parse_retry_after(retry_state.outcome.exception())
+        return max(retry_after or 0.0, fallback_wait)
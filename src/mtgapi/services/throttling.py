@@ -0,0 +1,114 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import Any
+
+from mtgapi.common.exceptions import RateLimitExceededError
+
+logger = logging.getLogger(__name__)
+
+MINIMUM_RATE_FACTOR = 0.1
+
+
+@dataclasses.dataclass
+class RateLimiterStatistics:
+    """
+    Counters describing how requests passed through the rate limiter.
+    """
+
+    granted: int = 0
+    delayed: int = 0
+    rejected: int = 0
+    total_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class AdaptiveRateLimiter:
+    """
+    Token bucket limiting the rate of upstream requests.
+
+    Callers that find the bucket empty reserve a future token and sleep until it is due, so bursts are queued
+    in arrival order instead of being sent upstream. Callers whose expected wait exceeds ``max_wait`` are
+    rejected with RateLimitExceededError. The refill rate is scaled down as the remaining quota reported by
+    the upstream drops below ``slowdown_threshold``.
+
+    A rate of 0 disables the limiter.
+    """
+
+    rate: float
+    burst: int = 0
+    max_wait: float = 10.0
+    slowdown_threshold: int = 0
+    statistics: RateLimiterStatistics = dataclasses.field(default_factory=RateLimiterStatistics)
+    _tokens: float = dataclasses.field(init=False, repr=False)
+    _rate_factor: float = dataclasses.field(init=False, default=1.0, repr=False)
+    _last_refill: float = dataclasses.field(init=False, default_factory=time.monotonic, repr=False)
+
+    def __post_init__(self) -> None:
+        self.burst = self.burst or max(int(self.rate), 1)
+        self._tokens = float(self.burst)
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @property
+    def effective_rate(self) -> float:
+        return self.rate * self._rate_factor
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.effective_rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """
+        Take a token from the bucket, waiting for it if necessary.
+
+        :raises RateLimitExceededError: If the token would not be available within the maximum wait.
+        """
+        if not self.enabled:
+            return
+
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            self.statistics.granted += 1
+            return
+
+        expected_wait = -self._tokens / self.effective_rate
+        if expected_wait > self.max_wait:
+            self._tokens += 1
+            self.statistics.rejected += 1
+            raise RateLimitExceededError(retry_after=expected_wait)
+
+        self.statistics.delayed += 1
+        self.statistics.total_wait += expected_wait
+        logger.debug("Rate limit reached, delaying request by %.3fs", expected_wait)
+        try:
+            await asyncio.sleep(expected_wait)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+        self.statistics.granted += 1
+
+    def observe(self, remaining: int | None) -> None:
+        """
+        Adjust the refill rate to the remaining quota reported by the upstream.
+
+        :param remaining: Number of requests left in the upstream quota window, or None if unknown.
+        """
+        if remaining is None or not self.enabled or self.slowdown_threshold <= 0:
+            return
+
+        new_rate_factor = max(MINIMUM_RATE_FACTOR, min(1.0, remaining / self.slowdown_threshold))
+        if new_rate_factor != self._rate_factor:
+            self._refill()
+            self._rate_factor = new_rate_factor
+            logger.info(
+                "Upstream reports %d remaining requests, throttling to %.2f req/s", remaining, self.effective_rate
+            )
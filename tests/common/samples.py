@@ -1,4 +1,5 @@
 import os
+from typing import Any
 
 from PIL import Image
 
@@ -44,3 +45,21 @@ LIGHTNING_BOLT_MTG_CARD_DATA = {
 
 TEST_MTGIO_CARD_ID = 597
 TEST_MTGIO_CARD_IMAGE = Image.open(os.path.join(ASSETS_DIRECTORY, f"card_{TEST_MTGIO_CARD_ID}.webp"))
+
+LIGHTNING_BOLT_MTGIO_API_PAYLOAD: dict[str, Any] = {
+    "name": "Lightning Bolt",
+    "manaCost": "{R}",
+    "colors": ["Red"],
+    "colorIdentity": ["R"],
+    "type": "Instant",
+    "types": ["Instant"],
+    "rarity": "Common",
+    "set": "LEA",
+    "setName": "Limited Edition Alpha",
+    "text": "Lightning Bolt deals 3 damage to any target.",
+    "layout": "normal",
+    "multiverseid": "209",
+    "imageUrl": "http://gatherer.wizards.com/Handlers/Image.ashx?multiverseid=209&type=card",
+    "printings": ["LEA"],
+    "id": "ce711943-c1a1-43a0-8b89-8d169cfb8e06",
+}
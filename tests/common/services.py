@@ -1,6 +1,6 @@
 import dataclasses
 import logging
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
 from typing import AsyncGenerator
 from unittest.mock import patch
 import pytest_asyncio
@@ -32,6 +32,10 @@ TEST_HTTP_SERVICE_BASE_URL = "https://pokeapi.co/api/v2/"
 
 TEST_PROXY_CONFIGURATION_PREFIX = "TEST_PROXY_SERVICE_"
 
+MOCKED_MTGIO_BASE_URL = "https://mtgio.test"
+
+MockedTransportHandler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+
 MOCK_CONFIGURATION_PREFIX = APP_CONFIGURATION_PREFIX + "_MOCK_"
 MOCK_SERVICE_SETTINGS = {"mock_setting": "mock_value", "another_mock_setting": 2000}
 
@@ -194,3 +198,33 @@ async def test_cobuilder_api_client() -> AsyncGenerator[AsyncClient, None]:
         full_base_url = f"http://testservers.com/{API.root_path.removeprefix('/')}"
         async with AsyncClient(transport=ASGITransport(app=API), base_url=full_base_url) as client:
             yield client
+
+
+@pytest.fixture(scope="function")
+def mocked_mtgio_service_factory() -> Callable[..., MTGIOAPIService]:
+    """
+    Builds MTGIO services whose pooled client answers requests with the given handler instead of the network.
+    Additional keyword arguments are passed as MTGIO configuration variables.
+    """
+
+    def _build_mocked_mtgio_service(handler: MockedTransportHandler, **settings: str) -> MTGIOAPIService:
+        with TemporaryEnvContext(
+            **{
+                f"{ServiceConfigurationPrefixes.MTGIO}_BASE_URL": MOCKED_MTGIO_BASE_URL,
+                **{
+                    f"{ServiceConfigurationPrefixes.MTGIO}_{setting_name.upper()}": setting_value
+                    for setting_name, setting_value in settings.items()
+                },
+            }
+        ):
+            mocked_service = MTGIOAPIService()
+
+        mocked_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+
+        async def _get_mocked_client(proxy: Proxy | None = None) -> httpx.AsyncClient:
+            return mocked_client
+
+        mocked_service._get_client = _get_mocked_client  # type: ignore[method-assign]
+        return mocked_service
+
+    return _build_mocked_mtgio_service
@@ -1,11 +1,14 @@
 import re
+from typing import Annotated, cast
 
 import pytest
+import sqlalchemy
 from pydantic import BaseModel
 
 from mtgapi.common.exceptions import EmptyPydanticModelError
 from mtgapi.domain.card import MTGCard
 from mtgapi.domain.conversions import (
+    Indexed,
     TypeAnnotationToSQLFieldType,
     convert_pydantic_model_to_sqlalchemy_base,
 )
@@ -44,6 +47,39 @@ def test_converting_model_with_list_field() -> None:
     assert isinstance(sqlalchemy_model.tags.type.item_type, TypeAnnotationToSQLFieldType.str.value)
 
 
+@pytest.mark.offline
+def test_index_hints_are_declared_on_the_table() -> None:
+    class SampleIndexedModel(BaseModel):
+        id: int
+        code: Annotated[str, Indexed(unique=True)]
+        name: Annotated[str, Indexed("name_edition")]
+        notes: str | None
+        edition: Annotated[str | None, Indexed("name_edition")] = None
+
+    sqlalchemy_model = convert_pydantic_model_to_sqlalchemy_base(SampleIndexedModel)
+    table = cast(sqlalchemy.Table, sqlalchemy_model.__table__)
+    declared_indexes = {
+        index.name: ([column.name for column in index.columns], index.unique) for index in table.indexes
+    }
+
+    assert declared_indexes == {
+        "ix_sampleindexedmodel_code": (["code"], True),
+        "ix_sampleindexedmodel_name_edition": (["name", "edition"], False),
+    }
+    assert SampleIndexedModel.model_json_schema()["properties"]["code"] == {"title": "Code", "type": "string"}
+
+
+@pytest.mark.offline
+def test_if_rejects_inconsistent_index_hints() -> None:
+    class InconsistentlyIndexedModel(BaseModel):
+        id: int
+        name: Annotated[str, Indexed("name_edition", unique=True)]
+        edition: Annotated[str, Indexed("name_edition")]
+
+    with pytest.raises(ValueError, match="ix_inconsistentlyindexedmodel_name_edition"):
+        convert_pydantic_model_to_sqlalchemy_base(InconsistentlyIndexedModel)
+
+
 @pytest.mark.offline
 def test_if_handles_empty_pydantic_model() -> None:
     class EmptyModel(BaseModel):
@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+from mtgapi.domain.card import MTGCard, MTGIOCard
+from mtgapi.domain.payloads import decode_card_response, decode_cards_response
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+from tests.globals import ASSETS_DIRECTORY
+
+with open(os.path.join(ASSETS_DIRECTORY, "mtgio_cards_page.json"), "rb") as recorded_page:
+    RECORDED_CARDS_PAGE = recorded_page.read()
+
+
+def _convert_generically(card_payload: dict) -> tuple[dict, dict]:
+    mtgio_card = MTGIOCard.from_api_payload(card_payload)
+    return mtgio_card.model_dump(), MTGCard.from_mtgio_card(mtgio_card).model_dump()
+
+
+@pytest.mark.offline
+def test_decoded_page_converts_to_the_same_cards() -> None:
+    generic_payloads = json.loads(RECORDED_CARDS_PAGE)["cards"]
+    decoded_payloads = decode_cards_response(RECORDED_CARDS_PAGE)
+
+    assert len(decoded_payloads) == len(generic_payloads)
+    for decoded_payload, generic_payload in zip(decoded_payloads, generic_payloads, strict=True):
+        assert "legalities" not in decoded_payload, "Expected fields the service does not read to be dropped."
+        assert _convert_generically(decoded_payload) == _convert_generically(generic_payload)  # type: ignore[arg-type]
+
+
+@pytest.mark.offline
+def test_decoded_card_response_converts_to_the_same_card() -> None:
+    content = json.dumps({"card": LIGHTNING_BOLT_MTGIO_API_PAYLOAD}).encode()
+
+    decoded_payload = decode_card_response(content)
+
+    assert _convert_generically(decoded_payload) == _convert_generically(LIGHTNING_BOLT_MTGIO_API_PAYLOAD)  # type: ignore[arg-type]
+
+
+@pytest.mark.offline
+def test_payload_not_matching_schema_is_decoded_as_is() -> None:
+    malformed_card = {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "printings": None, "rulings": [None]}
+    content = json.dumps({"cards": [malformed_card, LIGHTNING_BOLT_MTGIO_API_PAYLOAD, None]}).encode()
+
+    malformed_payload, valid_payload = decode_cards_response(content)
+
+    assert {field: malformed_payload.get(field) for field in ("printings", "rulings")} == {
+        "printings": None,
+        "rulings": [None],
+    }, "Expected values not matching the schema to be kept for the conversion to reject."
+    assert "type" not in malformed_payload, "Expected fields the service does not read to be dropped."
+    assert _convert_generically(valid_payload) == _convert_generically(LIGHTNING_BOLT_MTGIO_API_PAYLOAD)  # type: ignore[arg-type]
+    assert decode_cards_response(b'{"cards": []}') == []
+    assert decode_cards_response(b'{"cards": null}') == []
+    assert decode_cards_response(b"[]") == []
+    assert decode_card_response(b"{}") == {}
+    with pytest.raises(ValueError):
+        decode_cards_response(b"<html>Bad Gateway</html>")
@@ -0,0 +1,117 @@
+import asyncio
+import urllib.parse
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from mtgapi.domain.card import MTGIOCard
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.batching import MicroBatcher
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+KNOWN_MULTIVERSE_IDS = [209, 210, 211, 212, 213]
+UNKNOWN_MULTIVERSE_ID = 999999
+
+
+def _card_payload(multiverse_id: str) -> dict[str, Any]:
+    return {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "multiverseid": multiverse_id, "id": f"card-{multiverse_id}"}
+
+
+def _cards_handler(sent_requests: list[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        requested_ids = request.url.params["multiverseid"].split("|")
+        known_ids = [multiverse_id for multiverse_id in requested_ids if int(multiverse_id) in KNOWN_MULTIVERSE_IDS]
+        return httpx.Response(200, json={"cards": [_card_payload(multiverse_id) for multiverse_id in known_ids]})
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_get_cards_uses_multi_value_filter(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    service = mocked_mtgio_service_factory(_cards_handler(sent_requests))
+
+    found_cards = await service.get_cards([*KNOWN_MULTIVERSE_IDS, UNKNOWN_MULTIVERSE_ID, KNOWN_MULTIVERSE_IDS[0]])
+
+    assert len(sent_requests) == 1
+    assert "multiverseid=209|210|211|212|213|999999" in urllib.parse.unquote(str(sent_requests[0].url))
+    assert sorted(found_cards) == [str(multiverse_id) for multiverse_id in KNOWN_MULTIVERSE_IDS]
+    assert found_cards["210"].id == "card-210"
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_malformed_card_only_fails_its_own_lookup(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_ids = request.url.params["multiverseid"].split("|")
+        cards = [
+            {**_card_payload(multiverse_id), "types": "Instant"}
+            if multiverse_id == "210"
+            else _card_payload(multiverse_id)
+            for multiverse_id in requested_ids
+        ]
+        return httpx.Response(200, json={"cards": cards})
+
+    service = mocked_mtgio_service_factory(handler)
+
+    found_cards = await service.get_cards(KNOWN_MULTIVERSE_IDS)
+
+    assert sorted(found_cards) == [str(multiverse_id) for multiverse_id in KNOWN_MULTIVERSE_IDS if multiverse_id != 210]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_concurrent_id_misses_share_one_upstream_request(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    service = mocked_mtgio_service_factory(_cards_handler(sent_requests), batch_window="0.01")
+
+    lookups = [service.get_card_batched(multiverse_id) for multiverse_id in [*KNOWN_MULTIVERSE_IDS, 209]]
+    lookups.append(service.get_card_batched(UNKNOWN_MULTIVERSE_ID))
+    results = await asyncio.gather(*lookups, return_exceptions=True)
+
+    assert len(sent_requests) == 1, "Expected every concurrent miss to be resolved by one multi-ID query."
+    found_cards = results[:-1]
+    assert all(isinstance(card, MTGIOCard) for card in found_cards)
+    assert [card.id for card in found_cards if isinstance(card, MTGIOCard)] == [
+        f"card-{multiverse_id}" for multiverse_id in [*KNOWN_MULTIVERSE_IDS, 209]
+    ]
+    assert isinstance(results[-1], ValueError)
+    assert service.card_batches.statistics.batches == 1
+    assert service.card_batches.statistics.max_batch_size == len(KNOWN_MULTIVERSE_IDS) + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_full_batch_is_resolved_before_window_closes() -> None:
+    resolved_batches: list[list[int]] = []
+
+    async def resolve_batch(keys: list[int]) -> dict[int, int]:
+        resolved_batches.append(keys)
+        return {key: key * 2 for key in keys}
+
+    batcher = MicroBatcher(resolve_batch=resolve_batch, window=60.0, max_batch_size=3)
+    results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(key) for key in range(6))), timeout=1.0)
+
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert resolved_batches == [[0, 1, 2], [3, 4, 5]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_batch_failure_is_propagated_to_every_lookup() -> None:
+    async def resolve_batch(_: list[int]) -> dict[int, int]:
+        raise httpx.ConnectError("Connection refused")
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(resolve_batch=resolve_batch, window=0.001)
+    results = await asyncio.gather(*(batcher.submit(key) for key in range(3)), return_exceptions=True)
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
@@ -0,0 +1,104 @@
+import dataclasses
+import gzip
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from mtgapi.domain.card import CardValidators, MTGCard
+from mtgapi.services.bulk_import import BulkImportStatistics, import_card_dump, iter_json_records
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+DUMPED_CARDS = 7
+
+
+@dataclasses.dataclass
+class InsertOnlyDatabase:
+    """Stores inserted entries per model and primary key, keeping entries that already exist."""
+
+    entries: dict[str, dict[str, BaseModel]] = dataclasses.field(default_factory=dict)
+    insert_calls: int = 0
+
+    async def register(self, model: type[BaseModel]) -> None:
+        self.entries.setdefault(model.__name__, {})
+
+    async def insert_many(self, instances: Sequence[BaseModel], batch_size: int = 1000) -> int:
+        self.insert_calls += 1
+        inserted = 0
+        for instance in instances:
+            stored_entries = self.entries[instance.__class__.__name__]
+            if instance.id not in stored_entries:  # type: ignore[attr-defined]
+                stored_entries[instance.id] = instance  # type: ignore[attr-defined]
+                inserted += 1
+        return inserted
+
+
+def dumped_cards() -> list[dict]:
+    return [
+        {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "id": f"card-{index}", "multiverseid": str(1000 + index)}
+        for index in range(DUMPED_CARDS)
+    ]
+
+
+def write_dump(dump_path: Path, layout: str) -> Path:
+    cards = dumped_cards()
+    if layout == "array":
+        contents = json.dumps(cards, indent=2)
+    elif layout == "page":
+        contents = json.dumps({"cards": cards})
+    else:
+        contents = "\n".join(json.dumps(card) for card in cards) + "\n"
+    if dump_path.suffix == ".gz":
+        dump_path.write_bytes(gzip.compress(contents.encode()))
+    else:
+        dump_path.write_text(contents)
+    return dump_path
+
+
+@pytest.mark.offline
+@pytest.mark.parametrize("layout", ["array", "page", "lines"])
+@pytest.mark.parametrize("file_name", ["cards.json", "cards.json.gz"])
+def test_dump_layouts_are_streamed(tmp_path: Path, layout: str, file_name: str) -> None:
+    dump_path = write_dump(tmp_path / file_name, layout)
+
+    # A chunk far smaller than a record forces records to span several reads
+    records = list(iter_json_records(dump_path, chunk_size=64))
+
+    assert records == dumped_cards()
+
+
+@pytest.mark.offline
+def test_truncated_dump_is_rejected(tmp_path: Path) -> None:
+    dump_path = tmp_path / "cards.json"
+    dump_path.write_text(json.dumps(dumped_cards())[:-20])
+
+    with pytest.raises(ValueError):
+        list(iter_json_records(dump_path, chunk_size=64))
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_dump_is_imported_in_batches(tmp_path: Path) -> None:
+    dump_path = tmp_path / "cards.json"
+    malformed_card = {"id": "malformed", "multiverseid": "1"}
+    cards = [*dumped_cards(), malformed_card]
+    dump_path.write_text(json.dumps(cards))
+    database = InsertOnlyDatabase()
+    database.entries[MTGCard.__name__] = {"card-0": MTGCard.model_construct(id="card-0")}
+    reported_batches: list[int] = []
+
+    def on_batch(statistics: BulkImportStatistics) -> None:
+        reported_batches.append(statistics.inserted_cards)
+
+    statistics = await import_card_dump(dump_path, database, batch_size=3, on_batch=on_batch)  # type: ignore[arg-type]
+
+    assert statistics.records == DUMPED_CARDS + 1
+    assert statistics.skipped_records == 1
+    assert statistics.inserted_cards == DUMPED_CARDS - 1, "An already cached card was overwritten."
+    assert reported_batches == [2, 5, 6]
+    assert set(database.entries[MTGCard.__name__]) == {f"card-{index}" for index in range(DUMPED_CARDS)}
+    validators = database.entries[CardValidators.__name__]
+    assert len(validators) == DUMPED_CARDS
+    assert all(validator.refreshed_at == dump_path.stat().st_mtime for validator in validators.values())  # type: ignore[attr-defined]
@@ -0,0 +1,145 @@
+import asyncio
+import dataclasses
+from collections.abc import Sequence
+
+import pytest
+from pydantic import BaseModel
+
+from mtgapi.config.settings.base import ServiceConfigurationPrefixes
+from mtgapi.domain.card import CardValidators, MTGCard
+from mtgapi.services.cache import CacheWriteBehindService, cache_card_data, cache_card_printings
+from tests.common.helpers import TemporaryEnvContext
+from tests.common.samples import LIGHTNING_BOLT_MTG_CARD_DATA
+
+
+@dataclasses.dataclass
+class RecordingDatabase:
+    """Stores written entries per model and primary key and records the size of every write."""
+
+    entries: dict[str, dict[str, BaseModel]] = dataclasses.field(default_factory=dict)
+    writes: list[tuple[str, int]] = dataclasses.field(default_factory=list)
+    gate: asyncio.Event = dataclasses.field(default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self.gate.set()
+
+    async def insert_many(self, instances: Sequence[BaseModel], batch_size: int = 1000) -> int:
+        await self.gate.wait()
+        self.writes.append(("insert", len(instances)))
+        for instance in instances:
+            self.entries.setdefault(instance.__class__.__name__, {}).setdefault(instance.id, instance)  # type: ignore[attr-defined]
+        return len(instances)
+
+    async def upsert_many(self, instances: Sequence[BaseModel], batch_size: int | None = None) -> int:
+        await self.gate.wait()
+        self.writes.append(("upsert", len(instances)))
+        for instance in instances:
+            self.entries.setdefault(instance.__class__.__name__, {})[instance.id] = instance  # type: ignore[attr-defined]
+        return len(instances)
+
+
+def _cache_writes(
+    database: RecordingDatabase, max_pending: int = 100, max_batch_size: int = 50, flush_interval: float = 0.01
+) -> CacheWriteBehindService:
+    with TemporaryEnvContext(
+        **{
+            f"{ServiceConfigurationPrefixes.CACHE_WRITES}_MAX_PENDING": str(max_pending),
+            f"{ServiceConfigurationPrefixes.CACHE_WRITES}_MAX_BATCH_SIZE": str(max_batch_size),
+            f"{ServiceConfigurationPrefixes.CACHE_WRITES}_FLUSH_INTERVAL": str(flush_interval),
+        }
+    ):
+        cache_writes = CacheWriteBehindService()
+    cache_writes.start(database=database)  # type: ignore[arg-type]
+    return cache_writes
+
+
+def _cards(count: int) -> list[MTGCard]:
+    card = MTGCard(**LIGHTNING_BOLT_MTG_CARD_DATA)  # type: ignore
+    return [card.model_copy(update={"id": f"card-{index}"}) for index in range(count)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_cache_writes_are_acknowledged_before_they_are_written_in_one_batch() -> None:
+    database = RecordingDatabase()
+    cache_writes = _cache_writes(database, flush_interval=0.05)
+
+    for card in _cards(10):
+        await cache_card_data(card, cache_writes=cache_writes)
+    assert database.writes == [], "Expected writes to be acknowledged before they reach the database."
+    assert cache_writes.pending == 10
+
+    await asyncio.sleep(0.1)
+    assert database.writes == [("upsert", 10)]
+    assert cache_writes.pending == 0
+    await cache_writes.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_full_batches_are_written_without_waiting_and_the_rest_on_stop() -> None:
+    database = RecordingDatabase()
+    cache_writes = _cache_writes(database, max_batch_size=5, flush_interval=60.0)
+
+    for card in _cards(12):
+        await cache_card_data(card, cache_writes=cache_writes)
+    await asyncio.sleep(0.01)
+    assert database.writes == [("upsert", 5), ("upsert", 5)]
+
+    await cache_writes.stop()
+    assert database.writes == [("upsert", 5), ("upsert", 5), ("upsert", 2)]
+    assert cache_writes.statistics.written == 12
+
+    await cache_card_data(_cards(13)[-1], cache_writes=cache_writes)
+    assert database.writes[-1] == ("upsert", 1), "Expected writes after stop to go straight to the database."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_writers_wait_while_the_queue_is_full() -> None:
+    database = RecordingDatabase()
+    database.gate.clear()
+    cache_writes = _cache_writes(database, max_pending=3, max_batch_size=2, flush_interval=0.0)
+
+    writers = asyncio.gather(*(cache_card_data(card, cache_writes=cache_writes) for card in _cards(8)))
+    await asyncio.sleep(0.01)
+    assert not writers.done(), "Expected writers to wait for a database that does not keep up."
+    assert cache_writes.pending <= 3
+    assert cache_writes.statistics.backpressure_waits > 0
+
+    database.gate.set()
+    await writers
+    await cache_writes.stop()
+    assert len(database.entries["MTGCard"]) == 8
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_queued_printings_do_not_overwrite_refetched_cards() -> None:
+    database = RecordingDatabase()
+    cache_writes = _cache_writes(database, flush_interval=60.0)
+    refetched_card, other_printing = _cards(2)
+    refetched_card = refetched_card.model_copy(update={"flavor": "Refetched"})
+
+    await cache_card_data(refetched_card, cache_writes=cache_writes)
+    await cache_card_printings(
+        [refetched_card.model_copy(update={"flavor": "Listed"}), other_printing], cache_writes=cache_writes
+    )
+    await cache_writes.stop()
+
+    assert database.writes == [("insert", 4), ("upsert", 1)]
+    assert database.entries["MTGCard"]["card-0"].flavor == "Refetched"  # type: ignore[attr-defined]
+    assert set(database.entries[CardValidators.__name__]) == {"card-0", "card-1"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_writes_go_straight_to_the_database_without_a_queue() -> None:
+    database = RecordingDatabase()
+    cache_writes = _cache_writes(database, max_pending=0)
+
+    await cache_card_data(_cards(1)[0], cache_writes=cache_writes)
+
+    assert database.writes == [("upsert", 1)]
+    assert cache_writes.statistics.queued == 0
+    await cache_writes.stop()
@@ -0,0 +1,84 @@
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+import mtgapi.entrypoint
+from mtgapi.domain.card import MTGCard
+from mtgapi.entrypoint import fetch_and_cache_card
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.providers import CardProviderChainService, MTGIOCardProvider
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+PRINTINGS = ["LEA", "M10", "A25"]
+
+
+def _printing_payload(set_code: str) -> dict[str, Any]:
+    return {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "id": f"bolt-{set_code}", "set": set_code, "printings": PRINTINGS}
+
+
+def _name_handler(sent_requests: list[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        cards = [
+            *(_printing_payload(set_code) for set_code in PRINTINGS),
+            {**_printing_payload("LEA"), "name": "Lightning Bolt Token", "id": "bolt-token"},
+            {**_printing_payload("2ED"), "manaCost": "invalid"},
+        ]
+        if "set" in request.url.params:
+            cards = [card for card in cards if card["set"] == request.url.params["set"]]
+        return httpx.Response(200, json={"cards": cards})
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_name_lookup_returns_every_printing(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    mtgio_service = mocked_mtgio_service_factory(_name_handler(sent_requests))
+
+    printings = await mtgio_service.get_card_printings("Lightning Bolt")
+
+    assert len(sent_requests) == 1
+    assert [printing.id for printing in printings] == [f"bolt-{set_code}" for set_code in PRINTINGS]
+    assert [MTGCard.from_mtgio_card(printing).set_name for printing in printings] == PRINTINGS
+    with pytest.raises(ValueError):
+        await mtgio_service.get_card_printings("Lightning Bolt", printing="10E")
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_every_printing_is_cached_in_one_write(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_writes: list[list[MTGCard]] = []
+
+    async def cache_card_printings(cards: list[MTGCard]) -> None:
+        cache_writes.append(cards)
+
+    async def cache_card_data(card: MTGCard) -> None:
+        cache_writes.append([card])
+
+    async def ignore_validators(_: object) -> None:
+        return None
+
+    monkeypatch.setattr(mtgapi.entrypoint, "cache_card_printings", cache_card_printings)
+    monkeypatch.setattr(mtgapi.entrypoint, "cache_card_data", cache_card_data)
+    monkeypatch.setattr(mtgapi.entrypoint, "cache_card_validators", ignore_validators)
+    card_providers = CardProviderChainService()
+    card_providers.register(MTGIOCardProvider(mtgio_service=mocked_mtgio_service_factory(_name_handler([]))))
+
+    mtg_card = await fetch_and_cache_card("Lightning Bolt", "M10", card_providers=card_providers)
+    assert mtg_card.set_name == "M10"
+    assert [card.id for card in cache_writes.pop()] == ["bolt-M10"]
+
+    mtg_card = await fetch_and_cache_card("Lightning Bolt", None, card_providers=card_providers)
+    assert mtg_card.id == "bolt-LEA"
+    assert len(cache_writes) == 2, "Expected the printings in one write and an overwrite of the requested one."
+    assert [card.set_name for card in cache_writes[0]] == PRINTINGS
+    assert cache_writes[1] == [mtg_card]
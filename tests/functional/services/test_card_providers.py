@@ -0,0 +1,147 @@
+import asyncio
+import dataclasses
+import pathlib
+from collections.abc import Callable
+from typing import ClassVar
+
+import httpx
+import pytest
+
+from mtgapi.common.exceptions import RateLimitExceededError, UpstreamUnavailableError
+from mtgapi.domain.card import MTGIOCard
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.providers import (
+    CardProvider,
+    CardProviderChainService,
+    LocalCatalogCardProvider,
+    MTGIOCardProvider,
+)
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+RECORDED_PAGE_PATH = pathlib.Path(__file__).parent.parent.parent / "assets" / "mtgio_cards_page.json"
+LIGHTNING_BOLT = MTGIOCard.from_api_payload(LIGHTNING_BOLT_MTGIO_API_PAYLOAD)
+
+
+@dataclasses.dataclass
+class FakeCardProvider(CardProvider):
+    """Answers every lookup with the same card after a delay, or fails with the given error."""
+
+    name: ClassVar[str] = "fake"
+
+    delay: float = 0.0
+    error: Exception | None = None
+    lookups: int = 0
+
+    async def get_card_printings(self, identifier: int | str, printing: str | None = None) -> list[MTGIOCard]:  # noqa: ARG002
+        self.lookups += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [LIGHTNING_BOLT]
+
+
+def _fake_provider(name: str, **attributes: float | Exception) -> FakeCardProvider:
+    provider_type = type(f"{name.capitalize()}CardProvider", (FakeCardProvider,), {"name": name})
+    return provider_type(**attributes)  # type: ignore[no-any-return]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_local_catalog_answers_before_falling_back_to_mtgio(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return httpx.Response(200, json={"cards": [{**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "name": "Shock"}]})
+
+    card_providers = CardProviderChainService()
+    card_providers.register(LocalCatalogCardProvider.from_dump(RECORDED_PAGE_PATH))
+    card_providers.register(MTGIOCardProvider(mtgio_service=mocked_mtgio_service_factory(handler)))
+
+    (shock, *_) = await card_providers.get_card_printings("Shock")
+    assert shock.names == ["Shock"]
+    assert len(sent_requests) == 1
+    assert card_providers.health[LocalCatalogCardProvider.name].misses == 1
+    assert card_providers.health[LocalCatalogCardProvider.name].failures == 0
+    assert card_providers.health[MTGIOCardProvider.name].hits == 1
+
+    (delver,) = await card_providers.get_card_printings("delver of secrets")
+    assert delver.set_code == "ISD"
+    (bears,) = await card_providers.get_card_printings(155, printing="LEA")
+    assert bears.names == ["Grizzly Bears"]
+    assert len(sent_requests) == 1, "Expected cards of the local catalog to be served without MTGIO."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_lookups_are_routed_to_the_fastest_healthy_provider() -> None:
+    slow_provider = _fake_provider("slow", delay=0.05)
+    fast_provider = _fake_provider("fast", delay=0.0)
+    card_providers = CardProviderChainService()
+    card_providers.register(slow_provider)
+    card_providers.register(fast_provider)
+
+    for _ in range(5):
+        await card_providers.get_card_printings("Lightning Bolt")
+
+    assert card_providers.providers_in_order() == [fast_provider, slow_provider]
+    assert slow_provider.lookups == 1
+    assert fast_provider.lookups == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_failing_providers_are_tried_last_and_ejected() -> None:
+    failing_provider = _fake_provider("failing", error=httpx.ConnectError("connection refused"))
+    healthy_provider = _fake_provider("healthy", delay=0.01)
+    card_providers = CardProviderChainService()
+    card_providers.register(failing_provider)
+    card_providers.register(healthy_provider)
+
+    for _ in range(3):
+        assert await card_providers.get_card_printings("Lightning Bolt") == [LIGHTNING_BOLT]
+    assert card_providers.providers_in_order() == [healthy_provider, failing_provider]
+    assert failing_provider.lookups == 1
+
+    lone_card_providers = CardProviderChainService()
+    lone_card_providers.register(failing_provider)
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await lone_card_providers.get_card_printings("Lightning Bolt")
+    assert lone_card_providers.health[failing_provider.name].ejected
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_local_rejections_do_not_count_against_provider_health() -> None:
+    throttled_provider = _fake_provider("throttled", error=RateLimitExceededError(retry_after=1.0))
+    card_providers = CardProviderChainService()
+    card_providers.register(throttled_provider)
+
+    for _ in range(5):
+        with pytest.raises(RateLimitExceededError):
+            await card_providers.get_card_printings("Lightning Bolt")
+
+    throttled_health = card_providers.health[throttled_provider.name]
+    assert throttled_health.rejections == 5  # noqa: PLR2004
+    assert throttled_health.failures == 0
+    assert throttled_health.error_rate == 0.0
+    assert not throttled_health.ejected, "Expected rejections of the local rate limiter not to eject the provider."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_errors_are_raised_when_no_provider_answers() -> None:
+    card_providers = CardProviderChainService()
+    card_providers.register(LocalCatalogCardProvider())
+    card_providers.register(_fake_provider("unavailable", error=UpstreamUnavailableError("Circuit open", 5.0)))
+
+    with pytest.raises(UpstreamUnavailableError):
+        await card_providers.get_card_printings("Lightning Bolt")
+
+    missing_card_providers = CardProviderChainService()
+    missing_card_providers.register(LocalCatalogCardProvider())
+    with pytest.raises(ValueError, match="not found by any card provider"):
+        await missing_card_providers.get_card_printings("Lightning Bolt")
@@ -0,0 +1,123 @@
+import dataclasses
+import types
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from mtgapi.common.exceptions import CatalogMirrorError
+from mtgapi.domain.card import CardValidators, MTGCard
+from mtgapi.domain.catalog import CatalogCheckpoint
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.catalog import MTGIO_CARDS_CATALOG, CatalogMirror, CatalogMirrorProgress
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+CATALOG_PAGES = 5
+CARDS_PER_PAGE = 3
+
+
+@dataclasses.dataclass
+class InMemoryDatabase:
+    """Stores upserted entries per model and primary key, failing when asked to write a given page."""
+
+    fail_on_page: int | None = None
+    entries: dict[str, dict[str, BaseModel]] = dataclasses.field(default_factory=dict)
+
+    async def register(self, model: type[BaseModel]) -> None:
+        self.entries.setdefault(model.__name__, {})
+
+    async def get_objects(self, object_type: type[BaseModel], filters: dict[str, Any]) -> Sequence[Any]:
+        stored_entry = self.entries[object_type.__name__].get(filters["id"])
+        return [types.SimpleNamespace(**stored_entry.model_dump())] if stored_entry else []
+
+    async def upsert_many(self, instances: Sequence[BaseModel], batch_size: int | None = None) -> int:
+        checkpoints = [instance for instance in instances if isinstance(instance, CatalogCheckpoint)]
+        if checkpoints and checkpoints[0].last_page == self.fail_on_page:
+            raise RuntimeError("Connection lost")
+        for instance in instances:
+            self.entries[instance.__class__.__name__][instance.id] = instance  # type: ignore[attr-defined]
+        return len(instances)
+
+
+def catalog_handler(sent_pages: list[int]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        sent_pages.append(page)
+        cards = [
+            {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "id": f"card-{page}-{index}", "multiverseid": str(page * 100 + index)}
+            for index in range(CARDS_PER_PAGE if page <= CATALOG_PAGES else 0)
+        ]
+        page_size = int(request.url.params["pageSize"])
+        return httpx.Response(200, json={"cards": cards}, headers={"Total-Count": str(CATALOG_PAGES * page_size)})
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_card_pages_are_walked_in_order(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_pages: list[int] = []
+    mtgio_service = mocked_mtgio_service_factory(catalog_handler(sent_pages))
+
+    walked_pages = [
+        catalog_page async for catalog_page in mtgio_service.iterate_card_pages(start_page=2, concurrency=3)
+    ]
+
+    assert [catalog_page.number for catalog_page in walked_pages] == list(range(2, CATALOG_PAGES + 1))
+    assert sorted(sent_pages) == list(range(2, CATALOG_PAGES + 1)), "Pages past the reported total were requested."
+    assert all(catalog_page.total_pages == CATALOG_PAGES for catalog_page in walked_pages)
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_catalog_is_mirrored_with_progress(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    database = InMemoryDatabase()
+    reported_progress: list[CatalogMirrorProgress] = []
+    catalog_mirror = CatalogMirror(
+        mtgio_service=mocked_mtgio_service_factory(catalog_handler([])),
+        database=database,  # type: ignore[arg-type]
+        queue_size=1,
+        report_interval=0,
+        on_progress=reported_progress.append,
+    )
+
+    progress = await catalog_mirror.run()
+
+    assert progress.cards == CATALOG_PAGES * CARDS_PER_PAGE
+    assert len(database.entries[MTGCard.__name__]) == CATALOG_PAGES * CARDS_PER_PAGE
+    assert database.entries[CardValidators.__name__].keys() == database.entries[MTGCard.__name__].keys()
+    assert reported_progress and progress.cards_per_second > 0
+    checkpoint = database.entries[CatalogCheckpoint.__name__][MTGIO_CARDS_CATALOG]
+    assert checkpoint.completed  # type: ignore[attr-defined]
+    assert checkpoint.last_page == CATALOG_PAGES  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_interrupted_mirror_resumes_after_last_written_page(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    database = InMemoryDatabase(fail_on_page=3)
+    with pytest.raises(CatalogMirrorError):
+        await CatalogMirror(
+            mtgio_service=mocked_mtgio_service_factory(catalog_handler([])),
+            database=database,  # type: ignore[arg-type]
+        ).run()
+    assert len(database.entries[MTGCard.__name__]) == 2 * CARDS_PER_PAGE
+
+    database.fail_on_page = None
+    sent_pages: list[int] = []
+    progress = await CatalogMirror(
+        mtgio_service=mocked_mtgio_service_factory(catalog_handler(sent_pages)),
+        database=database,  # type: ignore[arg-type]
+    ).run()
+
+    assert progress.first_page == 3
+    assert min(sent_pages) == 3, "Expected already written pages not to be fetched again."
+    assert len(database.entries[MTGCard.__name__]) == CATALOG_PAGES * CARDS_PER_PAGE
@@ -0,0 +1,115 @@
+import dataclasses
+import datetime
+import time
+import types
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from mtgapi.domain.card import MTGCard
+from mtgapi.domain.catalog import CatalogCheckpoint, CatalogSyncRun, CatalogSyncWatermark
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.catalog import MTGIO_CARDS_CATALOG, MTGIO_SETS_CATALOG, CatalogSync
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+PAGE_SIZE = 100
+CARDS_PER_SET = {"OLD": 3, "NEW": 150}
+RECENT_RELEASE_DATE = (datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=2)).date().isoformat()
+SETS_PAYLOAD = {
+    "sets": [
+        {"code": "OLD", "name": "Old Set", "releaseDate": "2001-01-01"},
+        {"code": "NEW", "name": "New Set", "releaseDate": RECENT_RELEASE_DATE},
+    ]
+}
+
+
+@dataclasses.dataclass
+class InMemoryDatabase:
+    """Stores upserted entries per model and primary key."""
+
+    entries: dict[str, dict[str, BaseModel]] = dataclasses.field(default_factory=dict)
+
+    async def register(self, model: type[BaseModel]) -> None:
+        self.entries.setdefault(model.__name__, {})
+
+    async def get_objects(self, object_type: type[BaseModel], filters: dict[str, Any]) -> Sequence[Any]:
+        stored_entry = self.entries.get(object_type.__name__, {}).get(filters["id"])
+        return [types.SimpleNamespace(**stored_entry.model_dump())] if stored_entry else []
+
+    async def upsert_many(self, instances: Sequence[BaseModel], batch_size: int | None = None) -> int:
+        for instance in instances:
+            self.entries[instance.__class__.__name__][instance.id] = instance  # type: ignore[attr-defined]
+        return len(instances)
+
+
+def catalog_handler(requested_sets: list[str]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/sets"):
+            return httpx.Response(200, json=SETS_PAYLOAD)
+        set_code = request.url.params["set"]
+        page = int(request.url.params["page"])
+        requested_sets.append(set_code)
+        set_cards = range(CARDS_PER_SET[set_code])[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+        cards = [
+            {**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "id": f"{set_code}-{index}", "printings": [set_code]}
+            for index in set_cards
+        ]
+        return httpx.Response(200, json={"cards": cards}, headers={"Total-Count": str(CARDS_PER_SET[set_code])})
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_only_new_and_recent_sets_are_synced(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    database = InMemoryDatabase()
+    await database.register(CatalogSyncWatermark)
+    database.entries[CatalogSyncWatermark.__name__][MTGIO_SETS_CATALOG] = CatalogSyncWatermark(
+        id=MTGIO_SETS_CATALOG, synced_sets=["OLD"]
+    )
+    requested_sets: list[str] = []
+    catalog_sync = CatalogSync(
+        mtgio_service=mocked_mtgio_service_factory(catalog_handler(requested_sets)),
+        database=database,  # type: ignore[arg-type]
+    )
+
+    sync_run = await catalog_sync.run()
+
+    assert set(requested_sets) == {"NEW"}
+    assert sync_run.upstream_calls == 3, "Expected one set list call and two pages of the new set."
+    assert sync_run.cards_written == CARDS_PER_SET["NEW"]
+    assert (sync_run.sets_synced, sync_run.sets_failed) == (1, 0)
+    assert len(database.entries[MTGCard.__name__]) == CARDS_PER_SET["NEW"]
+    assert database.entries[CatalogSyncRun.__name__][sync_run.id] == sync_run
+    watermark = database.entries[CatalogSyncWatermark.__name__][MTGIO_SETS_CATALOG]
+    assert watermark.synced_sets == ["NEW", "OLD"]  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_first_sync_after_mirror_skips_mirrored_sets_and_is_idempotent(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    database = InMemoryDatabase()
+    await database.register(CatalogCheckpoint)
+    database.entries[CatalogCheckpoint.__name__][MTGIO_CARDS_CATALOG] = CatalogCheckpoint(
+        id=MTGIO_CARDS_CATALOG, completed=True, updated_at=time.time() - 30 * 86400
+    )
+    requested_sets: list[str] = []
+    catalog_sync = CatalogSync(
+        mtgio_service=mocked_mtgio_service_factory(catalog_handler(requested_sets)),
+        database=database,  # type: ignore[arg-type]
+    )
+
+    await catalog_sync.run()
+    second_run = await catalog_sync.run()
+
+    assert set(requested_sets) == {"NEW"}, "Sets released before the mirror finished should not be fetched."
+    assert second_run.cards_written == CARDS_PER_SET["NEW"], "Recently released sets should be synced every run."
+    assert len(database.entries[MTGCard.__name__]) == CARDS_PER_SET["NEW"]
+    assert await catalog_sync.seconds_until_due(3600) > 3500
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from mtgapi.common.exceptions import CircuitOpenError
+from mtgapi.services.breaker import CircuitBreaker, CircuitState
+
+RECOVERY_TIMEOUT = 0.05
+
+
+def _state_of(breaker: CircuitBreaker) -> CircuitState:
+    """Read the state through a call, so mypy does not keep it narrowed between assertions."""
+    return breaker.state
+
+
+@pytest.mark.offline
+def test_circuit_opens_after_consecutive_failures_and_fails_fast() -> None:
+    observed_transitions: list[tuple[str, CircuitState, CircuitState]] = []
+    breaker = CircuitBreaker(
+        name="api.magicthegathering.io",
+        failure_threshold=3,
+        recovery_timeout=RECOVERY_TIMEOUT,
+        listeners=[lambda *transition: observed_transitions.append(transition)],
+    )
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    breaker.before_call()
+    breaker.record_success()
+    assert _state_of(breaker) == CircuitState.CLOSED, "A success should reset the consecutive failure counter."
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+    assert _state_of(breaker) == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as rejection:
+        breaker.before_call()
+    assert rejection.value.upstream == "api.magicthegathering.io"
+    assert breaker.rejected == 1
+    assert observed_transitions == [("api.magicthegathering.io", CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+@pytest.mark.offline
+def test_half_open_circuit_lets_single_probe_through() -> None:
+    breaker = CircuitBreaker(name="upstream", failure_threshold=1, recovery_timeout=RECOVERY_TIMEOUT)
+    breaker.before_call()
+    breaker.record_failure()
+    time.sleep(RECOVERY_TIMEOUT)
+
+    breaker.before_call()
+    assert _state_of(breaker) == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert _state_of(breaker) == CircuitState.OPEN, "A failed probe should reopen the circuit."
+
+    time.sleep(RECOVERY_TIMEOUT)
+    breaker.before_call()
+    breaker.record_success()
+    assert _state_of(breaker) == CircuitState.CLOSED
+    assert breaker.transitions == 5
+
+
+@pytest.mark.offline
+def test_disabled_breaker_never_opens() -> None:
+    breaker = CircuitBreaker(name="upstream", failure_threshold=0)
+    for _ in range(100):
+        breaker.before_call()
+        breaker.record_failure()
+    assert _state_of(breaker) == CircuitState.CLOSED
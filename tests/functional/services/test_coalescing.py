@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from mtgapi.services.coalescing import SingleFlight
+
+CONCURRENT_CALLERS = 25
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_concurrent_callers_share_single_flight() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    executions = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal executions
+        executions += 1
+        await release.wait()
+        return "Lightning Bolt"
+
+    callers = [
+        asyncio.create_task(single_flight.run(("lightning bolt", "LEA"), fetch)) for _ in range(CONCURRENT_CALLERS)
+    ]
+    await asyncio.sleep(0)
+    assert len(single_flight) == 1
+    release.set()
+
+    assert await asyncio.gather(*callers) == ["Lightning Bolt"] * CONCURRENT_CALLERS
+    assert executions == 1
+    assert len(single_flight) == 0
+    assert single_flight.statistics.flights == 1
+    assert single_flight.statistics.coalesced_callers == CONCURRENT_CALLERS - 1
+    assert single_flight.statistics.as_dict()["coalesced_callers_per_flight"] == {str(CONCURRENT_CALLERS - 1): 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_failures_are_shared_and_not_cached() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    executions = 0
+
+    async def failing_fetch() -> str:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("Card not found.")
+
+    results = await asyncio.gather(
+        *(single_flight.run("missing", failing_fetch) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert executions == 1
+
+    with pytest.raises(ValueError):
+        await single_flight.run("missing", failing_fetch)
+    assert executions == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_cancelled_caller_does_not_cancel_shared_work() -> None:
+    single_flight: SingleFlight[int] = SingleFlight()
+
+    async def slow_fetch() -> int:
+        await asyncio.sleep(0.02)
+        return 42
+
+    leader = asyncio.create_task(single_flight.run("key", slow_fetch))
+    follower = asyncio.create_task(single_flight.run("key", slow_fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 42
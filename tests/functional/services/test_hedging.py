@@ -0,0 +1,103 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.hedging import MINIMUM_LATENCY_SAMPLES, RequestHedger
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+SLOW_ATTEMPT_DELAY = 1.0
+HEDGE_DELAY = 0.02
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_slow_request_is_hedged_and_loser_cancelled(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    cancelled_requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        if len(sent_requests) == 1:
+            try:
+                await asyncio.sleep(SLOW_ATTEMPT_DELAY)
+            except asyncio.CancelledError:
+                cancelled_requests.append(request)
+                raise
+        return httpx.Response(200, json={"card": LIGHTNING_BOLT_MTGIO_API_PAYLOAD})
+
+    service = mocked_mtgio_service_factory(
+        handler, hedging="true", hedge_budget="1.0", hedge_initial_delay=str(HEDGE_DELAY)
+    )
+    card = await service.get_card(int(LIGHTNING_BOLT_MTGIO_API_PAYLOAD["multiverseid"]))
+    await asyncio.sleep(0)
+
+    assert card.id == LIGHTNING_BOLT_MTGIO_API_PAYLOAD["id"]
+    assert len(sent_requests) == 2, "Expected a second, identical request to be sent."
+    assert sent_requests[0].url == sent_requests[1].url
+    assert cancelled_requests == [sent_requests[0]], "Expected the slower attempt to be cancelled."
+    assert service.hedger is not None
+    assert service.hedger.statistics.hedges == 1
+    assert service.hedger.statistics.hedge_wins == 1
+    assert service.hedger.statistics.hedge_losses == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_hedges_are_capped_by_budget() -> None:
+    hedger = RequestHedger(budget=0.25, initial_delay=0.001)
+    attempts = 0
+
+    async def slow_attempt() -> int:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        return attempts
+
+    for _ in range(8):
+        await hedger.run(slow_attempt)
+
+    assert hedger.statistics.requests == 8
+    assert hedger.statistics.hedges == 2
+    assert hedger.statistics.budget_exhausted == 6
+    assert attempts == 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_failed_attempt_falls_back_to_the_other_one() -> None:
+    hedger = RequestHedger(budget=1.0, initial_delay=0.001)
+    attempts = 0
+
+    async def flaky_attempt() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("Connection reset")
+        await asyncio.sleep(0.05)
+        return "hedge"
+
+    assert await hedger.run(flaky_attempt) == "hedge"
+    assert hedger.statistics.hedge_wins == 1
+
+    async def failing_attempt() -> str:
+        raise httpx.ConnectError("Connection refused")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.run(failing_attempt)
+
+
+@pytest.mark.offline
+def test_delay_follows_latency_percentile() -> None:
+    hedger = RequestHedger(percentile=90.0, initial_delay=5.0)
+    for latency in range(1, MINIMUM_LATENCY_SAMPLES):
+        hedger.record_latency(latency / 100)
+    assert hedger.delay == 5.0, "Expected the initial delay until enough latencies are observed."
+
+    hedger.record_latency(MINIMUM_LATENCY_SAMPLES / 100)
+    assert hedger.delay == pytest.approx(0.18)
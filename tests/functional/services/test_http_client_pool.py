@@ -0,0 +1,50 @@
+import pytest
+
+from tests.common.helpers import TemporaryEnvContext
+from tests.common.services import TEST_HTTP_CONFIGURATION_PREFIX, TEST_HTTP_SERVICE_BASE_URL, PokeAPIClientService
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_http_service_reuses_single_pooled_client() -> None:
+    with TemporaryEnvContext(
+        **{
+            TEST_HTTP_CONFIGURATION_PREFIX + "_BASE_URL": TEST_HTTP_SERVICE_BASE_URL,
+            TEST_HTTP_CONFIGURATION_PREFIX + "_MAX_CONNECTIONS": "7",
+            TEST_HTTP_CONFIGURATION_PREFIX + "_MAX_KEEPALIVE_CONNECTIONS": "3",
+            TEST_HTTP_CONFIGURATION_PREFIX + "_KEEPALIVE_EXPIRY": "12.5",
+        }
+    ):
+        service = PokeAPIClientService()
+
+    first_client = await service._get_client()
+    second_client = await service._get_client()
+    assert first_client is second_client, "Expected the same pooled client to be reused between requests."
+
+    connection_pool = first_client._transport._pool  # type: ignore[attr-defined]
+    assert connection_pool._max_connections == 7
+    assert connection_pool._max_keepalive_connections == 3
+    assert connection_pool._keepalive_expiry == 12.5
+
+    await service.disconnect()
+    assert first_client.is_closed, "Expected the pooled client to be closed on disconnect."
+
+    with pytest.raises(RuntimeError):
+        await service._get_client()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+@pytest.mark.parametrize("http2_enabled", [False, True])
+async def test_http2_is_opt_in(http2_enabled: bool) -> None:
+    with TemporaryEnvContext(
+        **{
+            TEST_HTTP_CONFIGURATION_PREFIX + "_BASE_URL": TEST_HTTP_SERVICE_BASE_URL,
+            TEST_HTTP_CONFIGURATION_PREFIX + "_HTTP2": str(http2_enabled).lower(),
+        }
+    ):
+        service = PokeAPIClientService()
+
+    client = await service._get_client()
+    assert client._transport._pool._http2 is http2_enabled  # type: ignore[attr-defined]
+    await service.disconnect()
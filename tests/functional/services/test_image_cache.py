@@ -0,0 +1,253 @@
+import io
+import pathlib
+from collections.abc import AsyncGenerator, Callable
+
+import httpx
+import pytest
+from fastapi.responses import FileResponse
+from PIL import Image
+
+import mtgapi.entrypoint
+from mtgapi.config.settings.base import ServiceConfigurationPrefixes
+from mtgapi.domain.card import MTGCard, MTGIOCard
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.images import (
+    BLOBS_DIRECTORY,
+    TEMPORARY_DIRECTORY,
+    ImageCacheService,
+    ImageFormat,
+    ImageSize,
+    ImageVariant,
+    sniff_media_type,
+)
+from tests.common.helpers import TemporaryEnvContext
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+IMAGE_URL = "https://images.mtgio.test/bolt.jpg"
+IMAGE_BYTES = bytes(range(256)) * 512
+
+
+def _png_scan(width: int = 488, height: int = 680) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGBA", (width, height), (200, 30, 30, 255)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _card_with_image(image_url: str) -> MTGCard:
+    return MTGCard.from_mtgio_card(
+        MTGIOCard.from_api_payload({**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "imageUrl": image_url})
+    )
+
+
+def _image_cache(directory: pathlib.Path, max_bytes: int) -> ImageCacheService:
+    with TemporaryEnvContext(
+        **{
+            f"{ServiceConfigurationPrefixes.IMAGE_CACHE}_DIRECTORY": str(directory),
+            f"{ServiceConfigurationPrefixes.IMAGE_CACHE}_MAX_BYTES": str(max_bytes),
+        }
+    ):
+        return ImageCacheService()
+
+
+async def _chunks(content: bytes) -> AsyncGenerator[bytes, None]:
+    for offset in range(0, len(content), 256):
+        yield content[offset : offset + 256]
+
+
+def _stored_blobs(directory: pathlib.Path) -> list[pathlib.Path]:
+    return [path for path in (directory / BLOBS_DIRECTORY).rglob("*") if path.is_file()]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_images_are_stored_once_per_content_and_evicted_least_recently_used(tmp_path: pathlib.Path) -> None:
+    image_cache = _image_cache(tmp_path, max_bytes=2500)
+    first_image, second_image, third_image = (bytes([marker]) * 1000 for marker in range(3))
+
+    await image_cache.store("a", _chunks(first_image), media_type="image/jpeg")
+    await image_cache.store("b", _chunks(first_image), media_type="image/jpeg")
+    assert image_cache.stored_bytes == 1000
+    assert len(_stored_blobs(tmp_path)) == 1, "Expected identical images to share one stored file."
+
+    await image_cache.store("c", _chunks(second_image), media_type="image/jpeg")
+    assert await image_cache.get("a") is not None
+    await image_cache.store("d", _chunks(third_image), media_type="image/png")
+
+    assert await image_cache.get("b") is None
+    assert await image_cache.get("c") is None
+    assert image_cache.stored_bytes == 2000
+    assert image_cache.statistics.evictions == 2
+    assert image_cache.statistics.evicted_bytes == 1000
+    assert sorted(path.read_bytes() for path in _stored_blobs(tmp_path)) == [first_image, third_image]
+
+    stored_image = await image_cache.get("d")
+    assert stored_image is not None
+    assert stored_image.media_type == "image/png"
+    assert image_cache.path_of(stored_image).read_bytes() == third_image
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_stored_images_survive_restarts(tmp_path: pathlib.Path) -> None:
+    image_cache = _image_cache(tmp_path, max_bytes=10_000)
+    await image_cache.store("a", _chunks(IMAGE_BYTES[:1000]), media_type="image/jpeg")
+    await image_cache.store("b", _chunks(IMAGE_BYTES[1000:3000]), media_type="image/jpeg")
+    (tmp_path / TEMPORARY_DIRECTORY / "interrupted-write").write_bytes(b"partial")
+
+    restarted_image_cache = _image_cache(tmp_path, max_bytes=10_000)
+    assert len(restarted_image_cache) == 2
+    assert restarted_image_cache.stored_bytes == 3000
+    assert not list((tmp_path / TEMPORARY_DIRECTORY).iterdir()), "Expected leftovers of interrupted writes removed."
+
+    shrunk_image_cache = _image_cache(tmp_path, max_bytes=2000)
+    assert await shrunk_image_cache.get("a") is None
+    assert await shrunk_image_cache.get("b") is not None
+    assert len(_stored_blobs(tmp_path)) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_card_image_is_downloaded_once(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    upstream_requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal upstream_requests
+        assert str(request.url) == IMAGE_URL
+        upstream_requests += 1
+        return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=IMAGE_BYTES)
+
+    card = _card_with_image(IMAGE_URL)
+
+    async def get_card(*_: object) -> MTGCard:
+        return card
+
+    monkeypatch.setattr(mtgapi.entrypoint, "get_card", get_card)
+    service = mocked_mtgio_service_factory(handler)
+    image_cache = _image_cache(tmp_path, max_bytes=len(IMAGE_BYTES))
+
+    for _ in range(3):
+        response = await mtgapi.entrypoint.get_card_image(card.id, mtgio_service=service, image_cache=image_cache)
+        assert isinstance(response, FileResponse)
+        assert response.media_type == "image/jpeg"
+        assert "immutable" in response.headers["Cache-Control"]
+        assert pathlib.Path(response.path).read_bytes() == IMAGE_BYTES
+
+    assert upstream_requests == 1
+    assert image_cache.statistics.hits == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_card_image_with_missing_stored_body_is_served_from_upstream(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    upstream_requests = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal upstream_requests
+        upstream_requests += 1
+        return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=IMAGE_BYTES)
+
+    card = _card_with_image(IMAGE_URL)
+
+    async def get_card(*_: object) -> MTGCard:
+        return card
+
+    monkeypatch.setattr(mtgapi.entrypoint, "get_card", get_card)
+    service = mocked_mtgio_service_factory(handler)
+    service.stream_images = False
+    image_cache = _image_cache(tmp_path, max_bytes=len(IMAGE_BYTES))
+    await mtgapi.entrypoint.get_card_image(card.id, mtgio_service=service, image_cache=image_cache)
+    for stored_blob in _stored_blobs(tmp_path):
+        stored_blob.unlink()
+
+    response = await mtgapi.entrypoint.get_card_image(card.id, mtgio_service=service, image_cache=image_cache)
+    assert not isinstance(response, FileResponse), "Expected an evicted image not to be served from disk."
+    assert response.body == IMAGE_BYTES
+    assert await image_cache.get(card.id) is None, "Expected the entry of the missing image to be dropped."
+
+    response = await mtgapi.entrypoint.get_card_image(card.id, mtgio_service=service, image_cache=image_cache)
+    assert isinstance(response, FileResponse)
+    assert pathlib.Path(response.path).read_bytes() == IMAGE_BYTES
+    assert upstream_requests == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_image_variants_are_rendered_once_and_stored_next_to_originals(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    upstream_requests = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal upstream_requests
+        upstream_requests += 1
+        return httpx.Response(200, headers={"Content-Type": "application/octet-stream"}, content=_png_scan())
+
+    card = _card_with_image(IMAGE_URL)
+
+    async def get_card(*_: object) -> MTGCard:
+        return card
+
+    monkeypatch.setattr(mtgapi.entrypoint, "get_card", get_card)
+    service = mocked_mtgio_service_factory(handler)
+    image_cache = _image_cache(tmp_path, max_bytes=10 * 1024 * 1024)
+    thumbnail = ImageVariant(size=ImageSize.SMALL, image_format=ImageFormat.WEBP)
+    try:
+        for _ in range(2):
+            response = await mtgapi.entrypoint.get_card_image(
+                card.id, mtgio_service=service, image_cache=image_cache, variant=thumbnail
+            )
+            assert isinstance(response, FileResponse)
+            assert response.media_type == "image/webp"
+            with Image.open(response.path) as rendered_thumbnail:
+                assert rendered_thumbnail.format == "WEBP"
+                assert rendered_thumbnail.size == (ImageSize.SMALL.width, 203)
+
+        original_response = await mtgapi.entrypoint.get_card_image(
+            card.id, mtgio_service=service, image_cache=image_cache
+        )
+        assert isinstance(original_response, FileResponse)
+        assert original_response.media_type == "image/png", "Expected the content type detected from the image."
+    finally:
+        image_cache.close()
+
+    assert upstream_requests == 1
+    assert image_cache.statistics.renders == 1
+    assert len(image_cache) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_image_variants_are_rendered_without_the_cache(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    card = _card_with_image(IMAGE_URL)
+
+    async def get_card(*_: object) -> MTGCard:
+        return card
+
+    monkeypatch.setattr(mtgapi.entrypoint, "get_card", get_card)
+    service = mocked_mtgio_service_factory(lambda _: httpx.Response(200, content=_png_scan()))
+    image_cache = _image_cache(tmp_path, max_bytes=0)
+    try:
+        response = await mtgapi.entrypoint.get_card_image(
+            card.id, mtgio_service=service, image_cache=image_cache, variant=ImageVariant(image_format=ImageFormat.JPEG)
+        )
+    finally:
+        image_cache.close()
+
+    assert response.media_type == "image/jpeg"
+    assert sniff_media_type(response.body) == "image/jpeg"
+    with Image.open(io.BytesIO(response.body)) as converted_image:
+        assert converted_image.size == (488, 680), "Expected the size of the original to be kept."
@@ -0,0 +1,66 @@
+from collections.abc import AsyncGenerator, Callable
+
+import httpx
+import pytest
+
+from mtgapi.domain.card import MTGCard, MTGIOCard
+from mtgapi.entrypoint import IMAGE_CHUNK_SIZE, relay_upstream_image
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+IMAGE_URL = "https://images.mtgio.test/bolt.jpg"
+IMAGE_BYTES = bytes(range(256)) * 1024
+
+
+def _card_with_image(image_url: str) -> MTGCard:
+    return MTGCard.from_mtgio_card(
+        MTGIOCard.from_api_payload({**LIGHTNING_BOLT_MTGIO_API_PAYLOAD, "imageUrl": image_url})
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_card_image_is_relayed_in_chunks(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    body_chunks_sent = 0
+
+    async def image_chunks() -> AsyncGenerator[bytes, None]:
+        nonlocal body_chunks_sent
+        for offset in range(0, len(IMAGE_BYTES), IMAGE_CHUNK_SIZE):
+            body_chunks_sent += 1
+            yield IMAGE_BYTES[offset : offset + IMAGE_CHUNK_SIZE]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == IMAGE_URL
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "image/jpeg", "Content-Length": str(len(IMAGE_BYTES))},
+            content=image_chunks(),
+        )
+
+    service = mocked_mtgio_service_factory(handler)
+    upstream_image = await service.open_card_image_stream(_card_with_image(IMAGE_URL))
+    assert upstream_image is not None
+    assert body_chunks_sent == 0, "Expected the image body to be left unread until it is relayed."
+
+    relayed_response = relay_upstream_image(upstream_image)
+    assert relayed_response.media_type == "image/jpeg"
+    assert relayed_response.headers["Content-Length"] == str(len(IMAGE_BYTES))
+
+    relayed_chunks = [chunk async for chunk in relayed_response.body_iterator]
+    assert len(relayed_chunks) > 1
+    assert b"".join(relayed_chunks) == IMAGE_BYTES  # type: ignore[arg-type]
+    assert upstream_image.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_missing_image_is_not_streamed(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    service = mocked_mtgio_service_factory(handler)
+    assert await service.open_card_image_stream(_card_with_image(IMAGE_URL)) is None
@@ -0,0 +1,105 @@
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+import mtgapi.entrypoint
+from mtgapi.domain.card import CardValidators, MTGCard, MTGIOCard
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+CARD_ETAG = 'W/"lightning-bolt-v1"'
+CARD_LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def answer_conditionally(request: httpx.Request) -> httpx.Response:
+    if request.headers.get("If-None-Match") == CARD_ETAG:
+        return httpx.Response(304, headers={"ETag": CARD_ETAG})
+    return httpx.Response(
+        200,
+        json={"card": LIGHTNING_BOLT_MTGIO_API_PAYLOAD},
+        headers={"ETag": CARD_ETAG, "Last-Modified": CARD_LAST_MODIFIED},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_revalidation_without_validators_refetches_card(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    mtgio_service = mocked_mtgio_service_factory(answer_conditionally)
+    card_id = str(LIGHTNING_BOLT_MTGIO_API_PAYLOAD["id"])
+
+    refreshed_card, validators = await mtgio_service.revalidate_card(CardValidators(id=card_id))
+
+    assert refreshed_card is not None
+    assert refreshed_card.id == card_id
+    assert validators.etag == CARD_ETAG
+    assert validators.last_modified == CARD_LAST_MODIFIED
+    assert validators.is_fresh(60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_not_modified_answer_extends_freshness(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    mtgio_service = mocked_mtgio_service_factory(answer_conditionally)
+    stale_validators = CardValidators(
+        id=str(LIGHTNING_BOLT_MTGIO_API_PAYLOAD["id"]), etag=CARD_ETAG, last_modified=CARD_LAST_MODIFIED
+    )
+    assert not stale_validators.is_fresh(60)
+    assert stale_validators.conditional_headers() == {
+        "If-None-Match": CARD_ETAG,
+        "If-Modified-Since": CARD_LAST_MODIFIED,
+    }
+
+    refreshed_card, validators = await mtgio_service.revalidate_card(stale_validators)
+
+    assert refreshed_card is None
+    assert validators.etag == CARD_ETAG
+    assert validators.is_fresh(60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_cache_hit_reads_card_and_validators_in_one_lookup(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return answer_conditionally(request)
+
+    cached_card = MTGCard.from_mtgio_card(MTGIOCard.from_api_payload(LIGHTNING_BOLT_MTGIO_API_PAYLOAD))
+    cached_validators = CardValidators(id=cached_card.id, etag=CARD_ETAG, refreshed_at=time.time())
+    cache_lookups: list[str] = []
+    written_validators: list[CardValidators] = []
+
+    async def retrieve_card_with_validators_from_cache(
+        identifier: str, printing: str | None = None
+    ) -> tuple[MTGCard, CardValidators | None]:
+        cache_lookups.append(identifier)
+        return cached_card, cached_validators
+
+    async def cache_card_validators(validators: CardValidators) -> None:
+        written_validators.append(validators)
+
+    monkeypatch.setattr(
+        mtgapi.entrypoint, "retrieve_card_with_validators_from_cache", retrieve_card_with_validators_from_cache
+    )
+    monkeypatch.setattr(mtgapi.entrypoint, "cache_card_validators", cache_card_validators)
+    mtgio_service = mocked_mtgio_service_factory(handler, refresh_after="60")
+
+    assert await mtgapi.entrypoint.get_card(cached_card.id, mtgio_service=mtgio_service) == cached_card
+    assert cache_lookups == [cached_card.id], "Expected a fresh hit to need a single cache lookup."
+    assert not sent_requests
+
+    cached_validators = cached_validators.model_copy(update={"refreshed_at": 0.0})
+    assert await mtgapi.entrypoint.get_card(cached_card.id, mtgio_service=mtgio_service) == cached_card
+    assert len(cache_lookups) == 2  # noqa: PLR2004
+    assert sent_requests[0].headers["If-None-Match"] == CARD_ETAG, "Expected the validators read with the card."
+    assert written_validators[0].is_fresh(60)
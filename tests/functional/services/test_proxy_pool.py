@@ -0,0 +1,111 @@
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from mtgapi.config.settings.base import ServiceConfigurationPrefixes
+from mtgapi.services.proxy import Proxy, RotatingProxyPoolService
+from tests.common.helpers import TemporaryEnvContext
+from tests.common.services import TEST_HTTP_CONFIGURATION_PREFIX, TEST_HTTP_SERVICE_BASE_URL, PokeAPIClientService
+
+PROXY_URLS = ["http://proxy-1.test:3128", "http://proxy-2.test:3128", "http://proxy-3.test:3128"]
+EJECTION_DURATION = 0.05
+
+
+def _build_proxy_pool(**settings: str) -> RotatingProxyPoolService:
+    with TemporaryEnvContext(
+        **{
+            f"{ServiceConfigurationPrefixes.PROXY}_URLS": ",".join(PROXY_URLS),
+            f"{ServiceConfigurationPrefixes.PROXY}_EJECTION_DURATION": str(EJECTION_DURATION),
+            **{
+                f"{ServiceConfigurationPrefixes.PROXY}_{setting_name.upper()}": setting_value
+                for setting_name, setting_value in settings.items()
+            },
+        }
+    ):
+        return RotatingProxyPoolService()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_empty_pool_connects_directly() -> None:
+    with TemporaryEnvContext(**{f"{ServiceConfigurationPrefixes.PROXY}_URLS": ""}):
+        proxy_pool = RotatingProxyPoolService()
+    assert await proxy_pool.get_proxy() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_traffic_is_spread_and_prefers_healthy_proxies() -> None:
+    proxy_pool = _build_proxy_pool()
+    slow_proxy, fast_proxy, average_proxy = proxy_pool.proxies
+    for _ in range(10):
+        proxy_pool.record_outcome(slow_proxy, latency=2.0, failed=False)
+        proxy_pool.record_outcome(fast_proxy, latency=0.1, failed=False)
+        proxy_pool.record_outcome(average_proxy, latency=0.5, failed=False)
+
+    routed_requests = Counter([await proxy_pool.get_proxy() for _ in range(3000)])
+    assert routed_requests[fast_proxy] > routed_requests[average_proxy] > routed_requests[slow_proxy]
+    assert routed_requests[slow_proxy] == 0, "The slowest proxy always loses the two-proxy comparison."
+    assert routed_requests[average_proxy] > 0, "Expected traffic to be spread over more than one egress IP."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_failing_proxy_is_ejected_temporarily() -> None:
+    proxy_pool = _build_proxy_pool(consecutive_failures_to_eject="2")
+    failing_proxy = proxy_pool.proxies[0]
+    proxy_pool.record_outcome(failing_proxy, latency=0.1, failed=True)
+    proxy_pool.record_outcome(failing_proxy, latency=0.1, failed=True)
+
+    assert proxy_pool.health[failing_proxy].ejected
+    assert failing_proxy not in {await proxy_pool.get_proxy() for _ in range(100)}
+
+    time.sleep(EJECTION_DURATION)
+    assert not proxy_pool.health[failing_proxy].ejected
+    assert proxy_pool.as_dict()[str(failing_proxy)]["ejections"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_every_proxy_gets_its_own_persistent_client() -> None:
+    proxy_pool = _build_proxy_pool()
+    with TemporaryEnvContext(**{TEST_HTTP_CONFIGURATION_PREFIX + "_BASE_URL": TEST_HTTP_SERVICE_BASE_URL}):
+        service = PokeAPIClientService()
+    service._proxy_provider = proxy_pool
+
+    first_proxy, second_proxy = proxy_pool.proxies[:2]
+    first_client = await service._get_client(first_proxy)
+    assert await service._get_client(first_proxy) is first_client
+    assert await service._get_client(second_proxy) is not first_client
+
+    await service.disconnect()
+    assert first_client.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_requests_report_outcomes_to_the_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    proxy_pool = _build_proxy_pool()
+    with TemporaryEnvContext(
+        **{
+            TEST_HTTP_CONFIGURATION_PREFIX + "_BASE_URL": TEST_HTTP_SERVICE_BASE_URL,
+            TEST_HTTP_CONFIGURATION_PREFIX + "_RETRIES": "1",
+        }
+    ):
+        service = PokeAPIClientService()
+    service._proxy_provider = proxy_pool
+    status_codes = iter([200, 429])
+    mocked_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(next(status_codes))))
+
+    async def _get_mocked_client(_: Proxy | None = None) -> httpx.AsyncClient:
+        return mocked_client
+
+    monkeypatch.setattr(service, "_get_client", _get_mocked_client)
+    await service.get("pokemon/ditto")
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.get("pokemon/ditto")
+
+    assert sum(health.requests for health in proxy_pool.health.values()) == 2
+    assert sum(health.failures for health in proxy_pool.health.values()) == 1
@@ -0,0 +1,105 @@
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+from mtgapi.services.retrying import RetryBudget, is_retryable_error, parse_retry_after
+from tests.common.samples import LIGHTNING_BOLT_MTGIO_API_PAYLOAD
+
+RETRY_SETTINGS = {"retries": "3", "minimum_wait": "0", "maximum_wait": "1", "exponential_backoff": ""}
+
+
+def _status_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://mtgio.test/v1/cards/1")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("Upstream error", request=request, response=response)
+
+
+@pytest.mark.offline
+def test_only_transient_failures_are_retryable() -> None:
+    assert is_retryable_error(httpx.ConnectError("Connection refused"))
+    assert is_retryable_error(_status_error(429))
+    assert is_retryable_error(_status_error(503))
+    assert not is_retryable_error(_status_error(404))
+    assert not is_retryable_error(_status_error(400))
+    assert not is_retryable_error(ValueError("Malformed payload"))
+
+
+@pytest.mark.offline
+def test_retry_after_accepts_seconds_and_dates() -> None:
+    assert parse_retry_after(_status_error(503, {"Retry-After": "7"})) == 7
+    http_date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+    assert parse_retry_after(_status_error(503, {"Retry-After": http_date})) == pytest.approx(60, abs=2)
+    assert parse_retry_after(_status_error(503, {"Retry-After": "soon"})) is None
+    assert parse_retry_after(_status_error(503)) is None
+
+
+@pytest.mark.offline
+def test_budget_caps_retries_at_ratio_of_first_attempts() -> None:
+    budget = RetryBudget(ratio=0.1, reserve=2)
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend(), "Expected the reserve to be spent."
+
+    for _ in range(100):
+        budget.record_first_attempt()
+    granted_retries = sum(budget.try_spend() for _ in range(100))
+    assert granted_retries == 2, "Expected the balance to be capped at the reserve."
+    assert budget.statistics.exhausted == 99
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_unknown_card_is_not_retried(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return httpx.Response(404, json={"error": "Not Found"})
+
+    service = mocked_mtgio_service_factory(handler, **RETRY_SETTINGS)
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.get_card(1)
+    assert len(sent_requests) == 1, "A deterministic 404 should not be sent upstream again."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_unavailable_upstream_is_retried_after_announced_delay(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    request_times: list[float] = []
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        request_times.append(time.monotonic())
+        if len(request_times) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json={"card": LIGHTNING_BOLT_MTGIO_API_PAYLOAD})
+
+    service = mocked_mtgio_service_factory(handler, **RETRY_SETTINGS)
+    card = await service.get_card(int(LIGHTNING_BOLT_MTGIO_API_PAYLOAD["multiverseid"]))
+
+    assert card.id == LIGHTNING_BOLT_MTGIO_API_PAYLOAD["id"]
+    assert len(request_times) == 2
+    assert request_times[1] - request_times[0] >= 0.2 * 0.9
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_retry_after_beyond_maximum_wait_is_not_retried(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    service = mocked_mtgio_service_factory(handler, **RETRY_SETTINGS)
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.get_card(1)
+    assert len(sent_requests) == 1
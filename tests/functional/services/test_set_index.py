@@ -0,0 +1,106 @@
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+import mtgapi.entrypoint
+from mtgapi.domain.catalog import MTGSet
+from mtgapi.entrypoint import is_known_printing, load_set_index
+from mtgapi.services.apis.mtgio import MTGIOAPIService
+
+SETS_PAYLOAD: dict[str, Any] = {
+    "sets": [
+        {"code": "10E", "name": "Tenth Edition", "type": "core", "releaseDate": "2007-07-13", "block": "Core Set"},
+        {"code": "lea", "name": "Limited Edition Alpha", "type": "core", "releaseDate": "1993-08-05"},
+        {"name": "Set without code"},
+    ]
+}
+
+
+def _sets_handler(
+    sent_requests: list[httpx.Request], status_code: int = 200
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        assert request.url.path == "/v1/sets"
+        return httpx.Response(status_code, json=SETS_PAYLOAD if status_code == 200 else {"error": "unavailable"})
+
+    return handler
+
+
+@pytest.fixture
+def cached_sets(monkeypatch: pytest.MonkeyPatch) -> list[MTGSet]:
+    stored_sets: list[MTGSet] = []
+
+    async def retrieve_cached_sets() -> list[MTGSet]:
+        return list(stored_sets)
+
+    async def cache_sets(sets: list[MTGSet]) -> None:
+        stored_sets[:] = sets
+
+    monkeypatch.setattr(mtgapi.entrypoint, "retrieve_cached_sets", retrieve_cached_sets)
+    monkeypatch.setattr(mtgapi.entrypoint, "cache_sets", cache_sets)
+    return stored_sets
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_sets_are_fetched_once_while_fresh(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    mtgio_service = mocked_mtgio_service_factory(_sets_handler(sent_requests))
+
+    fetched_sets = await mtgio_service.get_sets()
+    await mtgio_service.get_sets()
+
+    assert len(sent_requests) == 1
+    assert [mtg_set.id for mtg_set in fetched_sets] == ["10E", "LEA"]
+    assert fetched_sets[0].release_date == "2007-07-13"
+    assert sorted(mtgio_service.set_index) == ["10E", "LEA"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_unknown_printing_is_rejected_without_upstream_call(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    cached_sets: list[MTGSet],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    cached_sets.append(MTGSet(id="10E", name="Tenth Edition", refreshed_at=float("inf")))
+    mtgio_service = mocked_mtgio_service_factory(_sets_handler(sent_requests))
+
+    assert await is_known_printing(mtgio_service, "10E")
+    assert not await is_known_printing(mtgio_service, "10F")
+    assert not sent_requests, "Expected the set index to be loaded from the cache."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_stale_set_index_is_refreshed_and_cached(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    cached_sets: list[MTGSet],
+) -> None:
+    sent_requests: list[httpx.Request] = []
+    cached_sets.append(MTGSet(id="10E", name="Tenth Edition"))
+    mtgio_service = mocked_mtgio_service_factory(_sets_handler(sent_requests))
+
+    set_index = await load_set_index(mtgio_service)
+
+    assert len(sent_requests) == 1
+    assert sorted(set_index) == ["10E", "LEA"]
+    assert sorted(mtg_set.id for mtg_set in cached_sets) == ["10E", "LEA"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_stale_set_index_is_served_when_upstream_fails(
+    mocked_mtgio_service_factory: Callable[..., MTGIOAPIService],
+    cached_sets: list[MTGSet],
+) -> None:
+    cached_sets.append(MTGSet(id="10E", name="Tenth Edition"))
+    mtgio_service = mocked_mtgio_service_factory(_sets_handler([], status_code=404))
+
+    assert await is_known_printing(mtgio_service, "10E")
+    assert not await is_known_printing(mtgio_service, "LEA")
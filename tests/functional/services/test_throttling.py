@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import pytest
+
+from mtgapi.common.exceptions import RateLimitExceededError
+from mtgapi.services.throttling import MINIMUM_RATE_FACTOR, AdaptiveRateLimiter
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_disabled_limiter_never_waits() -> None:
+    limiter = AdaptiveRateLimiter(rate=0)
+    await asyncio.gather(*(limiter.acquire() for _ in range(100)))
+    assert limiter.statistics.granted == 0
+    assert limiter.statistics.delayed == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_burst_above_rate_is_queued() -> None:
+    limiter = AdaptiveRateLimiter(rate=50, burst=5)
+    started_at = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(10)))
+    elapsed = time.monotonic() - started_at
+
+    assert limiter.statistics.granted == 10
+    assert limiter.statistics.delayed == 5
+    assert elapsed >= 5 / 50 * 0.9, "Expected the requests above the burst to be spread over time."
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_requests_exceeding_maximum_wait_are_rejected() -> None:
+    limiter = AdaptiveRateLimiter(rate=1, burst=1, max_wait=0.5)
+    await limiter.acquire()
+
+    with pytest.raises(RateLimitExceededError) as rejection:
+        await limiter.acquire()
+    assert rejection.value.retry_after > 0.5
+    assert limiter.statistics.rejected == 1
+
+
+@pytest.mark.offline
+def test_limiter_slows_down_as_remaining_quota_drops() -> None:
+    limiter = AdaptiveRateLimiter(rate=10, slowdown_threshold=100)
+
+    limiter.observe(None)
+    assert limiter.effective_rate == 10
+
+    limiter.observe(500)
+    assert limiter.effective_rate == 10
+
+    limiter.observe(50)
+    assert limiter.effective_rate == pytest.approx(5)
+
+    limiter.observe(0)
+    assert limiter.effective_rate == pytest.approx(10 * MINIMUM_RATE_FACTOR)
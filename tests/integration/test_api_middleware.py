@@ -31,7 +31,7 @@ async def test_getting_existing_cache_entry() -> None:
         instance_to_insert = MTGCard(**LIGHTNING_BOLT_MTG_CARD_DATA)  # type: ignore
 
         logging.info(f"[TEST] Inserting instance into database: {instance_to_insert}")
-        await postgres_service.insert(instance_to_insert)
+        assert await postgres_service.upsert(instance_to_insert)
 
         cached_entry = await retrieve_card_data_from_cache(target_card_id)  # type: ignore
         assert cached_entry != MTGCard.null()
@@ -1,7 +1,16 @@
+import asyncio
+import time
+
 import pytest
+import sqlalchemy
 
+import mtgapi.services.database
+from mtgapi.config.settings.base import ServiceConfigurationPrefixes
+from mtgapi.domain.card import MTGCard
+from mtgapi.services.cache import CACHED_MODELS
 from mtgapi.services.database import PostgresDatabaseService
-from tests.common.helpers import use_postgres_container
+from tests.common.helpers import TemporaryEnvContext, use_postgres_container
+from tests.common.samples import LIGHTNING_BOLT_MTG_CARD_DATA
 
 
 @pytest.mark.asyncio
@@ -17,3 +26,104 @@ async def test_postgres_service_initialization() -> None:
         result = await postgres_service.query("SELECT 1")
         assert result == [(1,)], "Expected result from the query to be [(1,)]"
         await postgres_service.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_concurrent_queries_run_on_pooled_connections() -> None:
+    concurrent_queries = 4
+    query_duration = 0.5
+    with (
+        use_postgres_container(),
+        TemporaryEnvContext(**{f"{ServiceConfigurationPrefixes.DATABASE}_POOL_SIZE": str(concurrent_queries)}),
+    ):
+        postgres_service = PostgresDatabaseService()
+
+        started_at = time.monotonic()
+        results = await asyncio.gather(
+            *(postgres_service.query(f"SELECT pg_sleep({query_duration})") for _ in range(concurrent_queries))
+        )
+        elapsed = time.monotonic() - started_at
+
+        assert len(results) == concurrent_queries
+        assert elapsed < query_duration * 2, "Expected concurrent queries not to wait for each other."
+        await postgres_service.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_registered_models_are_not_converted_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    with use_postgres_container():
+        postgres_service = PostgresDatabaseService()
+        await postgres_service.register_models(CACHED_MODELS)
+
+        def fail_conversion(*_: object) -> None:
+            raise AssertionError("Expected registered models to be resolved without converting them.")
+
+        monkeypatch.setattr(mtgapi.services.database, "convert_pydantic_model_to_sqlalchemy_base", fail_conversion)
+        for _ in range(3):
+            assert await postgres_service.get_objects(MTGCard, filters={"name": "Lightning Bolt"}) == []
+        await postgres_service.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_hinted_indexes_are_added_to_existing_tables() -> None:
+    with use_postgres_container():
+        postgres_service = PostgresDatabaseService()
+        assert postgres_service.client is not None
+        async with postgres_service.client.begin() as connection:
+            await connection.execute(
+                sqlalchemy.text(
+                    "CREATE TABLE mtgcard (id VARCHAR PRIMARY KEY, multiverse_id VARCHAR, name VARCHAR, set_name VARCHAR)"
+                )
+            )
+        await postgres_service.register(MTGCard)
+
+        indexes = await postgres_service.query("SELECT indexname FROM pg_indexes WHERE tablename = 'mtgcard'")
+        assert {"ix_mtgcard_multiverse_id", "ix_mtgcard_name_set_name"} <= {index for (index,) in indexes}
+        await postgres_service.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_concurrent_upserts_of_the_same_card_do_not_conflict() -> None:
+    with use_postgres_container():
+        postgres_service = PostgresDatabaseService()
+        card = MTGCard(**LIGHTNING_BOLT_MTG_CARD_DATA)  # type: ignore
+        await postgres_service.register(MTGCard)
+
+        results = await asyncio.gather(*(postgres_service.upsert(card) for _ in range(8)))
+        assert all(results), "Expected every concurrent write of the same card to succeed."
+
+        printings = [card.model_copy(update={"id": f"printing-{index}", "set_name": "2ED"}) for index in range(5)]
+        renamed_printing = printings[0].model_copy(update={"flavor": "Rewritten"})
+        upserted_rows = await postgres_service.upsert_many([*printings, renamed_printing], batch_size=2)
+        assert upserted_rows == len(printings), "Expected duplicate keys to be written once."
+
+        stored_printing = await postgres_service.get_objects(MTGCard, filters={"id": "printing-0"})
+        assert stored_printing[0].flavor == "Rewritten"
+        await postgres_service.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.offline
+async def test_concurrent_first_uses_of_a_model_register_it_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    with use_postgres_container():
+        postgres_service = PostgresDatabaseService()
+        created_tables = 0
+        ensure_table = postgres_service.ensure_table
+
+        async def counting_ensure_table(*args: object, **kwargs: object) -> None:
+            nonlocal created_tables
+            created_tables += 1
+            await ensure_table(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(postgres_service, "ensure_table", counting_ensure_table)
+        results = await asyncio.gather(
+            *(postgres_service.get_objects(MTGCard, filters={"name": "Lightning Bolt"}) for _ in range(8))
+        )
+
+        assert results == [[]] * 8
+        assert created_tables == 1, "Expected concurrent first uses to create the table once."
+        await postgres_service.disconnect()